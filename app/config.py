@@ -25,6 +25,22 @@ class Settings(BaseSettings):
     # Cloud Run 전용(유닉스 소켓). 선택값이어야 함.
     INSTANCE_CONNECTION_NAME: str | None = None
 
+    # ===== DB 커넥션 풀 (app/utils/db_pool.py) =====
+    DB_POOL_SIZE: int = 5               # 인스턴스당 상시 커넥션 수
+    DB_MAX_OVERFLOW: int = 10           # 몰릴 때 추가로 여는 수 (반납 시 닫힘)
+    DB_POOL_TIMEOUT: float = 30         # 풀이 꽉 찼을 때 checkout 대기 한도(초)
+    DB_POOL_RECYCLE: int = 3600         # 이보다 오래된 커넥션은 새로 연결(초)
+    DB_POOL_LIFO: bool = True           # 최근 쓴 커넥션부터 재사용 → 남는 커넥션은 idle 로 정리됨
+    DB_POOL_PRE_PING: str = "idle"      # always / idle / off
+    DB_POOL_PRE_PING_IDLE: float = 300  # idle 모드: 이 시간(초) 이상 놀던 커넥션만 ping
+    DB_POOL_WARMUP: int = 2             # 앱 시작 시 미리 열어 둘 커넥션 수 (0이면 워밍업 안 함)
+
+    # ===== Read replica (app/utils/db_routing.py) =====
+    DB_REPLICA_URLS: str | None = None       # 콤마 구분 SQLAlchemy URL. 비우면 전부 primary
+    DB_REPLICA_PIN_SECONDS: float = 5        # 쓰기 후 이 시간 동안 그 사용자 조회는 primary (read-your-writes)
+    DB_REPLICA_HEALTH_INTERVAL: float = 10   # 헬스 체크 주기(초)
+    DB_REPLICA_MAX_LAG: float = 30           # 복제 지연이 이보다 크면 제외 (MySQL, 권한 있을 때만)
+
     # pydantic-settings v2 스타일 설정
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -1,7 +1,18 @@
 # app/crawl.py
-# 실행: python -m app.crawl
+# 실행: python -m app.crawl [--contexts 2] [--pages-per-context 2] [--host-interval 1.0] [--recheck-minutes 30]
+import argparse
+import datetime as dt
 
 from app.services.instagram.get_post import get_posts_from_all_accounts
 
 if __name__ == "__main__":
-    get_posts_from_all_accounts()
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--contexts", type=int, default=None, help="브라우저 컨텍스트 수 (기본 CRAWL_CONTEXTS)")
+    ap.add_argument("--pages-per-context", type=int, default=None, help="컨텍스트당 페이지 수 (기본 CRAWL_PAGES_PER_CONTEXT)")
+    ap.add_argument("--host-interval", type=float, default=None, help="같은 호스트 요청 간격(초)")
+    ap.add_argument("--recheck-minutes", type=float, default=None, help="이 시간 안에 확인한 계정은 건너뜀")
+    args = ap.parse_args()
+    get_posts_from_all_accounts(
+        contexts=args.contexts, pages_per_context=args.pages_per_context, host_interval=args.host_interval,
+        recheck_after=dt.timedelta(minutes=args.recheck_minutes) if args.recheck_minutes else None,
+    )
@@ -1,7 +1,28 @@
+from typing import Optional
+from sqlalchemy import case
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
+from app.models.performance import Performance
+from app.models.review import Review
+from app.models.review_like import ReviewLike
 from app.models.user_favorite_performance import UserFavoritePerformance
 from app.models.user_favorite_artist import UserFavoriteArtist
 
+
+def _bump_like_count(db: Session, model, target_filter, delta: int):
+    """like_count 증감 (UPDATE ... SET like_count = like_count ± 1 → 동시 요청에도 안전, 커밋은 호출 측)
+    공연 찜 추가는 trending_score 에도 +1 (다음 배치에서 감쇠 점수로 다시 계산됨)"""
+    if delta > 0:
+        values = {model.like_count: model.like_count + delta}
+        if model is Performance:
+            values[Performance.trending_score] = Performance.trending_score + delta
+    else:
+        values = {model.like_count: case((model.like_count + delta > 0, model.like_count + delta), else_=0)}
+    if model is Performance:
+        values[Performance.updated_at] = Performance.updated_at   # 찜은 공연 수정이 아님 (onupdate 방지)
+    db.query(model).filter(target_filter).update(values, synchronize_session=False)
+
+
 def create_like(db: Session, user_id: int, type: str, ref_id: int):
     if type == "performance":
         exists = db.query(UserFavoritePerformance).filter_by(user_id=user_id, performance_id=ref_id).first()
@@ -9,6 +30,7 @@ def create_like(db: Session, user_id: int, type: str, ref_id: int):
             return None
         like = UserFavoritePerformance(user_id=user_id, performance_id=ref_id)
         db.add(like)
+        _bump_like_count(db, Performance, Performance.id == ref_id, +1)
 
     elif type == "artist":
         exists = db.query(UserFavoriteArtist).filter_by(user_id=user_id, artist_id=ref_id).first()
@@ -35,5 +57,43 @@ def delete_like(db: Session, user_id: int, type: str, ref_id: int):
         return None
 
     db.delete(like)
+    if type == "performance":
+        _bump_like_count(db, Performance, Performance.id == ref_id, -1)
     db.commit()
     return True
+
+
+def create_review_like(db: Session, user_id: int, review_id: int) -> Optional[int]:
+    """리뷰 좋아요 → 저장된 like_count 반환 (리뷰 없으면 None). 이미 눌렀으면 그대로"""
+    exists = db.query(ReviewLike.id).filter_by(review_id=review_id, user_id=user_id).first()
+    if not exists:
+        try:
+            db.add(ReviewLike(review_id=review_id, user_id=user_id))
+            db.flush()
+            _bump_like_count(db, Review, Review.id == review_id, +1)
+            db.commit()
+        except IntegrityError:
+            # 동시 요청으로 먼저 들어간 좋아요 (uq_review_like_review_user) 또는 없는 리뷰
+            db.rollback()
+    return db.query(Review.like_count).filter(Review.id == review_id).scalar()
+
+
+def delete_review_like(db: Session, user_id: int, review_id: int) -> Optional[int]:
+    """리뷰 좋아요 취소 → 저장된 like_count 반환 (리뷰 없으면 None)"""
+    deleted = (
+        db.query(ReviewLike)
+        .filter(ReviewLike.review_id == review_id, ReviewLike.user_id == user_id)
+        .delete(synchronize_session=False)
+    )
+    if deleted:
+        _bump_like_count(db, Review, Review.id == review_id, -deleted)
+        db.commit()
+    return db.query(Review.like_count).filter(Review.id == review_id).scalar()
+
+
+def release_user_likes(db: Session, user_id: int) -> None:
+    """회원 탈퇴 시 찜/좋아요 행 삭제 전에 호출 → 대상 공연/리뷰의 like_count 차감 (커밋은 호출 측)"""
+    liked = db.query(UserFavoritePerformance.performance_id).filter(UserFavoritePerformance.user_id == user_id)
+    _bump_like_count(db, Performance, Performance.id.in_(liked.scalar_subquery()), -1)
+    liked = db.query(ReviewLike.review_id).filter(ReviewLike.user_id == user_id)
+    _bump_like_count(db, Review, Review.id.in_(liked.scalar_subquery()), -1)
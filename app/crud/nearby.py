@@ -5,63 +5,68 @@ from sqlalchemy import func, text, and_, or_
 from app.models.venue import Venue
 from app.schemas.nearby import PerformanceBoundsRequest
 from app.models.performance import Performance
-from math import radians
-import datetime, pytz
+from app.services.venue_index import get_venue_index
+from app.utils.time_window import today_remaining_filter
+from typing import Optional
+import datetime
 
-kst = pytz.timezone("Asia/Seoul")
+import numpy as np
 
 # -------------------------------
-# 반경 내 공연장 목록 조회 (오늘 공연 + 현재 시각 이후)
+# 반경 내 공연장 목록 조회 (오늘 공연 + 현재 시각 이후), 가까운 순
 # -------------------------------
 
-def get_nearby_venues(db: Session, lat: float, lng: float, radius_km: float):
-    
-    now = datetime.datetime.now(kst)
-    today = now.date()
-    current_time = now.time()
-
-    # 근처 후보
-    venues = db.query(Venue).filter(
-        (Venue.latitude >= lat - 0.05) & (Venue.latitude <= lat + 0.05),
-        (Venue.longitude >= lng - 0.05) & (Venue.longitude <= lng + 0.05)
-    ).all()
+def get_nearby_venues(db: Session, lat: float, lng: float, radius_km: float, limit: Optional[int] = None):
+    index = get_venue_index(db)
+    if limit:
+        return _nearest_tonight_venues(db, index, lat, lng, radius_km, limit)
+
+    # 인메모리 인덱스로 반경 검색 (haversine 거리순)
+    hits = index.within(lat, lng, radius_km)
+    if not hits:
+        return []
+
+    # 오늘 남은 공연이 있는 공연장만: IN 한 번
+    candidate_ids = [index.rows[i]["venue_id"] for i, _ in hits]
+    tonight = {
+        vid for (vid,) in db.query(Performance.venue_id)
+        .filter(Performance.venue_id.in_(candidate_ids), *today_remaining_filter())
+        .distinct()
+        .all()
+    }
 
     result = []
-    for v in venues:
-        performance_exists = db.query(Performance).filter(
-            Performance.venue_id == v.id,
-            Performance.date == today,
-            Performance.time >= current_time
-        ).first()
-
-        if performance_exists:
-            result.append({
-                "venue_id": v.id,
-                "name": v.name,
-                "address": getattr(v, "address", None),
-                "latitude": v.latitude,
-                "longitude": v.longitude,
-                "image_url": getattr(v, "image_url", None)
-            })
-
+    for i, dist in hits:
+        row = index.rows[i]
+        if row["venue_id"] not in tonight:
+            continue
+        result.append({**row, "distance_km": round(dist, 3)})
     return result
 
 
+def _nearest_tonight_venues(db: Session, index, lat: float, lng: float, radius_km: float, limit: int):
+    """limit 있을 때: 오늘 남은 공연이 있는 공연장(하루치라 소수)만 대상으로 kNN (반경 안에서 가까운 limit 개)"""
+    tonight = np.array([
+        vid for (vid,) in db.query(Performance.venue_id).filter(*today_remaining_filter()).distinct().all()
+    ], dtype=np.int64)
+    if tonight.size == 0:
+        return []
+    return [
+        {**index.rows[i], "distance_km": round(dist, 3)}
+        for i, dist in index.nearest(lat, lng, limit, max_radius_km=radius_km, allowed_ids=tonight)
+    ]
+
+
 # -------------------------------
 # 지도 범위 내 공연장들의 오늘 공연 목록 조회
 # -------------------------------
 def get_performances_in_bounds(db: Session, req: PerformanceBoundsRequest):
-    now = datetime.datetime.now(kst)
-    today = now.date()
-    current_time = now.time()
-
     performances = db.query(Performance, Venue).join(Venue).filter(
         Venue.latitude >= req.sw_lat,
         Venue.latitude <= req.ne_lat,
         Venue.longitude >= req.sw_lng,
         Venue.longitude <= req.ne_lng,
-        Performance.date == today,
-        Performance.time >= current_time
+        *today_remaining_filter()
     ).all()
 
     venue_dict = {}
@@ -91,14 +96,10 @@ def get_performances_in_bounds(db: Session, req: PerformanceBoundsRequest):
 # 특정 공연장의 오늘 공연 (현재 시간 이후)
 # -------------------------------
 def get_performances_by_venue(db: Session, venue_id: int, after: datetime.datetime):
-    today = after.date()
-    current_time = after.time()
-
     performances = db.query(Performance).filter(
         Performance.venue_id == venue_id,
-        Performance.date == today,
-        Performance.time >= current_time
-    ).all()
+        *today_remaining_filter(after)
+    ).order_by(Performance.start_at.asc()).all()
 
     return [{
         "performance_id": p.id,
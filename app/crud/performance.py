@@ -1,8 +1,8 @@
 # app/crud/performance.py
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, contains_eager, joinedload
 from sqlalchemy import case, and_, or_
 from sqlalchemy.sql.expression import func
-from datetime import date, datetime
+from datetime import date, datetime, time as dt_time
 from typing import List, Optional
 from app.models.performance import Performance
 from app.models.venue import Venue
@@ -12,6 +12,9 @@ from app.models.performance_artist import PerformanceArtist
 from app.models.user_favorite_performance import UserFavoritePerformance
 from app.models.user_performance_ticketalarm import UserPerformanceTicketAlarm
 from app.models.user_favorite_artist import UserFavoriteArtist   
+from app.models.user_recommendation import UserRecommendation
+from app.utils.pagination import Page, paginate_query
+from app.utils.time_window import day_filter, now_kst, upcoming_filter
 
 
 def get_performances_only_supposed( # 이미 끝난 공연 안 나오게끔 (날짜, 시간 둘다 고려)
@@ -20,8 +23,10 @@ def get_performances_only_supposed( # 이미 끝난 공연 안 나오게끔 (날
     sort: str,
     page: int,
     size: int,
-) -> (List[Performance], int):
-    query = db.query(Performance).join(Venue)
+    cursor: Optional[str] = None,
+    with_count: bool = True,
+) -> Page:
+    query = db.query(Performance).join(Venue).options(contains_eager(Performance.venue))
 
     # ✅ 지역 필터
     if region:
@@ -29,69 +34,63 @@ def get_performances_only_supposed( # 이미 끝난 공연 안 나오게끔 (날
         if region:
             query = query.filter(Venue.region.in_(region))
 
-    # ✅ 오늘 이후 or 오늘인데 아직 시작 전인 공연만 필터링
-    today = date.today()
-    now_t = datetime.now().time()
-    query = query.filter(
-        or_(
-            Performance.date > today,
-            and_(
-                Performance.date == today,
-                or_(
-                    Performance.time == None,   # 시간이 없으면 포함
-                    Performance.time >= now_t  # 시간이 현재 이후
-                )
-            )
-        )
-    )
+    # ✅ 아직 시작 전인 공연만 (KST start_at 기준)
+    query = query.filter(upcoming_filter())
 
-    # 정렬 조건
-    if sort == "date":
-        query = query.order_by(Performance.date.asc(), Performance.time.asc())
-    elif sort == "created_at":
-        query = query.order_by(Performance.created_at.desc())
+    # 정렬 조건 (마지막은 항상 id → keyset cursor 가능)
+    if sort == "created_at":
+        order = [(Performance.created_at, True), (Performance.id, True)]
     elif sort == "likes":
-        query = (
-            query.outerjoin(UserFavoritePerformance, UserFavoritePerformance.performance_id == Performance.id)
-            .group_by(Performance.id, Venue.id)
-            .order_by(func.count(UserFavoritePerformance.user_id).desc())
-        )
+        # 찜 수는 performance.like_count (찜/찜 취소 때 증감) → ix_performance_like_count 인덱스 정렬
+        order = [(Performance.like_count, True), (Performance.id, True)]
+    else:
+        order = [(Performance.start_at, False), (Performance.id, False)]
+
+    return paginate_query(
+        query, order=order, size=size, page=page, cursor=cursor, with_count=with_count,
+        sort_key=sort,
+    )
 
-    total = query.count()
-    performances = query.offset((page - 1) * size).limit(size).all()
-    return performances, total
+
+def get_trending_performances(
+    db: Session,
+    region: Optional[List[str]],
+    page: int,
+    size: int,
+    cursor: Optional[str] = None,
+    with_count: bool = True,
+) -> Page:
+    """예정 공연 trending_score 순 (점수는 app/services/trending.py 배치가 주기적으로 갱신)"""
+    query = db.query(Performance).join(Venue).options(contains_eager(Performance.venue)).filter(upcoming_filter())
+    if region:
+        region = [r.strip() for r in region if r and r.strip() != "전체"]
+        if region:
+            query = query.filter(Venue.region.in_(region))
+    order = [(Performance.trending_score, True), (Performance.id, True)]
+    return paginate_query(
+        query, order=order, size=size, page=page, cursor=cursor, with_count=with_count,
+        sort_key="trending",
+    )
 
 
 def get_today_performances(db: Session) -> List[Performance]:
-    today = date.today()
     return (
         db.query(Performance)
         .join(Venue)
-        .filter(Performance.date == today)
+        .options(contains_eager(Performance.venue))   # venue 는 join 결과로 채움 (N+1 방지)
+        .filter(*day_filter())
+        .order_by(Performance.start_at.asc(), Performance.id.asc())
         .all()
     )
 
 def get_recent_performances(db: Session, limit: int) -> List[Performance]:
 
-    today = date.today()
-    now_t = datetime.now().time()
-
     return (
         db.query(Performance)
         .join(Venue)
-        # 오늘 이후 or 오늘인데 시작 전인 공연만 남김
-        .filter(
-            or_(
-                Performance.date > today,
-                and_(
-                    Performance.date == today,
-                    or_(
-                        Performance.time == None,     
-                        Performance.time >= now_t     
-                    )
-                )
-            )
-        )
+        .options(contains_eager(Performance.venue))   # venue 는 join 결과로 채움 (N+1 방지)
+        # 아직 시작 전인 공연만 남김
+        .filter(upcoming_filter())
         .order_by(Performance.created_at.desc())
         .limit(limit)
         .all()
@@ -102,14 +101,16 @@ def get_ticket_opening_performances(db: Session, start: date, end: date) -> List
     q = (
         db.query(Performance)
         .join(Venue)
+        .options(contains_eager(Performance.venue))   # venue 는 join 결과로 채움 (N+1 방지)
         .filter(Performance.ticket_open_date >= start)
         .filter(Performance.ticket_open_date <= end)
     )
 
    
-    today = date.today()
+    now = now_kst()
+    today = now.date()
     if start <= today <= end:
-        now_t = datetime.now().time()
+        now_t = now.time()
         q = q.filter(
             or_(
                 Performance.ticket_open_date > today,
@@ -134,76 +135,43 @@ def get_ticket_opening_performances(db: Session, start: date, end: date) -> List
         .all()
     )
 
-def get_recommendation_performances(db: Session, user_id: int) -> List[Performance]:
-   
-    # 추천 6개 (부족하면 있는 만큼):
-    # A 3개: 나와 같은 가수를 찜한 사용자들이 찜한 다른 공연
-    # B 3개: 내가 찜한 공연을 찜한 사용자들이 찜한 다른 공연
-    # 각 묶음 랜덤, 합칠 때 중복 제거, 최대 6개
-    
-    # 내가 찜한 공연 (중복 제거/제외용)
-    liked_perf_ids_subq = (
-        db.query(UserFavoritePerformance.performance_id)
-        .filter(UserFavoritePerformance.user_id == user_id)
-        .subquery()
-    )
-
-    # 내가 찜한 아티스트
-    liked_artist_ids_subq = (
-        db.query(UserFavoriteArtist.artist_id)
-        .filter(UserFavoriteArtist.user_id == user_id)
-        .subquery()
-    )
-    # 같은 아티스트를 찜한 '다른' 사용자
-    users_like_same_artists_subq = (
-        db.query(UserFavoriteArtist.user_id)
-        .filter(UserFavoriteArtist.artist_id.in_(liked_artist_ids_subq))
-        .filter(UserFavoriteArtist.user_id != user_id)
-        .distinct()
-        .subquery()
-    )
-    # 그 사용자들이 찜한 공연들(내가 이미 찜한 공연 제외)
-    perfs_A = (
+def get_recommendation_performances(db: Session, user_id: int, limit: int = 6) -> List[Performance]:
+    # 오프라인 배치(app/services/recommend.py)가 채운 user_recommendation 에서 점수순 조회
+    # 지난 공연은 조회 시점에 제외, 모자라면 예정 공연 인기순으로 채움
+    recs = (
         db.query(Performance)
-        .join(UserFavoritePerformance, Performance.id == UserFavoritePerformance.performance_id)
-        .filter(UserFavoritePerformance.user_id.in_(users_like_same_artists_subq))
-        .filter(~Performance.id.in_(liked_perf_ids_subq))
-        .order_by(func.rand())
-        .limit(3)
+        .options(joinedload(Performance.venue))
+        .join(UserRecommendation, UserRecommendation.performance_id == Performance.id)
+        .filter(UserRecommendation.user_id == user_id, upcoming_filter())
+        .order_by(UserRecommendation.score.desc())
+        .limit(limit)
         .all()
     )
+    if len(recs) >= limit:
+        return recs
 
-    # 내가 찜한 공연을 찜한 '다른' 사용자
-    users_like_my_perfs_subq = (
-        db.query(UserFavoritePerformance.user_id)
-        .filter(UserFavoritePerformance.performance_id.in_(liked_perf_ids_subq))
-        .filter(UserFavoritePerformance.user_id != user_id)
-        .distinct()
-        .subquery()
+    liked_perf_ids_subq = (
+        db.query(UserFavoritePerformance.performance_id)
+        .filter(UserFavoritePerformance.user_id == user_id)
     )
-    # 그 사용자들이 찜한 다른 공연(내가 이미 찜한 공연 제외)
-    perfs_B = (
-        db.query(Performance)
-        .join(UserFavoritePerformance, Performance.id == UserFavoritePerformance.performance_id)
-        .filter(UserFavoritePerformance.user_id.in_(users_like_my_perfs_subq))
-        .filter(~Performance.id.in_(liked_perf_ids_subq))
-        .order_by(func.rand())
-        .limit(3)
-        .all()
+    exclude = [p.id for p in recs]
+    return recs + get_popular_upcoming_performances(
+        db, limit - len(recs), exclude_ids=exclude, exclude_query=liked_perf_ids_subq
     )
 
-    # ===== 합치고 중복 제거, 최대 6개 =====
-    seen = set()
-    merged: List[Performance] = []
-    for p in perfs_A + perfs_B:
-        if p.id in seen:
-            continue
-        seen.add(p.id)
-        merged.append(p)
-        if len(merged) >= 6:
-            break
 
-    return merged
+def get_popular_upcoming_performances(db: Session, limit: int, exclude_ids=(), exclude_query=None) -> List[Performance]:
+    """예정 공연 찜 많은 순"""
+    q = db.query(Performance).options(joinedload(Performance.venue)).filter(upcoming_filter())
+    if exclude_ids:
+        q = q.filter(~Performance.id.in_(list(exclude_ids)))
+    if exclude_query is not None:
+        q = q.filter(~Performance.id.in_(exclude_query))
+    return (
+        q.order_by(Performance.like_count.desc(), Performance.start_at.asc())
+        .limit(limit)
+        .all()
+    )
 
 def get_performances(
     db: Session,
@@ -212,7 +180,7 @@ def get_performances(
     page: int,
     size: int,
 ) -> (List[Performance], int):
-    query = db.query(Performance).join(Venue)
+    query = db.query(Performance).join(Venue).options(contains_eager(Performance.venue))
 
     if region:
         region = [r.strip() for r in region if r and r.strip() != "전체"]
@@ -220,22 +188,18 @@ def get_performances(
             query = query.filter(Venue.region.in_(region))
 
     if sort == "date":
-        query = query.order_by(Performance.date.asc())
+        query = query.order_by(Performance.start_at.asc())
     elif sort == "created_at":
         query = query.order_by(Performance.created_at.desc())
     elif sort == "likes":
-        query = (
-            query.outerjoin(UserFavoritePerformance, UserFavoritePerformance.performance_id == Performance.id)
-            .group_by(Performance.id, Venue.id)
-            .order_by(func.count(UserFavoritePerformance.user_id).desc())
-        )
+        query = query.order_by(Performance.like_count.desc(), Performance.id.desc())
 
     total = query.count()
     performances = query.offset((page - 1) * size).limit(size).all()
     return performances, total
 
 def get_performance_detail(db: Session, performance_id: int) -> Optional[Performance]:
-    return db.query(Performance).filter(Performance.id == performance_id).first()
+    return db.query(Performance).options(joinedload(Performance.venue)).filter(Performance.id == performance_id).first()
 
 def get_performance_artists(db: Session, performance_id: int) -> List[Artist]:
     return (
@@ -252,4 +216,33 @@ def is_user_alarmed_performance(db: Session, user_id: int, performance_id: int)
     return db.query(UserPerformanceTicketAlarm).filter_by(user_id=user_id, performance_id=performance_id).first() is not None
 
 def get_performance_like_count(db: Session, performance_id: int) -> int:
-    return db.query(UserFavoritePerformance).filter_by(performance_id=performance_id).count()
+    # performance.like_count (찜/찜 취소 때 증감, app/services/counters.py 가 주기적으로 보정)
+    return db.query(Performance.like_count).filter(Performance.id == performance_id).scalar() or 0
+
+def create_performance(db: Session, body) -> Performance:
+    # commit은 호출 측에서 (알림 작업 enqueue와 같은 트랜잭션으로 묶기 위해 flush만)
+    perf = Performance(
+        title=body.title,
+        venue_id=body.venue_id,
+        date=body.date,
+        time=body.time or dt_time(0, 0),
+        price=str(body.price) if body.price is not None else "",
+        ticket_open_date=body.ticket_open_date,
+        ticket_open_time=body.ticket_open_time,
+        detail_url=body.detail_url,
+        image_url=body.image_url,
+    )
+    db.add(perf)
+    db.flush()
+    return perf
+
+def set_performance_artists(db: Session, performance_id: int, artist_ids: List[int]) -> None:
+    existing = {
+        aid for (aid,) in db.query(PerformanceArtist.artist_id)
+        .filter(PerformanceArtist.performance_id == performance_id).all()
+    }
+    db.add_all([
+        PerformanceArtist(performance_id=performance_id, artist_id=aid)
+        for aid in sorted(set(artist_ids)) if aid not in existing
+    ])
+    db.flush()
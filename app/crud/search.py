@@ -0,0 +1,91 @@
+# app/crud/search.py
+# 검색 backend
+# - MySQL: ngram FULLTEXT 인덱스 + MATCH ... AGAINST (BOOLEAN MODE), 관련도순
+# - 그 외(SQLite 등) 또는 ngram 토큰보다 짧은 키워드: LIKE '%kw%' fallback
+import os
+import re
+from typing import Optional, Sequence, Tuple
+
+from sqlalchemy.dialects.mysql import match
+from sqlalchemy.orm import Query, Session, contains_eager
+
+from app.models.artist import Artist
+from app.models.performance import Performance
+from app.models.venue import Venue
+from app.utils.pagination import Page, paginate_query
+
+SEARCH_FULLTEXT = os.getenv("SEARCH_FULLTEXT", "1") == "1"
+NGRAM_TOKEN_SIZE = int(os.getenv("NGRAM_TOKEN_SIZE", "2"))  # MySQL ngram_token_size (기본 2)
+
+# (테이블, 인덱스명, 컬럼들) — 마이그레이션 f1c7a2d93b54 와 동일해야 MATCH가 인덱스를 탄다
+FULLTEXT_INDEXES = [
+    ("performance", "ft_performance_title", ("title",)),
+    ("venue", "ft_venue_name_address", ("name", "address")),
+    ("artist", "ft_artist_name", ("name",)),
+]
+
+# BOOLEAN MODE 연산자 문자 제거
+_BOOLEAN_SPECIAL = re.compile(r'[+\-<>()~*"@]+')
+
+
+def fulltext_ddl(table: str, name: str, cols: Sequence[str]) -> str:
+    return f"ALTER TABLE `{table}` ADD FULLTEXT INDEX `{name}` ({', '.join(f'`{c}`' for c in cols)}) WITH PARSER ngram"
+
+
+def boolean_query(keyword: str) -> Optional[str]:
+    """
+    '인디 밴드' → '+"인디" +"밴드"' (모든 단어 포함).
+    ngram 토큰보다 짧은 단어는 FULLTEXT로 못 찾으므로 None → LIKE fallback
+    """
+    words = [w for w in _BOOLEAN_SPECIAL.sub(" ", keyword).split() if w]
+    if not words or any(len(w) < NGRAM_TOKEN_SIZE for w in words):
+        return None
+    return " ".join(f'+"{w}"' for w in words)
+
+
+def use_fulltext(db: Session) -> bool:
+    return SEARCH_FULLTEXT and db.get_bind().dialect.name == "mysql"
+
+
+def _apply(db: Session, query: Query, cols: Tuple, keyword: str, id_col):
+    """
+    검색 조건 + 정렬 적용 → (query, order, keyset)
+    FULLTEXT면 관련도 desc, id asc (점수는 keyset 불가 → offset cursor)
+    """
+    q = boolean_query(keyword) if use_fulltext(db) else None
+    if q is not None:
+        score = match(*cols, against=q).in_boolean_mode()
+        return query.filter(score), [(score, True), (id_col, False)], False
+
+    kw = keyword.strip()
+    cond = cols[0].contains(kw, autoescape=True)
+    for c in cols[1:]:
+        cond = cond | c.contains(kw, autoescape=True)
+    return query.filter(cond), [(id_col, False)], True
+
+
+def search_performances(db: Session, keyword: str, *, size: int, page: int = 1,
+                        cursor: Optional[str] = None, with_count: bool = True) -> Page:
+    query, order, keyset = _apply(db, db.query(Performance).join(Venue).options(contains_eager(Performance.venue)), (Performance.title,), keyword, Performance.id)
+    return paginate_query(
+        query, order=order, size=size, page=page, cursor=cursor, with_count=with_count,
+        sort_key="performance" if keyset else "performance_ft", keyset=keyset,
+    )
+
+
+def search_venues(db: Session, keyword: str, *, size: int, page: int = 1,
+                  cursor: Optional[str] = None, with_count: bool = True) -> Page:
+    query, order, keyset = _apply(db, db.query(Venue), (Venue.name, Venue.address), keyword, Venue.id)
+    return paginate_query(
+        query, order=order, size=size, page=page, cursor=cursor, with_count=with_count,
+        sort_key="venue" if keyset else "venue_ft", keyset=keyset,
+    )
+
+
+def search_artists(db: Session, keyword: str, *, size: int, page: int = 1,
+                   cursor: Optional[str] = None, with_count: bool = True) -> Page:
+    query, order, keyset = _apply(db, db.query(Artist), (Artist.name,), keyword, Artist.id)
+    return paginate_query(
+        query, order=order, size=size, page=page, cursor=cursor, with_count=with_count,
+        sort_key="artist" if keyset else "artist_ft", keyset=keyset,
+    )
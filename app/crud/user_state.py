@@ -0,0 +1,92 @@
+# app/crud/user_state.py
+# 목록/상세 응답의 사용자별 플래그(isLiked / isAlarmed)와 좋아요 수를 한 번에 조회
+# - 찜 + 알림: UNION ALL 쿼리 1번 (비로그인이면 생략)
+# - 좋아요 수: 저장된 like_count 컬럼이 있으면 그 값, 없으면 GROUP BY 쿼리 1번 (with_counts=True 일 때만)
+from typing import Dict, Iterable, NamedTuple, Optional, Set
+
+from sqlalchemy import func, literal, select, union_all
+from sqlalchemy.orm import Session
+
+from app.models.performance import Performance
+from app.models.user_artist_ticketalarm import UserArtistTicketAlarm
+from app.models.user_favorite_artist import UserFavoriteArtist
+from app.models.user_favorite_performance import UserFavoritePerformance
+from app.models.user_performance_ticketalarm import UserPerformanceTicketAlarm
+
+
+class UserState(NamedTuple):
+    liked: Set[int]
+    alarmed: Set[int]
+    like_counts: Dict[int, int]
+
+    def is_liked(self, target_id: int) -> bool:
+        return target_id in self.liked
+
+    def is_alarmed(self, target_id: int) -> bool:
+        return target_id in self.alarmed
+
+    def like_count(self, target_id: int) -> int:
+        return self.like_counts.get(target_id, 0)
+
+
+# 대상 종류 → (찜 모델, 찜 대상 컬럼, 알림 모델, 알림 대상 컬럼)
+_TARGETS = {
+    "artist": (UserFavoriteArtist, UserFavoriteArtist.artist_id,
+               UserArtistTicketAlarm, UserArtistTicketAlarm.artist_id),
+    "performance": (UserFavoritePerformance, UserFavoritePerformance.performance_id,
+                    UserPerformanceTicketAlarm, UserPerformanceTicketAlarm.performance_id),
+}
+
+# 대상 테이블에 저장된 찜 수 컬럼 (찜/찜 취소 때 증감)
+_STORED_COUNTS = {
+    "performance": (Performance.id, Performance.like_count),
+}
+
+
+def resolve_user_state(
+    db: Session,
+    target: str,
+    user_id: Optional[int],
+    ids: Iterable[int],
+    *,
+    with_counts: bool = False,
+) -> UserState:
+    fav_model, fav_col, alarm_model, alarm_col = _TARGETS[target]
+    ids = list(dict.fromkeys(i for i in ids if i is not None))
+    state = UserState(set(), set(), {})
+    if not ids:
+        return state
+
+    if user_id:
+        stmt = union_all(
+            select(fav_col.label("target_id"), literal("L").label("kind"))
+            .where(fav_model.user_id == user_id, fav_col.in_(ids)),
+            select(alarm_col.label("target_id"), literal("A").label("kind"))
+            .where(alarm_model.user_id == user_id, alarm_col.in_(ids)),
+        )
+        for target_id, kind in db.execute(stmt).all():
+            (state.liked if kind == "L" else state.alarmed).add(target_id)
+
+    if with_counts:
+        stored = _STORED_COUNTS.get(target)
+        if stored is not None:
+            id_col, count_col = stored
+            rows = db.query(id_col, count_col).filter(id_col.in_(ids)).all()
+        else:
+            rows = (
+                db.query(fav_col, func.count())
+                .filter(fav_col.in_(ids))
+                .group_by(fav_col)
+                .all()
+            )
+        state.like_counts.update({tid: cnt for tid, cnt in rows})
+
+    return state
+
+
+def resolve_artist_state(db: Session, user_id: Optional[int], artist_ids: Iterable[int], *, with_counts: bool = False) -> UserState:
+    return resolve_user_state(db, "artist", user_id, artist_ids, with_counts=with_counts)
+
+
+def resolve_performance_state(db: Session, user_id: Optional[int], performance_ids: Iterable[int], *, with_counts: bool = False) -> UserState:
+    return resolve_user_state(db, "performance", user_id, performance_ids, with_counts=with_counts)
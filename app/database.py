@@ -2,6 +2,11 @@
 import os
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.config import settings
+from app.utils.db_pool import instrument_pool, pool_kwargs
+from app.utils.db_routing import RoutingSession, build_replica_set
 
 DB_USER = os.getenv("DB_USER")
 DB_PASSWORD = os.getenv("DB_PASSWORD")
@@ -32,10 +37,38 @@ def _build_db_url():
 
 SQLALCHEMY_DATABASE_URL = _build_db_url()
 
-engine = create_engine(SQLALCHEMY_DATABASE_URL, pool_pre_ping=True, pool_recycle=3600)
+# 풀 옵션은 Settings(DB_POOL_*) → app/utils/db_pool.py
+engine = create_engine(SQLALCHEMY_DATABASE_URL, **pool_kwargs(settings, SQLALCHEMY_DATABASE_URL))
+instrument_pool(engine, settings)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
+# 비동기 엔진: 조회가 많은 라우터(홈/공연 목록/검색/주변)용. 동기 engine 과 별도 풀
+# 기본은 동기 URL 의 드라이버만 aiomysql 로 교체, 테스트/벤치는 ASYNC_DATABASE_URL=sqlite+aiosqlite:///... 로 지정
+def _build_async_db_url():
+    url = os.getenv("ASYNC_DATABASE_URL")
+    if url:
+        return url
+    return SQLALCHEMY_DATABASE_URL.replace("mysql+pymysql://", "mysql+aiomysql://", 1)
+
+ASYNC_DATABASE_URL = _build_async_db_url()
+
+async_engine = create_async_engine(ASYNC_DATABASE_URL, **pool_kwargs(settings, ASYNC_DATABASE_URL, is_async=True))
+instrument_pool(async_engine.sync_engine, settings)
+AsyncSessionLocal = async_sessionmaker(async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
+
+# Read replica (DB_REPLICA_URLS 없으면 None → 조회 세션도 primary)
+# 조회용 세션은 RoutingSession: SELECT 는 요청마다 고른 replica, 쓰기는 primary
+# 라우팅/고정 판단은 app/utils/dependency.py 의 get_read_db / get_async_read_db
+replicas = build_replica_set(settings)
+ReadSessionLocal = sessionmaker(class_=RoutingSession, autocommit=False, autoflush=False, bind=engine)
+AsyncReadSessionLocal = async_sessionmaker(
+    async_engine, class_=AsyncSession, sync_session_class=RoutingSession, autoflush=False, expire_on_commit=False
+)
+if replicas is not None:
+    from app.services.response_cache import set_reinvalidate_delay
+    set_reinvalidate_delay(settings.DB_REPLICA_PIN_SECONDS)
+
 # FastAPI DB dependency
 def get_db():
     db = SessionLocal()
@@ -43,3 +76,10 @@ def get_db():
         yield db
     finally:
         db.close()
+
+# FastAPI 비동기 DB dependency
+# 기존 crud(동기 Session API)는 그대로 쓰고 라우터에서 await db.run_sync(fn, ...) 로 실행
+# → 스레드풀 없이 이벤트 루프에서 aiomysql 로 I/O 대기 (lazy load 도 run_sync 안에서만 가능)
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -1,11 +1,22 @@
 # app/main.py
-from fastapi import FastAPI
+import math
+import time
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 import os
 from sqlalchemy import text
 
-from app.database import SessionLocal, engine
+from app.config import settings
+from app.database import AsyncSessionLocal, SessionLocal, async_engine, engine, replicas
+from app.utils.db_pool import pool_status, warm_up_async, warm_up_sync
+from app.utils.db_routing import PIN_COOKIE, start_write_tracking
+from app.utils.dependency import _decode_token
+from app.utils.query_stats import track_queries
+from app.utils.metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE, MetricsMiddleware, render_metrics
+from app.services.response_cache import get_response_cache
 from app.routers import (
     auth, user, search, nearby, venue, alert, like,
     performance, performance_home, calender, artist,
@@ -15,7 +26,22 @@ from app.routers import notification as notification_router
 from app.routers import mood as mood_router
 import app.models
 
-app = FastAPI()
+
+# --- 시작 시 DB 워밍업: 커넥션 미리 열기 + 홈/목록 쿼리 컴파일 캐시 채우기 ---
+# Cloud Run 콜드 스타트 직후 첫 요청들이 커넥션 생성 비용을 내지 않도록
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    n = min(settings.DB_POOL_WARMUP, settings.DB_POOL_SIZE)
+    if n > 0:
+        print(f"[startup] db warm-up sync={warm_up_sync(engine, SessionLocal, n)}")
+        print(f"[startup] db warm-up async={await warm_up_async(async_engine, AsyncSessionLocal, n)}")
+    yield
+    if replicas is not None:
+        replicas.stop()
+    await async_engine.dispose()
+
+
+app = FastAPI(lifespan=lifespan)
 
 
 # --- Health ---
@@ -24,6 +50,12 @@ def health():
     return {"ok": True}
 
 
+# --- Prometheus 메트릭 (app/utils/metrics.py) ---
+@app.get("/metrics", include_in_schema=False)
+def metrics():
+    return PlainTextResponse(render_metrics(), media_type=METRICS_CONTENT_TYPE)
+
+
 # --- Debug: DB 연결 및 카운트 ---
 @app.get("/__debug/db")
 def __debug_db():
@@ -36,6 +68,27 @@ def __debug_db():
         return {"engine_url": url, "mood_count": cnt}
 
 
+# --- Debug: 커넥션 풀 상태 (checked-out / overflow / checkout 대기 시간) ---
+@app.get("/__debug/pool")
+def __debug_pool():
+    info = {"sync": pool_status(engine), "async": pool_status(async_engine)}
+    if replicas is not None:
+        info["replicas"] = {
+            **replicas.status(),
+            "pools": {r.name: {"sync": pool_status(r.engine), "async": pool_status(r.async_engine)} for r in replicas.replicas},
+        }
+    return info
+
+
+# --- Debug: 응답 캐시 통계 ---
+@app.get("/__debug/cache")
+def __debug_cache():
+    cache = get_response_cache()
+    if cache is None:
+        return {"backend": "off"}
+    return {"backend": type(cache.backend).__name__, **cache.stats}
+
+
 # --- 정적 파일 ---
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 STATIC_DIR = os.path.join(BASE_DIR, "static")
@@ -59,6 +112,46 @@ app.add_middleware(
 )
 
 
+# --- 요청별 SQL 계측: Server-Timing 헤더 + N+1/lazy load 로그 (app/utils/query_stats.py) ---
+@app.middleware("http")
+async def sql_instrumentation(request: Request, call_next):
+    t0 = time.perf_counter()
+    with track_queries(request.scope) as qs:
+        response = await call_next(request)
+    total_ms = (time.perf_counter() - t0) * 1000
+    route = getattr(request.scope.get("route"), "path", request.url.path)
+    qs.log(request.method, route, response.status_code, total_ms)
+    if qs.strict and qs.violations and response.status_code < 500:
+        # 엄격 모드: 엔드포인트가 예외를 삼켜도 실패로 보이도록
+        response = JSONResponse(status_code=500, content={"detail": "SQL budget violation", "violations": qs.violations})
+    response.headers.append("Server-Timing", qs.server_timing(total_ms))
+    return response
+
+
+# --- Read replica: 쓰기 직후 read-your-writes ---
+# 요청 중 커밋된 쓰기가 있으면 그 사용자(메모리)와 브라우저(쿠키)를 잠시 primary 에 고정
+@app.middleware("http")
+async def pin_primary_after_write(request: Request, call_next):
+    if replicas is None:
+        return await call_next(request)
+    marker = start_write_tracking()
+    response = await call_next(request)
+    if marker["wrote"]:
+        token = request.cookies.get("access_token")
+        claims = _decode_token(token) if token else None
+        if claims:
+            replicas.pin_user(claims[0])
+        response.set_cookie(
+            PIN_COOKIE, f"{time.time() + replicas.pin_seconds:.3f}",
+            **{**auth._cookie_kwargs(), "max_age": math.ceil(replicas.pin_seconds)},
+        )
+    return response
+
+
+# --- 요청 메트릭: 가장 바깥에서 측정 (다른 미들웨어 시간 포함) ---
+app.add_middleware(MetricsMiddleware)
+
+
 # --- 라우터 등록 ---
 app.include_router(mood_router.router)
 app.include_router(mood_router.router, prefix="/performance")  # /performance/mood/* 별칭
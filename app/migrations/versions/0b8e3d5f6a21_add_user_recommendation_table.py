@@ -0,0 +1,37 @@
+"""add user_recommendation table
+
+Revision ID: 0b8e3d5f6a21
+Revises: f1c7a2d93b54
+Create Date: 2026-10-18 16:11:52.734019
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0b8e3d5f6a21'
+down_revision: Union[str, None] = 'f1c7a2d93b54'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'user_recommendation',
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('performance_id', sa.Integer(), nullable=False),
+        sa.Column('score', sa.Float(), nullable=False),
+        sa.Column('computed_at', sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['user.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['performance_id'], ['performance.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('user_id', 'performance_id'),
+    )
+    op.create_index('ix_user_recommendation_user_score', 'user_recommendation', ['user_id', 'score'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_user_recommendation_user_score', table_name='user_recommendation')
+    op.drop_table('user_recommendation')
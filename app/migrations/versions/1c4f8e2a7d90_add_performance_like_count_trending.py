@@ -0,0 +1,50 @@
+"""add performance like_count / trending_score
+
+Revision ID: 1c4f8e2a7d90
+Revises: 0b8e3d5f6a21
+Create Date: 2026-10-18 16:48:27.305512
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1c4f8e2a7d90'
+down_revision: Union[str, None] = '0b8e3d5f6a21'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('performance', sa.Column('like_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('performance', sa.Column('trending_score', sa.Float(), server_default='0', nullable=False))
+
+    # 기존 찜 수 채우기 (updated_at 은 그대로 유지)
+    op.execute(
+        """
+        UPDATE performance
+        SET like_count = (
+                SELECT COUNT(*) FROM user_favorite_performance f
+                WHERE f.performance_id = performance.id
+            ),
+            updated_at = updated_at
+        """
+    )
+    op.create_index('ix_performance_like_count', 'performance', ['like_count', 'id'], unique=False)
+    op.create_index('ix_performance_trending_score', 'performance', ['trending_score', 'id'], unique=False)
+
+    # 찜한 시각: 기존 행은 알 수 없으므로 NULL (trending 계산에서 제외)
+    op.add_column('user_favorite_performance', sa.Column('created_at', sa.DateTime(), nullable=True))
+    op.create_index('ix_user_favorite_performance_created_at', 'user_favorite_performance', ['created_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_user_favorite_performance_created_at', table_name='user_favorite_performance')
+    op.drop_column('user_favorite_performance', 'created_at')
+    op.drop_index('ix_performance_trending_score', table_name='performance')
+    op.drop_index('ix_performance_like_count', table_name='performance')
+    op.drop_column('performance', 'trending_score')
+    op.drop_column('performance', 'like_count')
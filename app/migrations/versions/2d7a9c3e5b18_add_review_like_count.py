@@ -0,0 +1,36 @@
+"""add review like_count
+
+Revision ID: 2d7a9c3e5b18
+Revises: 1c4f8e2a7d90
+Create Date: 2026-10-18 17:20:41.662870
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2d7a9c3e5b18'
+down_revision: Union[str, None] = '1c4f8e2a7d90'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('review', sa.Column('like_count', sa.Integer(), server_default='0', nullable=False))
+    # 기존 좋아요 수 채우기
+    op.execute(
+        """
+        UPDATE review
+        SET like_count = (
+            SELECT COUNT(*) FROM review_like rl
+            WHERE rl.review_id = review.id
+        )
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('review', 'like_count')
@@ -0,0 +1,69 @@
+"""add unique natural keys for venue.instagram_account / artist.name
+
+Revision ID: 4a1d6e9c2b73
+Revises: 2d7a9c3e5b18
+Create Date: 2026-10-18 19:05:12.418377
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4a1d6e9c2b73'
+down_revision: Union[str, None] = '2d7a9c3e5b18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# 중복 행 병합: 같은 키 중 가장 작은 id 를 남기고 참조를 옮긴 뒤 나머지 삭제
+# (table, key, [(참조 테이블, 참조 컬럼, 복합 PK 여부)])
+MERGES = [
+    ('venue', 'instagram_account', [('performance', 'venue_id', False), ('review', 'venue_id', False)]),
+    ('artist', 'name', [
+        ('performance_artist', 'artist_id', True),
+        ('user_favorite_artist', 'artist_id', True),
+        ('user_artist_ticketalarm', 'artist_id', True),
+        ('music_magazine_block', 'artist_id', False),
+    ]),
+]
+
+
+def _merge_duplicates(table: str, key: str, refs) -> None:
+    # 재실행(insert_venues 등)으로 생긴 중복. MySQL(운영) 전용 multi-table UPDATE/DELETE 문법
+    op.execute(
+        f"""
+        CREATE TEMPORARY TABLE `{table}_dup` AS
+        SELECT t.id AS dup_id, k.keep_id
+        FROM `{table}` t
+        JOIN (SELECT `{key}`, MIN(id) AS keep_id FROM `{table}` GROUP BY `{key}` HAVING COUNT(*) > 1) k
+          ON t.`{key}` = k.`{key}` AND t.id <> k.keep_id
+        """
+    )
+    for ref_table, ref_col, composite_pk in refs:
+        # 복합 PK 테이블은 옮기면 겹치는 행(이미 남길 id 쪽에 있는 행)이 생김 → IGNORE 후 남은 행 삭제
+        ignore = 'IGNORE ' if composite_pk else ''
+        op.execute(
+            f"UPDATE {ignore}`{ref_table}` r JOIN `{table}_dup` d ON r.`{ref_col}` = d.dup_id "
+            f"SET r.`{ref_col}` = d.keep_id"
+        )
+        if composite_pk:
+            op.execute(f"DELETE r FROM `{ref_table}` r JOIN `{table}_dup` d ON r.`{ref_col}` = d.dup_id")
+    op.execute(f"DELETE t FROM `{table}` t JOIN `{table}_dup` d ON t.id = d.dup_id")
+    op.execute(f"DROP TEMPORARY TABLE `{table}_dup`")
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == 'mysql':
+        for table, key, refs in MERGES:
+            _merge_duplicates(table, key, refs)
+    op.create_unique_constraint('uq_venue_instagram_account', 'venue', ['instagram_account'])
+    op.drop_index('ix_artist_name', table_name='artist')
+    op.create_index('ix_artist_name', 'artist', ['name'], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_artist_name', table_name='artist')
+    op.create_index('ix_artist_name', 'artist', ['name'], unique=False)
+    op.drop_constraint('uq_venue_instagram_account', 'venue', type_='unique')
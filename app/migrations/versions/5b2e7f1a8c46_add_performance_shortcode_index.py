@@ -0,0 +1,27 @@
+"""add performance.shortcode index
+
+Revision ID: 5b2e7f1a8c46
+Revises: 4a1d6e9c2b73
+Create Date: 2026-10-18 19:41:37.902114
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b2e7f1a8c46'
+down_revision: Union[str, None] = '4a1d6e9c2b73'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 일괄 등록/크롤러의 shortcode IN (...) 중복 조회용 (기존 중복 데이터가 있을 수 있어 unique 아님)
+    op.create_index('ix_performance_shortcode', 'performance', ['shortcode'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_performance_shortcode', table_name='performance')
@@ -0,0 +1,57 @@
+"""add crawl_account / crawl_post tables
+
+Revision ID: 6c3f9a2d4e17
+Revises: 5b2e7f1a8c46
+Create Date: 2026-10-18 21:12:05.418630
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6c3f9a2d4e17'
+down_revision: Union[str, None] = '5b2e7f1a8c46'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 기존 JSON 상태는 python -m app.scripts.crawl_accounts import-json 으로 옮김
+    op.create_table(
+        'crawl_account',
+        sa.Column('id', sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column('account', sa.String(length=100), nullable=False),
+        sa.Column('is_active', sa.Boolean(), server_default=sa.text("1"), nullable=False),
+        sa.Column('last_shortcode', sa.String(length=100), nullable=True),
+        sa.Column('fingerprint', sa.String(length=40), nullable=True),
+        sa.Column('last_checked_at', sa.DateTime(), nullable=True),
+        sa.Column('last_changed_at', sa.DateTime(), nullable=True),
+        sa.Column('fail_count', sa.Integer(), server_default=sa.text("0"), nullable=False),
+        sa.Column('last_error', sa.String(length=255), nullable=True),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.UniqueConstraint('account'),
+    )
+    op.create_index('ix_crawl_account_active_checked', 'crawl_account', ['is_active', 'last_checked_at'], unique=False)
+
+    op.create_table(
+        'crawl_post',
+        sa.Column('id', sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column('account', sa.String(length=100), nullable=False),
+        sa.Column('shortcode', sa.String(length=100), nullable=False),
+        sa.Column('text', sa.Text(), nullable=True),
+        sa.Column('image_url', sa.String(length=1000), nullable=True),
+        sa.Column('found_at', sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.UniqueConstraint('shortcode'),
+    )
+    op.create_index('ix_crawl_post_found_at', 'crawl_post', ['found_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_crawl_post_found_at', table_name='crawl_post')
+    op.drop_table('crawl_post')
+    op.drop_index('ix_crawl_account_active_checked', table_name='crawl_account')
+    op.drop_table('crawl_account')
@@ -0,0 +1,27 @@
+"""add notification.dispatch_token
+
+Revision ID: 7d4a1b8e5f92
+Revises: 6c3f9a2d4e17
+Create Date: 2026-10-19 10:24:51.306218
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7d4a1b8e5f92'
+down_revision: Union[str, None] = '6c3f9a2d4e17'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # bulk insert(INSERT IGNORE) 후 이번 실행이 넣은 행만 재조회하기 위한 식별자 (인덱스 불필요: uq 범위 조회에 조건 추가)
+    op.add_column('notification', sa.Column('dispatch_token', sa.String(length=32), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('notification', 'dispatch_token')
@@ -0,0 +1,40 @@
+"""add user.push_token and push_ticket table
+
+Revision ID: a3c91e5d7b20
+Revises: 71ac506526e4
+Create Date: 2026-10-18 10:12:41.502113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3c91e5d7b20'
+down_revision: Union[str, None] = '71ac506526e4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('user', sa.Column('push_token', sa.String(length=255), nullable=True))
+
+    op.create_table(
+        'push_ticket',
+        sa.Column('id', sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column('ticket_id', sa.String(length=64), nullable=False),
+        sa.Column('user_id', sa.Integer(), sa.ForeignKey('user.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('notification_id', sa.Integer(), sa.ForeignKey('notification.id', ondelete='CASCADE'), nullable=True),
+        sa.Column('push_token', sa.String(length=255), nullable=False),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.UniqueConstraint('ticket_id'),
+    )
+    op.create_index('ix_push_ticket_created', 'push_ticket', ['created_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_push_ticket_created', table_name='push_ticket')
+    op.drop_table('push_ticket')
+    op.drop_column('user', 'push_token')
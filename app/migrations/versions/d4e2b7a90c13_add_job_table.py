@@ -0,0 +1,43 @@
+"""add job table
+
+Revision ID: d4e2b7a90c13
+Revises: a3c91e5d7b20
+Create Date: 2026-10-18 11:03:17.284551
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4e2b7a90c13'
+down_revision: Union[str, None] = 'a3c91e5d7b20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'job',
+        sa.Column('id', sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column('kind', sa.String(length=50), nullable=False),
+        sa.Column('payload_json', sa.Text(), nullable=True),
+        sa.Column('status', sa.String(length=16), server_default=sa.text("'queued'"), nullable=False),
+        sa.Column('attempts', sa.Integer(), server_default=sa.text("0"), nullable=False),
+        sa.Column('max_attempts', sa.Integer(), server_default=sa.text("5"), nullable=False),
+        sa.Column('run_after', sa.DateTime(), nullable=False),
+        sa.Column('locked_by', sa.String(length=64), nullable=True),
+        sa.Column('locked_at', sa.DateTime(), nullable=True),
+        sa.Column('last_error', sa.Text(), nullable=True),
+        sa.Column('result_json', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), server_default=sa.func.now(), nullable=False),
+    )
+    op.create_index('ix_job_status_run_after', 'job', ['status', 'run_after'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_job_status_run_after', table_name='job')
+    op.drop_table('job')
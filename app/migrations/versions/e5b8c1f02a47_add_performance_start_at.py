@@ -0,0 +1,37 @@
+"""add performance.start_at
+
+Revision ID: e5b8c1f02a47
+Revises: d4e2b7a90c13
+Create Date: 2026-10-18 14:20:41.510327
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5b8c1f02a47'
+down_revision: Union[str, None] = 'd4e2b7a90c13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # date + time 으로 DB 가 계산하는 생성 컬럼 (기존 행도 ADD COLUMN 시점에 채워짐, 이후 Core/raw SQL 쓰기에도 항상 동기화)
+    bind = op.get_bind()
+    if bind.dialect.name == 'mysql':
+        op.add_column('performance', sa.Column('start_at', sa.DateTime(), sa.Computed("TIMESTAMP(`date`, `time`)", persisted=True)))
+    else:
+        # sqlite 는 ALTER TABLE 로 STORED 생성 컬럼을 추가할 수 없음 → VIRTUAL (인덱스는 가능)
+        op.add_column('performance', sa.Column('start_at', sa.DateTime(), sa.Computed("datetime(date || ' ' || time)", persisted=False)))
+
+    op.create_index('ix_performance_start_at', 'performance', ['start_at', 'id'], unique=False)
+    op.create_index('ix_performance_venue_start_at', 'performance', ['venue_id', 'start_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_performance_venue_start_at', table_name='performance')
+    op.drop_index('ix_performance_start_at', table_name='performance')
+    op.drop_column('performance', 'start_at')
@@ -0,0 +1,41 @@
+"""add ngram fulltext indexes for search
+
+Revision ID: f1c7a2d93b54
+Revises: e5b8c1f02a47
+Create Date: 2026-10-18 15:02:09.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f1c7a2d93b54'
+down_revision: Union[str, None] = 'e5b8c1f02a47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# app/crud/search.py FULLTEXT_INDEXES 와 동일하게 유지
+FULLTEXT_INDEXES = [
+    ('performance', 'ft_performance_title', ('title',)),
+    ('venue', 'ft_venue_name_address', ('name', 'address')),
+    ('artist', 'ft_artist_name', ('name',)),
+]
+
+
+def upgrade() -> None:
+    # FULLTEXT + ngram 파서는 MySQL(InnoDB) 전용. 다른 DB는 LIKE fallback 사용
+    if op.get_bind().dialect.name != 'mysql':
+        return
+    for table, name, cols in FULLTEXT_INDEXES:
+        col_list = ', '.join(f'`{c}`' for c in cols)
+        op.execute(f"ALTER TABLE `{table}` ADD FULLTEXT INDEX `{name}` ({col_list}) WITH PARSER ngram")
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'mysql':
+        return
+    for table, name, _ in FULLTEXT_INDEXES:
+        op.drop_index(name, table_name=table)
@@ -5,12 +5,16 @@ from .mood import MoodRecommendation
 
 from .artist import Artist
 from .notification import Notification
+from .push_ticket import PushTicket
+from .job import Job
+from .crawl_state import CrawlAccount, CrawlPost
 from .performance_artist import PerformanceArtist
 from .performance import Performance
 from .user_artist_ticketalarm import UserArtistTicketAlarm
 from .user_favorite_artist import UserFavoriteArtist
 from .user_favorite_performance import UserFavoritePerformance
 from .user_performance_ticketalarm import UserPerformanceTicketAlarm
+from .user_recommendation import UserRecommendation
 from .user import User
 from .venue import Venue
 
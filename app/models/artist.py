@@ -6,7 +6,7 @@ class Artist(Base):
     __tablename__ = "artist"
 
     id = Column(Integer, primary_key=True, index=True)
-    name = Column(String(100), nullable=False, index=True)
+    name = Column(String(100), nullable=False, index=True, unique=True)  # 자연 키 (bulk import upsert 기준)
     image_url = Column(String(300), nullable=True)
     spotify_url = Column(String(300), nullable=True)
     instagram_account = Column(String(100), nullable=True)
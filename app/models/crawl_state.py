@@ -0,0 +1,43 @@
+# app/models/crawl_state.py
+# 인스타그램 크롤러 상태 (기존 account_list.json / previous_posts.json / today_new_posts.json 대체)
+from sqlalchemy import Boolean, Column, DateTime, Index, Integer, String, Text, func, text
+from app.database import Base
+
+
+class CrawlAccount(Base):
+    """크롤링 대상 계정 + 마지막으로 본 게시물 상태"""
+    __tablename__ = "crawl_account"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    account = Column(String(100), nullable=False, unique=True)  # 인스타그램 계정 (@ 없이)
+    is_active = Column(Boolean, nullable=False, server_default=text("1"), default=True)
+
+    last_shortcode = Column(String(100), nullable=True)     # 마지막으로 처리한 최신 게시물
+    fingerprint = Column(String(40), nullable=True)        # 프로필 상단 게시물 목록 해시 (같으면 변화 없음)
+    last_checked_at = Column(DateTime, nullable=True)
+    last_changed_at = Column(DateTime, nullable=True)      # 새 게시물을 마지막으로 찾은 시각
+    fail_count = Column(Integer, nullable=False, server_default=text("0"), default=0)  # 연속 실패 횟수
+    last_error = Column(String(255), nullable=True)
+
+    created_at = Column(DateTime, nullable=False, server_default=func.now())
+    updated_at = Column(DateTime, nullable=False, server_default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        Index("ix_crawl_account_active_checked", "is_active", "last_checked_at"),  # 확인할 계정 조회용
+    )
+
+
+class CrawlPost(Base):
+    """크롤러가 찾은 새 게시물 (공연 정보 추출 전 원본)"""
+    __tablename__ = "crawl_post"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    account = Column(String(100), nullable=False)
+    shortcode = Column(String(100), nullable=False, unique=True)
+    text = Column(Text, nullable=True)
+    image_url = Column(String(1000), nullable=True)
+    found_at = Column(DateTime, nullable=False, server_default=func.now())
+
+    __table_args__ = (
+        Index("ix_crawl_post_found_at", "found_at"),
+    )
@@ -0,0 +1,35 @@
+# app/models/job.py
+from sqlalchemy import Column, Integer, String, Text, DateTime, Index, func, text
+from app.database import Base
+import datetime
+
+# status: queued → running → done / failed (재시도 가능하면 다시 queued)
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_DONE = "done"
+JOB_FAILED = "failed"
+
+class Job(Base):
+    """요청 경로 밖에서 처리할 작업 큐 (python -m app.worker 가 소비)"""
+    __tablename__ = "job"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    kind = Column(String(50), nullable=False)
+    payload_json = Column(Text, nullable=True)
+
+    status = Column(String(16), nullable=False, server_default=text("'queued'"), default=JOB_QUEUED)
+    attempts = Column(Integer, nullable=False, server_default=text("0"), default=0)
+    max_attempts = Column(Integer, nullable=False, server_default=text("5"), default=5)
+    run_after = Column(DateTime, nullable=False, default=datetime.datetime.utcnow)
+
+    locked_by = Column(String(64), nullable=True)
+    locked_at = Column(DateTime, nullable=True)
+    last_error = Column(Text, nullable=True)
+    result_json = Column(Text, nullable=True)
+
+    created_at = Column(DateTime, nullable=False, server_default=func.now())
+    updated_at = Column(DateTime, nullable=False, server_default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        Index("ix_job_status_run_after", "status", "run_after"),  # claim 쿼리용
+    )
@@ -21,6 +21,8 @@ class Notification(Base):
 
     
     payload_json = Column(String(64), nullable=True)
+    # bulk insert 1회 식별자: INSERT IGNORE 후 재조회 때 동시 dispatch가 넣은 행을 제외 (푸시 중복 방지)
+    dispatch_token = Column(String(32), nullable=True)
 
     is_read = Column(Boolean, nullable=False, server_default=text("0"))
     created_at = Column(DateTime, nullable=False, server_default=func.now())
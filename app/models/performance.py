@@ -1,8 +1,26 @@
-from sqlalchemy import Column, Integer, String, DateTime, Float, ForeignKey, Boolean, Text, Table, Date, Time
+from sqlalchemy import Column, Integer, String, DateTime, Float, ForeignKey, Boolean, Text, Table, Date, Time, Index, Computed
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import relationship
+from sqlalchemy.sql.expression import FunctionElement
 from app.database import Base
 import datetime
 
+
+class start_at_expr(FunctionElement):
+    """date + time → DATETIME (생성 컬럼 식, DB별로 컴파일)"""
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(start_at_expr)
+def _start_at_expr_mysql(element, compiler, **kw):
+    return "TIMESTAMP(`date`, `time`)"
+
+
+@compiles(start_at_expr, "sqlite")
+def _start_at_expr_sqlite(element, compiler, **kw):
+    return "datetime(date || ' ' || time)"
+
 class Performance(Base):
     __tablename__ = "performance"
 
@@ -11,14 +29,26 @@ class Performance(Base):
     venue_id = Column(Integer, ForeignKey("venue.id"), nullable=False)
     date = Column(Date, nullable=False)  # YYYY-MM-DD
     time = Column(Time, nullable=False)  # HH:MM
+    # date+time (KST 벽시계, naive). 예정/지난 공연 범위 조회용
+    # DB 생성 컬럼 → ORM 을 거치지 않는 UPDATE/INSERT(Core, 콘솔 SQL)도 항상 date/time 과 일치. 직접 쓰면 안 됨
+    start_at = Column(DateTime, Computed(start_at_expr(), persisted=True))
     ticket_open_date = Column(Date, nullable=True)
     ticket_open_time = Column(Time, nullable=True)
     price = Column(String(200), nullable=False)
     image_url = Column(String(300), nullable=True)
     created_at = Column(DateTime, nullable=False, default=datetime.datetime.utcnow)
     updated_at = Column(DateTime, nullable=False, default=datetime.datetime.utcnow, onupdate=datetime.datetime.utcnow)
-    shortcode = Column(String(100), nullable=True) # 중복 확인용
+    shortcode = Column(String(100), nullable=True, index=True) # 중복 확인용 (일괄 등록/크롤러가 IN 조회)
     detail_url = Column(String(300), nullable=True) # 예매 링크 
+    like_count = Column(Integer, nullable=False, default=0, server_default="0")  # 찜 수 (찜/찜 취소 때 증감)
+    trending_score = Column(Float, nullable=False, default=0.0, server_default="0")  # 시간 감쇠 인기 점수 (배치 재계산)
+
+    __table_args__ = (
+        Index("ix_performance_start_at", "start_at", "id"),
+        Index("ix_performance_venue_start_at", "venue_id", "start_at"),
+        Index("ix_performance_like_count", "like_count", "id"),
+        Index("ix_performance_trending_score", "trending_score", "id"),
+    )
 
     venue = relationship("Venue", back_populates="performances")
     artists = relationship("Artist", secondary="performance_artist", back_populates="performances")
@@ -32,3 +62,11 @@ class Performance(Base):
         back_populates="performance",
         cascade="all, delete-orphan"
     )
+
+
+def combine_start_at(d, t):
+    """date + time → start_at 과 같은 값을 파이썬에서 계산 (time 없으면 00:00). 컬럼 값은 DB 가 채움"""
+    if d is None:
+        return None
+    return datetime.datetime.combine(d, t or datetime.time(0, 0))
+
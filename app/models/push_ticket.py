@@ -0,0 +1,18 @@
+# app/models/push_ticket.py
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index, func
+from app.database import Base
+
+class PushTicket(Base):
+    """Expo push ticket → 나중에 getReceipts로 전달 결과 확인용"""
+    __tablename__ = "push_ticket"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    ticket_id = Column(String(64), nullable=False, unique=True)
+    user_id = Column(Integer, ForeignKey("user.id", ondelete="CASCADE"), nullable=False)
+    notification_id = Column(Integer, ForeignKey("notification.id", ondelete="CASCADE"), nullable=True)
+    push_token = Column(String(255), nullable=False)  # 전송 당시 토큰 (재등록된 토큰은 지우지 않도록)
+    created_at = Column(DateTime, nullable=False, server_default=func.now())
+
+    __table_args__ = (
+        Index("ix_push_ticket_created", "created_at"),
+    )
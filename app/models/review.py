@@ -11,6 +11,7 @@ class Review(Base):
     venue_id = Column(Integer, ForeignKey("venue.id", ondelete="CASCADE"), nullable=False)
     content = Column(Text, nullable=False)
     created_at = Column(DateTime, nullable=False, server_default=func.now())
+    like_count = Column(Integer, nullable=False, default=0, server_default="0")  # 좋아요 수 (좋아요/취소 때 증감)
 
     user = relationship("User", back_populates="reviews")
     venue = relationship("Venue", back_populates="reviews")
@@ -26,6 +26,7 @@ class User(Base):
 
     # 토큰(기존 컬럼)
     refresh_token = Column(String(512), nullable=True)
+    push_token = Column(String(255), nullable=True)  # Expo push token (DeviceNotRegistered 시 NULL)
 
     # --- 상태/감사 필드 ---
     email_verified = Column(Boolean, nullable=False, server_default=text("0"), default=False)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, DateTime, ForeignKey, PrimaryKeyConstraint, Table
+from sqlalchemy import Column, Integer, DateTime, ForeignKey, PrimaryKeyConstraint, Table, Index
 from sqlalchemy.orm import relationship
 from app.database import Base
 import datetime
@@ -8,7 +8,9 @@ class UserFavoritePerformance(Base):
 
     user_id = Column(Integer, ForeignKey("user.id"), primary_key=True)
     performance_id = Column(Integer, ForeignKey("performance.id"), primary_key=True)
+    created_at = Column(DateTime, nullable=True, default=datetime.datetime.utcnow)  # 찜한 시각 (trending 감쇠용, 기존 데이터는 NULL)
     
     __table_args__ = ( # 복합키 설정
         PrimaryKeyConstraint("user_id", "performance_id"),
+        Index("ix_user_favorite_performance_created_at", "created_at"),
     )
\ No newline at end of file
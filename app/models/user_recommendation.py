@@ -0,0 +1,17 @@
+# app/models/user_recommendation.py
+from sqlalchemy import Column, Integer, Float, DateTime, ForeignKey, Index, PrimaryKeyConstraint, func
+from app.database import Base
+
+class UserRecommendation(Base):
+    """오프라인 배치(item-item CF)로 미리 계산한 사용자별 추천 공연 top-N"""
+    __tablename__ = "user_recommendation"
+
+    user_id = Column(Integer, ForeignKey("user.id", ondelete="CASCADE"), nullable=False)
+    performance_id = Column(Integer, ForeignKey("performance.id", ondelete="CASCADE"), nullable=False)
+    score = Column(Float, nullable=False)
+    computed_at = Column(DateTime, nullable=False, server_default=func.now())
+
+    __table_args__ = (
+        PrimaryKeyConstraint("user_id", "performance_id"),
+        Index("ix_user_recommendation_user_score", "user_id", "score"),
+    )
@@ -1,5 +1,5 @@
 # models/venue.py
-from sqlalchemy import Column, Integer, String, Float
+from sqlalchemy import Column, Integer, String, Float, UniqueConstraint
 from sqlalchemy.orm import relationship
 from app.database import Base
 
@@ -10,12 +10,16 @@ class Venue(Base):
     name = Column(String(100), nullable=False)
     address = Column(String(200), nullable=False)
     region = Column(String(100), nullable=False)
-    instagram_account = Column(String(100), nullable=False)
+    instagram_account = Column(String(100), nullable=False)  # 자연 키 (bulk import upsert 기준)
     image_url = Column(String(200))
     latitude = Column(Float, nullable=False)
     longitude = Column(Float, nullable=False)
     description = Column(String(200), nullable=True)
 
+    __table_args__ = (
+        UniqueConstraint("instagram_account", name="uq_venue_instagram_account"),
+    )
+
     performances = relationship("Performance", back_populates="venue")
 
     reviews = relationship(
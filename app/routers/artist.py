@@ -15,12 +15,14 @@ router = APIRouter(prefix="/artist", tags=["Artist"])
 def read_artist_list(
     page: int = Query(1, ge=1),
     size: int = Query(20, ge=1),
+    cursor: Optional[str] = Query(None, description="이전 응답의 nextCursor"),
+    count: bool = Query(True, description="false면 COUNT 생략"),
     db: Session = Depends(get_db),
     user: Optional[User] = Depends(get_current_user_optional)
 ):
     try:
         user_id = user.id if user else None
-        return get_artist_list(db, user_id, page, size)
+        return get_artist_list(db, user_id, page, size, cursor=cursor, with_count=count)
     except HTTPException:
         raise
     except Exception as e:
@@ -21,6 +21,7 @@ from app.config import settings as app_settings
 # utils
 from app.utils.auth import auth as auth_utils
 from app.utils.auth.kakao import get_kakao_access_token, get_kakao_user_info, kakao_unlink
+from app.utils.auth.user_cache import invalidate_user_cache
 
 # models
 from app.models.user import User
@@ -31,6 +32,10 @@ from app.models.stamp import Stamp
 from app.models.user_favorite_artist import UserFavoriteArtist
 from app.models.user_favorite_performance import UserFavoritePerformance
 from app.models.user_performance_ticketalarm import UserPerformanceTicketAlarm
+from app.models.user_recommendation import UserRecommendation
+
+# crud
+from app.crud.like import release_user_likes
 
 router = APIRouter(prefix="/auth", tags=["Auth"])
 
@@ -257,6 +262,7 @@ def logout_user(
 ):
     current_user.refresh_token = None
     db.commit()
+    invalidate_user_cache(current_user.id)   # refresh_token 이 이미 None 이면 UPDATE 이벤트가 없으므로 직접
 
     resp = JSONResponse({"message": "로그아웃되었습니다."})
     delete_kw = _delete_cookie_kwargs()
@@ -299,10 +305,12 @@ async def withdraw_user(
     _del(UserArtistTicketAlarm)
     _del(UserPerformanceTicketAlarm)
     _del(UserFavoriteArtist)
+    release_user_likes(db, current_user.id)   # 공연/리뷰 like_count 차감
     _del(UserFavoritePerformance)
     _del(ReviewLike)
     _del(Stamp)
     _del(Review)
+    _del(UserRecommendation)
 
     # 3) 유저 삭제
     db.flush()
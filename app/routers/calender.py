@@ -4,7 +4,7 @@ from typing import Optional, List
 from datetime import date
 from fastapi.responses import JSONResponse
 
-from app.database import get_db
+from app.utils.dependency import get_read_db   # 조회 전용 → read replica
 from app.schemas.calendar import (
     CalendarSummaryResponse,
     CalendarPerformanceListResponse,
@@ -14,16 +14,18 @@ from app.crud.calendar import (
     get_calendar_summary_by_month,
     get_performances_by_date,
 )
+from app.services.response_cache import CachedRoute, cache_response
 
-router = APIRouter(prefix="/calendar", tags=["Calendar"])
+router = APIRouter(prefix="/calendar", tags=["Calendar"], route_class=CachedRoute)
 
 
 @router.get("/summary", response_model=CalendarSummaryResponse)
+@cache_response(ttl=300, tags=["performance", "venue"])
 def read_calendar_summary(
     year: int = Query(...),
     month: int = Query(...),
     region: Optional[List[str]] = Query(None),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     days = get_calendar_summary_by_month(db, year, month, region)
     return {
@@ -36,7 +38,7 @@ def read_calendar_summary(
 def read_performances_by_date(
     date: date = Query(...),
     region: Optional[List[str]] = Query(None),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     try:
         performances = get_performances_by_date(db, date, region)
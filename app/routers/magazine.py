@@ -14,10 +14,12 @@ from app.schemas.magazine import (
     MagazineListItem,
     MagazineDetailResponse,
 )
+from app.services.response_cache import CachedRoute, cache_response
 
-router = APIRouter()
+router = APIRouter(route_class=CachedRoute)
 
 @router.get("/magazine", response_model=List[MagazineListItem])
+@cache_response(ttl=600, tags=["magazine", "magazine_block"])
 def list_magazines(
     limit: Optional[int] = Query(None, ge=1, le=50),
     page: Optional[int] = Query(None, ge=1),
@@ -35,6 +37,7 @@ def list_magazines(
     
 
 @router.get("/magazine/{magazine_id}", response_model=MagazineDetailResponse)
+@cache_response(ttl=600, tags=["magazine", "magazine_block"])
 def get_magazine_detail(
     magazine_id: int,
     db: Session = Depends(get_db),
@@ -7,10 +7,12 @@ import traceback
 from app.database import get_db
 from app.models.mood import Mood
 from app.crud import mood as mood_crud
+from app.services.response_cache import CachedRoute, cache_response
 
-router = APIRouter(prefix="/mood", tags=["mood"])
+router = APIRouter(prefix="/mood", tags=["mood"], route_class=CachedRoute)
 
 @router.get("")  # ← response_model 제거 (원시 JSON 반환)
+@cache_response(ttl=600, tags=["mood"])
 def list_moods(db: Session = Depends(get_db)):
     """
     무드 전체 목록 (원시 JSON)
@@ -20,6 +22,7 @@ def list_moods(db: Session = Depends(get_db)):
     return [{"id": m.id, "name": m.name} for m in moods]
 
 @router.get("/{mood_id}/performances")  # ← response_model 제거 (원시 JSON 반환)
+@cache_response(ttl=300, tags=["mood", "mood_recommendation", "performance", "venue"])
 def list_performances_by_mood(
     mood_id: int,
     limit: int = Query(12, ge=1, le=50, description="가져올 개수(기본 12, 최대 50)"),
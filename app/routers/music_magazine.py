@@ -14,10 +14,12 @@ from app.schemas.music_magazine import (
     MusicMagazineDetailResponse,
     MusicMagazineBlockOut,
 )
+from app.services.response_cache import CachedRoute, cache_response
 
-router = APIRouter()
+router = APIRouter(route_class=CachedRoute)
 
 @router.get("", response_model=List[MusicMagazineListItem])
+@cache_response(ttl=600, tags=["music_magazine", "music_magazine_block"])
 def list_music_magazines(
     limit: Optional[int] = Query(None, ge=1, le=50),
     page: Optional[int] = Query(None, ge=1),
@@ -29,6 +31,7 @@ def list_music_magazines(
     return items
 
 @router.get("/{magazine_id}", response_model=MusicMagazineDetailResponse)
+@cache_response(ttl=600, tags=["music_magazine", "music_magazine_block"])
 def get_music_magazine_detail(
     magazine_id: int,
     db: Session = Depends(get_db),
@@ -1,16 +1,20 @@
 # app/routers/nearby.py
 
 from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 import datetime, pytz
 from dateutil import parser
 
 # 의존성
-from app.database import get_db
+from app.utils.dependency import get_async_read_db   # 비동기 조회 세션 (read replica, await db.run_sync 로 기존 crud 실행)
+from app.utils.dependency import get_read_db         # 인메모리 인덱스(공연장 공간 인덱스/타일) 라우트: 재빌드가 CPU 작업이라
+                                                     # run_sync(이벤트 루프 스레드) 대신 sync def → 스레드풀에서 실행
 
 # crud
 from app.crud import nearby as nearby_crud
+from app.services import map_tiles
 
 # schemas
 from app.schemas import nearby as nearby_schema
@@ -25,31 +29,45 @@ router = APIRouter(prefix="/nearby", tags=["Nearby"])
 def get_nearby_venues(
     lat: float = Query(..., description="사용자 위도"),
     lng: float = Query(..., description="사용자 경도"),
-    radius: float = Query(3.0, description="검색 반경 (km)"),
-    db: Session = Depends(get_db)
+    radius: float = Query(3.0, gt=0, le=50, description="검색 반경 (km)"),
+    limit: Optional[int] = Query(None, ge=1, le=200, description="가까운 순 최대 개수"),
+    db: Session = Depends(get_read_db)
 ):
-    venues = nearby_crud.get_nearby_venues(db, lat, lng, radius)
+    venues = nearby_crud.get_nearby_venues(db, lat, lng, radius, limit)
     return venues
 
 # -------------------------------
 # 지도 영역 내 공연장들의 예정 공연 조회
 # -------------------------------
 @router.post("/performance", response_model=List[nearby_schema.NearbyPerformanceResponse])
-def get_performances_in_bounds(
+async def get_performances_in_bounds(
     request: nearby_schema.PerformanceBoundsRequest,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_read_db)
 ):
-    return nearby_crud.get_performances_in_bounds(db, request)
+    return await db.run_sync(nearby_crud.get_performances_in_bounds, request)
+
+
+# -------------------------------
+# 지도 영역 클러스터 (줌 레벨별 타일 캐시)
+# -------------------------------
+@router.post("/performance/cluster", response_model=nearby_schema.ClusterResponse)
+def get_performance_clusters(
+    request: nearby_schema.ClusterRequest,
+    db: Session = Depends(get_read_db)
+):
+    return map_tiles.get_clusters(
+        db, request.sw_lat, request.sw_lng, request.ne_lat, request.ne_lng, request.zoom
+    )
 
 
 # -------------------------------
 # 특정 공연장의 예정 공연 조회
 # -------------------------------
 @router.get("/venue/{venue_id}/performance", response_model=List[nearby_schema.VenuePerformanceItem])
-def get_venue_performances(
+async def get_venue_performances(
     venue_id: int,
     after: str = Query(None),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_read_db)
 ):
     kst = pytz.timezone('Asia/Seoul')
     if after:
@@ -61,7 +79,7 @@ def get_venue_performances(
     else:
         after_time = datetime.datetime.now(kst)
 
-    return nearby_crud.get_performances_by_venue(db, venue_id, after_time)
+    return await db.run_sync(nearby_crud.get_performances_by_venue, venue_id, after_time)
 
 
 # 현재 위치 기준 지도 리센터
@@ -2,12 +2,12 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 from typing import List, Optional, Union, Dict, Any
 from pydantic import BaseModel
-from datetime import datetime
+from datetime import datetime, timezone
 import json
 
 from app.routers import notification as notification_router
 from app.database import get_db
-from app.utils.dependency import get_current_user
+from app.utils.dependency import get_current_user, get_current_user_id
 from app.models.notification import Notification
 
 router = APIRouter(prefix="/notifications", tags=["Notification"])
@@ -37,10 +37,10 @@ def _parse_payload(payload_json: Optional[str]) -> Optional[Union[Dict[str, Any]
 
 # ====== Routes ======
 @router.get("", response_model=List[NotificationRead])
-def list_notifications(db: Session = Depends(get_db), user=Depends(get_current_user)):
+def list_notifications(db: Session = Depends(get_db), user_id: int = Depends(get_current_user_id)):
     rows: List[Notification] = (
         db.query(Notification)
-        .filter(Notification.user_id == user.id,  Notification.is_read == False )
+        .filter(Notification.user_id == user_id,  Notification.is_read == False )
         .order_by(Notification.created_at.desc())
         .limit(100)
         .all()
@@ -79,9 +79,21 @@ def remove(nid: int, db: Session = Depends(get_db), user=Depends(get_current_use
 
 # === 스케줄/리컨실/강제 트리거 ===
 @router.post("/dispatch-due")
-def dispatch_due(db: Session = Depends(get_db)):
+def dispatch_due(
+    mode: str = Query("set", pattern="^(set|scan)$", description="set: SQL 기반 선별 / scan: 기존 전체 스캔"),
+    lookback_days: int = Query(7, ge=1, le=60, description="set 모드에서 재스캔할 과거 일수"),
+    db: Session = Depends(get_db),
+):
     from app.services.notify import dispatch_scheduled_notifications
-    return dispatch_scheduled_notifications(db)
+    return dispatch_scheduled_notifications(db, mode=mode, lookback_days=lookback_days)
+
+@router.post("/push-receipts")
+def check_push_receipts(
+    min_age_minutes: int = Query(15, ge=0, description="전송 후 이 시간(분)이 지난 ticket만 조회"),
+    db: Session = Depends(get_db),
+):
+    from app.services.notify import poll_push_receipts
+    return poll_push_receipts(db, min_age_minutes=min_age_minutes)
 
 @router.post("/reconcile-new-performances")
 def reconcile_new_performances(hours: int = 72, db: Session = Depends(get_db)):
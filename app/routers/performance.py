@@ -1,40 +1,83 @@
 from sqlalchemy import text
-from fastapi import APIRouter, HTTPException, Depends, Query, status
+import json
+from fastapi import APIRouter, HTTPException, Depends, Query, Request, status
 from sqlalchemy.orm import Session
 from typing import Optional, List
 from datetime import datetime, date
 from datetime import time as dt_time
 from pydantic import BaseModel, Field
 from sqlalchemy import text  # ← 추가
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.database import get_db
 from app.schemas.performance import (
     PerformanceListResponse,
     PerformanceListItem,
     PerformanceDetailResponse,
     ArtistSummary,
+    PerformanceBulkResponse,
 )
 from app.crud import performance as performance_crud
+from app.crud.user_state import resolve_performance_state
+from app.utils.pagination import total_pages
 from app.models.user import User
 from app.models.performance import Performance
 from app.models.user_performance_ticketalarm import UserPerformanceTicketAlarm  # ✅ 추가
-from app.utils.dependency import get_current_user_optional, get_current_user
+from app.utils.dependency import get_current_user_optional, get_current_user, get_async_read_db
 from app.services.notify import notify_artist_followers_on_new_performance
+from app.services.jobs import enqueue_job
+from app.services.performance_ingest import MAX_BATCH, ingest_performances, parse_items
+from app.utils.query_stats import query_budget
 
 router = APIRouter(prefix="/performance", tags=["Performance"])
 
 
+# 목록/trending 은 비동기 세션 (기존 crud 는 run_sync 안에서 그대로 실행)
 @router.get("", response_model=PerformanceListResponse)
-def get_performance_list(
+@query_budget(3)
+async def get_performance_list(
     region: Optional[List[str]] = Query(None),
     sort: str = Query("date", pattern="^(date|created_at|likes)$"),
     page: int = Query(1, ge=1),
     size: int = Query(10, ge=1),
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = Query(None, description="이전 응답의 nextCursor (지정 시 page 무시, COUNT 생략)"),
+    count: bool = Query(True, description="false면 COUNT 생략 (totalPages=null)"),
+    db: AsyncSession = Depends(get_async_read_db),
 ):
-    performances, total = performance_crud.get_performances_only_supposed(db, region, sort, page, size)
+    return await db.run_sync(_performance_list, region, sort, page, size, cursor, count)
+
+def _performance_list(db: Session, region, sort, page, size, cursor, count):
+    result = performance_crud.get_performances_only_supposed(
+        db, region, sort, page, size, cursor=cursor, with_count=count
+    )
+    return _list_response(result, size)
+
+
+@router.get("/trending", response_model=PerformanceListResponse)
+@query_budget(3)
+async def get_trending_performance_list(
+    region: Optional[List[str]] = Query(None),
+    page: int = Query(1, ge=1),
+    size: int = Query(10, ge=1),
+    cursor: Optional[str] = Query(None, description="이전 응답의 nextCursor (지정 시 page 무시, COUNT 생략)"),
+    count: bool = Query(True, description="false면 COUNT 생략 (totalPages=null)"),
+    db: AsyncSession = Depends(get_async_read_db),
+):
+    """최근 찜이 몰린 예정 공연 (시간 감쇠 점수순, 점수는 배치로 갱신)"""
+    return await db.run_sync(_trending_list, region, page, size, cursor, count)
+
+def _trending_list(db: Session, region, page, size, cursor, count):
+    result = performance_crud.get_trending_performances(
+        db, region, page, size, cursor=cursor, with_count=count
+    )
+    return _list_response(result, size)
+
+
+def _list_response(result, size: int) -> PerformanceListResponse:
     return PerformanceListResponse(
-        page=page,
-        totalPages=(total + size - 1) // size,
+        page=result.page,
+        totalPages=total_pages(result.total, size),
+        nextCursor=result.next_cursor,
+        hasNext=result.has_next,
         performances=[
             PerformanceListItem(
                 id=p.id,
@@ -44,7 +87,7 @@ def get_performance_list(
                 time=p.time.strftime("%H:%M") if p.time else None,
                 thumbnail=p.image_url,
             )
-            for p in performances
+            for p in result.items
         ],
     )
 
@@ -61,12 +104,8 @@ def get_performance_detail(
 
     artists = performance_crud.get_performance_artists(db, id)
 
-    is_liked = is_alarmed = False
-    if user:
-        is_liked = performance_crud.is_user_liked_performance(db, user.id, id)
-        is_alarmed = performance_crud.is_user_alarmed_performance(db, user.id, id)
-
-    like_count = performance_crud.get_performance_like_count(db, id)
+    # 찜/알림 여부 (쿼리 최대 1번), 좋아요 수는 performance.like_count
+    state = resolve_performance_state(db, user.id if user else None, [id])
     dt_val = datetime.combine(performance.date, performance.time or dt_time(0, 0))
 
     return PerformanceDetailResponse(
@@ -82,13 +121,13 @@ def get_performance_detail(
         shortcode=performance.shortcode,
         detailLink=performance.detail_url,
         posterUrl=performance.image_url,
-        likeCount=like_count,
-        isLiked=is_liked,
-        isAlarmed=is_alarmed,
+        likeCount=performance.like_count or 0,
+        isLiked=state.is_liked(id),
+        isAlarmed=state.is_alarmed(id),
     )
 
 
-# ====== 공연 생성 → 커밋 직후 알림 발송 ======
+# ====== 공연 생성 → 알림 작업 등록 ======
 class PerformanceCreate(BaseModel):
     title: str
     venue_id: int
@@ -108,36 +147,61 @@ def create_performance(
     db: Session = Depends(get_db),
     user: User = Depends(get_current_user),
 ):
-    # 1) 공연 생성 (CRUD 내부에서 commit X, flush O 가정)
+    # 1) 공연 생성 (CRUD 내부에서 commit X, flush O)
     perf = performance_crud.create_performance(db, body)
 
     # 2) 아티스트 매핑
-    body_artist_ids = list(set(body.artist_ids or []))
-    try:
-        if body_artist_ids and hasattr(performance_crud, "set_performance_artists"):
-            performance_crud.set_performance_artists(db, perf.id, body_artist_ids)
-    except Exception as e:
-        print(f"[perf] set_performance_artists error: {e}")
+    body_artist_ids = sorted(set(body.artist_ids or []))
+    if body_artist_ids:
+        performance_crud.set_performance_artists(db, perf.id, body_artist_ids)
+
+    # 3) 새 공연 알림 fan-out은 작업 큐로 (공연 INSERT와 같은 커밋)
+    #    → 팔로워 수와 무관하게 응답 시간 일정, 실제 처리는 python -m app.worker
+    job_id = None
+    if body_artist_ids:
+        job = enqueue_job(
+            db, "fanout_new_performance",
+            {"performance_id": perf.id, "artist_ids": body_artist_ids},
+            commit=False,
+        )
+        job_id = job.id
 
-    # 3) 커밋/리프레시로 관계 확정
     db.commit()
-    db.refresh(perf)
+    return {"id": perf.id, "notifyJobId": job_id}
 
-    # 4) ORM에서 다시 읽어 최종 artist_ids 보정(견고)
-    db_artist_ids = [a.id for a in getattr(perf, "artists", [])]
-    final_artist_ids = sorted(set(body_artist_ids) | set(db_artist_ids))
 
-    # 5) 새 공연 알림 발송 (실패해도 본 요청은 성공)
-    if final_artist_ids:
-        try:
-            res = notify_artist_followers_on_new_performance(
-                db, performance_id=perf.id, artist_ids=final_artist_ids
-            )
-            print(f"[perf] notify result: {res}")
-        except Exception as e:
-            print(f"[notify] new_performance_by_artist failed for perf={perf.id}: {e}")
+# ====== 공연 일괄 등록 ======
+# body: JSON 배열 / {"performances": [...]} / NDJSON (Content-Type: application/x-ndjson, 한 줄에 공연 하나)
+# 한 요청 = 한 트랜잭션 (공연 + 아티스트 매핑 + 알림 fan-out 작업 1건). 큰 파일은 python -m app.scripts.ingest_performances
+async def _bulk_records(request: Request) -> list:
+    raw = await request.body()
+    try:
+        if "ndjson" in request.headers.get("content-type", ""):
+            records = [json.loads(line) for line in raw.decode("utf-8").splitlines() if line.strip()]
+        else:
+            records = json.loads(raw or b"[]")
+            if isinstance(records, dict):
+                records = records.get("performances")
+    except (UnicodeDecodeError, json.JSONDecodeError) as e:
+        raise HTTPException(status_code=400, detail=f"invalid JSON: {e}")
+    if not isinstance(records, list):
+        raise HTTPException(status_code=400, detail="body must be a JSON array, {\"performances\": [...]} or NDJSON")
+    if len(records) > MAX_BATCH:
+        raise HTTPException(status_code=413, detail=f"최대 {MAX_BATCH}건까지 한 번에 등록할 수 있어요.")
+    return records
+
 
-    return {"id": perf.id}
+@router.post("/bulk", response_model=PerformanceBulkResponse, status_code=status.HTTP_201_CREATED)
+@query_budget(20)
+def create_performances_bulk(
+    records: list = Depends(_bulk_records),
+    createArtists: bool = Query(False, description="artist_names 중 없는 아티스트는 새로 생성"),
+    notify: bool = Query(True, description="false면 새 공연 알림 작업 등록 안 함"),
+    db: Session = Depends(get_db),
+    user: User = Depends(get_current_user),
+):
+    items, errors = parse_items(records)
+    return ingest_performances(db, items, create_missing_artists=createArtists, notify=notify, errors=errors)
 
 
 # ====== 예매 오픈 알림 토글 API ======
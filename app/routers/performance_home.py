@@ -1,11 +1,11 @@
 # app/router/performance/home.py
+# 앱 열 때마다 호출되는 홈 화면 API → 비동기 세션 (await db.run_sync 로 기존 crud 실행)
 from fastapi import APIRouter, Depends, Query, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from datetime import date
 
-from app.database import get_db
-from app.utils.dependency import get_current_user
-from app.models.user import User
+from app.utils.dependency import get_async_read_db, get_current_user_id
 
 from app.schemas.performance import (
     PerformanceHomeItem,
@@ -16,40 +16,53 @@ from app.schemas.performance import (
 )
 
 import app.crud.performance as crud
+from app.services.response_cache import CachedRoute, cache_response
+from app.utils.query_stats import query_budget
+
+router = APIRouter(prefix="/performance/home", tags=["Performance Home"], route_class=CachedRoute)
+
+
+def _home_items(performances):
+    return [
+        PerformanceHomeItem(
+            id=p.id, title=p.title, date=p.date.isoformat(),
+            time=p.time.strftime("%H:%M"), venue=p.venue.name, thumbnail=p.image_url
+        ) for p in performances
+    ]
 
-router = APIRouter(prefix="/performance/home", tags=["Performance Home"])
 
 @router.get("/today", response_model=PerformanceListResponse)
-def today_performances(db: Session = Depends(get_db)):
-    performances = crud.get_today_performances(db)
-    return {
-        "performances": [
-            PerformanceHomeItem(
-                id=p.id, title=p.title, date=p.date.isoformat(),
-                time=p.time.strftime("%H:%M"), venue=p.venue.name, thumbnail=p.image_url
-            ) for p in performances
-        ]
-    }
+@cache_response(ttl=60, tags=["performance", "venue"])
+@query_budget(2)
+async def today_performances(db: AsyncSession = Depends(get_async_read_db)):
+    return await db.run_sync(_today_performances)
+
+def _today_performances(db: Session):
+    return {"performances": _home_items(crud.get_today_performances(db))}
+
 
 @router.get("/recent", response_model=PerformanceListResponse)
-def recent_performances(limit: int = Query(6, ge=3, le=6), db: Session = Depends(get_db)):
-    performances = crud.get_recent_performances(db, limit)
-    return {
-        "performances": [
-            PerformanceHomeItem(
-                id=p.id, title=p.title, date=p.date.isoformat(),
-                time=p.time.strftime("%H:%M"), venue=p.venue.name, thumbnail=p.image_url
-            ) for p in performances
-        ]
-    }
+@cache_response(ttl=60, tags=["performance", "venue"])
+@query_budget(2)
+async def recent_performances(limit: int = Query(6, ge=3, le=6), db: AsyncSession = Depends(get_async_read_db)):
+    return await db.run_sync(_recent_performances, limit)
+
+def _recent_performances(db: Session, limit: int):
+    return {"performances": _home_items(crud.get_recent_performances(db, limit))}
+
 
 # ✅ 수정된 티켓 오픈 예정 공연 라우터
 @router.get("/ticket-opening", response_model=PerformanceTicketOpenListResponse)
-def ticket_opening_performances(
-    startDate: date = Query(...), endDate: date = Query(...), db: Session = Depends(get_db)
+@cache_response(ttl=300, tags=["performance", "venue"])
+@query_budget(2)
+async def ticket_opening_performances(
+    startDate: date = Query(...), endDate: date = Query(...), db: AsyncSession = Depends(get_async_read_db)
 ):
     if (endDate - startDate).days > 7:
         raise HTTPException(status_code=400, detail="최대 7일까지만 조회할 수 있어요.")
+    return await db.run_sync(_ticket_opening_performances, startDate, endDate)
+
+def _ticket_opening_performances(db: Session, startDate: date, endDate: date):
     performances = crud.get_ticket_opening_performances(db, startDate, endDate)
     return {
         "performances": [
@@ -66,17 +79,17 @@ def ticket_opening_performances(
         ]
     }
 
+
 @router.get("/recommendation", response_model=RecommendationResponse)
-def recommendation_performances(
-    db: Session = Depends(get_db), current_user: User = Depends(get_current_user)
+@query_budget(3)
+async def recommendation_performances(
+    db: AsyncSession = Depends(get_async_read_db), user_id: int = Depends(get_current_user_id)
 ):
-    performances = crud.get_recommendation_performances(db, current_user.id)
+    return await db.run_sync(_recommendation_performances, user_id)
+
+def _recommendation_performances(db: Session, user_id: int):
+    performances = crud.get_recommendation_performances(db, user_id)
     return {
-        "userId": current_user.id,
-        "recommendations": [
-            PerformanceHomeItem(
-                id=p.id, title=p.title, date=p.date.isoformat(),
-                time=p.time.strftime("%H:%M"), venue=p.venue.name, thumbnail=p.image_url
-            ) for p in performances
-        ]
+        "userId": user_id,
+        "recommendations": _home_items(performances),
     }
@@ -5,7 +5,6 @@ from uuid import uuid4
 import os
 from fastapi import APIRouter, Depends, Query, HTTPException, UploadFile, File, Form, status, Request
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import func
 from app.database import get_db
 from app.models.review import Review
 from app.models.review_like import ReviewLike
@@ -13,8 +12,11 @@ from app.models.review_image import ReviewImage
 from app.models.venue import Venue
 from app.models.user import User
 from app.utils.dependency import get_current_user, get_current_user_optional  # 로그인 사용자 (없으면 401)
+from app.utils.dependency import get_read_db   # 목록/미리보기 조회 → read replica
 from app.utils.gcs import upload_to_gcs, delete_from_gcs
 from app.schemas.review import ReviewOut, ReviewListOut,  UserBrief, ReviewImageOut, ReviewCreateIn
+from app.utils.pagination import paginate_query
+from app.crud.like import create_review_like, delete_review_like
 from datetime import datetime, timedelta, timezone
 
 router = APIRouter(prefix="/venue", tags=["Review"])
@@ -47,7 +49,6 @@ def _abs_url(base: str, path: Optional[str]) -> Optional[str]:
 def _serialize_review(
     request: Request,
     r: Review,
-    like_count_map: dict[int, int],
     liked_ids: set[int],
     include_venue: bool = False,
 ) -> dict:
@@ -70,7 +71,7 @@ def _serialize_review(
             "profile_url": _abs_url(base, getattr(r.user, "profile_url", None)),
         },
         "images": [{"image_url": _abs_url(base, img.image_url)} for img in (r.images or [])],
-        "like_count": like_count_map.get(r.id, 0),
+        "like_count": r.like_count or 0,
         "liked_by_me": r.id in liked_ids,
     }
 
@@ -84,17 +85,6 @@ def _serialize_review(
     return data
 
 
-def _review_like_counts(db: Session, review_ids: List[int]) -> dict[int, int]:
-    if not review_ids:
-        return {}
-    rows = (
-        db.query(ReviewLike.review_id, func.count(ReviewLike.id))
-        .filter(ReviewLike.review_id.in_(review_ids))
-        .group_by(ReviewLike.review_id)
-        .all()
-    )
-    return {rid: cnt for rid, cnt in rows}
-
 def _my_liked_set(db: Session, review_ids: List[int], user_id: Optional[int]) -> set[int]:
     if not review_ids or not user_id:
         return set()
@@ -113,7 +103,9 @@ def list_my_reviews(
     page: int = Query(1, ge=1),
     size: int = Query(20, ge=1, le=100),
     order: str = Query("desc"),
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = Query(None, description="이전 응답의 nextCursor"),
+    count: bool = Query(True, description="false면 COUNT 생략"),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ):
     q = (
@@ -121,12 +113,15 @@ def list_my_reviews(
         .options(joinedload(Review.images), joinedload(Review.user))
         .filter(Review.user_id == current_user.id)
     )
-    q = q.order_by(Review.created_at.desc() if order == "desc" else Review.created_at.asc())
-    total = q.count()
-    rows = q.offset((page - 1) * size).limit(size).all()
+    desc = order == "desc"
+    result = paginate_query(
+        q, order=[(Review.created_at, desc), (Review.id, desc)], size=size, page=page,
+        cursor=cursor, with_count=count, sort_key=f"my_{order}",
+        count_query=db.query(Review.id).filter(Review.user_id == current_user.id),
+    )
+    rows = result.items
 
     ids = [r.id for r in rows]
-    like_count_map = _review_like_counts(db, ids)
     liked_ids = _my_liked_set(db, ids, current_user.id)
 
     base = str(request.base_url)
@@ -144,11 +139,14 @@ def list_my_reviews(
                 "profile_url": abs_url(getattr(r.user, "profile_url", None)) if r.user else None,
             },
             "images": [{"image_url": abs_url(im.image_url)} for im in (r.images or [])],
-            "like_count": like_count_map.get(r.id, 0),     # ✅ 총 좋아요 수
+            "like_count": r.like_count or 0,               # ✅ 총 좋아요 수 (review.like_count)
             "liked_by_me": r.id in liked_ids,              # ✅ 내가 눌렀는지
         })
 
-    return ReviewListOut(items=items, total=total, page=page, size=size)
+    return ReviewListOut(
+        items=items, total=result.total, page=result.page, size=size,
+        nextCursor=result.next_cursor, hasNext=result.has_next,
+    )
 
 # ------------ 전체 리뷰 목록 ------------
 @router.get("/reviews/all", response_model=ReviewListOut)
@@ -157,7 +155,9 @@ def list_all_reviews(
     page: int = Query(1, ge=1),
     size: int = Query(20, ge=1, le=100),
     order: str = Query("desc"),
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = Query(None, description="이전 응답의 nextCursor"),
+    count: bool = Query(True, description="false면 COUNT 생략"),
+    db: Session = Depends(get_read_db),
     current_user: Optional[User] = Depends(get_current_user_optional),
 ):
     """
@@ -171,24 +171,23 @@ def list_all_reviews(
         joinedload(Review.venue),
     )
 
-    # 정렬
-    if order == "asc":
-        q = q.order_by(Review.created_at.asc(), Review.id.asc())
-    else:
-        q = q.order_by(Review.created_at.desc(), Review.id.desc())
-
-    # 전체 개수
-    total = db.query(func.count(Review.id)).scalar() or 0
-
-    # 페이지 아이템
-    rows: List[Review] = q.offset((page - 1) * size).limit(size).all()
+    # 정렬 (created_at, id) + keyset cursor
+    desc = order != "asc"
+    result = paginate_query(
+        q, order=[(Review.created_at, desc), (Review.id, desc)], size=size, page=page,
+        cursor=cursor, with_count=count, sort_key="all_desc" if desc else "all_asc",
+        count_query=db.query(Review.id),
+    )
+    rows: List[Review] = result.items
     ids = [r.id for r in rows]
 
-    like_count_map = _review_like_counts(db, ids)
     liked_ids = _my_liked_set(db, ids, getattr(current_user, "id", None))
 
-    items = [_serialize_review(request, r, like_count_map, liked_ids, include_venue=True) for r in rows]
-    return {"items": items, "total": total, "page": page, "size": size}
+    items = [_serialize_review(request, r, liked_ids, include_venue=True) for r in rows]
+    return {
+        "items": items, "total": result.total, "page": result.page, "size": size,
+        "nextCursor": result.next_cursor, "hasNext": result.has_next,
+    }
 
 
 # ------------ 공연장 리뷰 ------------
@@ -198,7 +197,9 @@ def list_venue_reviews(
     request: Request,
     page: int = Query(1, ge=1),
     size: int = Query(10, ge=1, le=100),
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = Query(None, description="이전 응답의 nextCursor"),
+    count: bool = Query(True, description="false면 COUNT 생략"),
+    db: Session = Depends(get_read_db),
     current_user: Optional[User] = Depends(get_current_user_optional),  
     # Depends(lambda: None),  # 로그인 없어도 OK
 ):
@@ -211,19 +212,23 @@ def list_venue_reviews(
         db.query(Review)
         .options(joinedload(Review.user), joinedload(Review.images))
         .filter(Review.venue_id == venue_id)
-        .order_by(Review.created_at.desc(), Review.id.desc())  # ✅ 최신순
     )
 
-    # ✅ total 안전 계산 (버전 호환)
-    total = db.query(func.count(Review.id)).filter(Review.venue_id == venue_id).scalar() or 0
-
-    items: List[Review] = q.offset((page - 1) * size).limit(size).all()
+    # ✅ 최신순 (created_at, id) + keyset cursor
+    result = paginate_query(
+        q, order=[(Review.created_at, True), (Review.id, True)], size=size, page=page,
+        cursor=cursor, with_count=count, sort_key="venue_desc",
+        count_query=db.query(Review.id).filter(Review.venue_id == venue_id),
+    )
+    items: List[Review] = result.items
     ids = [r.id for r in items]
-    like_count_map = _review_like_counts(db, ids)
     liked_ids = _my_liked_set(db, ids, getattr(current_user, "id", None))
 
-    data = [_serialize_review(request, r, like_count_map, liked_ids) for r in items]
-    return {"items": data, "total": total, "page": page, "size": size}
+    data = [_serialize_review(request, r, liked_ids) for r in items]
+    return {
+        "items": data, "total": result.total, "page": result.page, "size": size,
+        "nextCursor": result.next_cursor, "hasNext": result.has_next,
+    }
 
 # ------------ 미리보기(상세 하단: 최대 n개) ------------
 @router.get("/{venue_id}/review/preview", response_model=ReviewListOut, status_code=status.HTTP_201_CREATED)
@@ -231,7 +236,7 @@ def review_preview(
     venue_id: int,
     request: Request,
     limit: int = Query(2, ge=1, le=5),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: Optional[User] = Depends(get_current_user_optional),
 ):
     q = (
@@ -243,9 +248,8 @@ def review_preview(
     )
     items = q.all()
     ids = [r.id for r in items]
-    like_count_map = _review_like_counts(db, ids)
     liked_ids = _my_liked_set(db, ids, getattr(current_user, "id", None))
-    data = [_serialize_review(request, r, like_count_map, liked_ids) for r in items]
+    data = [_serialize_review(request, r, liked_ids) for r in items]
     return {"items": data, "total": len(data), "page": 1, "size": len(data)}
 
 # ------------ 작성 (로그인 필요) ------------
@@ -341,18 +345,10 @@ def like_review(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    # 중복 방지: UniqueConstraint(review_id, user_id)
-    exists_like = (
-        db.query(ReviewLike)
-        .filter(ReviewLike.review_id == review_id, ReviewLike.user_id == current_user.id)
-        .first()
-    )
-    if not exists_like:
-        db.add(ReviewLike(review_id=review_id, user_id=current_user.id))
-        db.commit()
-
-    # 최신 like_count/liked_by_me 반환
-    cnt = db.query(func.count(ReviewLike.id)).filter(ReviewLike.review_id == review_id).scalar()
+    # 중복 방지: UniqueConstraint(review_id, user_id), 카운터는 같은 트랜잭션에서 +1
+    cnt = create_review_like(db, current_user.id, review_id)
+    if cnt is None:
+        raise HTTPException(status_code=404, detail="Review not found")
     return {"like_count": cnt, "liked_by_me": True}
 
 @router.delete("/review/{review_id}/like", tags=["Review"])
@@ -361,15 +357,9 @@ def unlike_review(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    rl = (
-        db.query(ReviewLike)
-        .filter(ReviewLike.review_id == review_id, ReviewLike.user_id == current_user.id)
-        .first()
-    )
-    if rl:
-        db.delete(rl)
-        db.commit()
-    cnt = db.query(func.count(ReviewLike.id)).filter(ReviewLike.review_id == review_id).scalar()
+    cnt = delete_review_like(db, current_user.id, review_id)
+    if cnt is None:
+        raise HTTPException(status_code=404, detail="Review not found")
     return {"like_count": cnt, "liked_by_me": False}
 
 
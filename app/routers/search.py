@@ -1,36 +1,36 @@
+# app/routers/search.py
+# 검색 → 비동기 세션 (await db.run_sync 로 기존 crud 실행)
+# 자동완성은 인메모리 인덱스 재빌드가 CPU 작업이라 sync def (스레드풀) → 재빌드 중에도 이벤트 루프가 막히지 않음
 from fastapi import APIRouter, Query, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from sqlalchemy import or_
-from app.database import get_db
-from typing import Optional
-from app.utils.dependency import get_current_user_optional
-from app.models.performance import Performance
-from app.models.venue import Venue
-from app.models.user import User
-from app.models.artist import Artist
-from app.models.user_favorite_artist import UserFavoriteArtist
-from app.models.user_artist_ticketalarm import UserArtistTicketAlarm
+from typing import List, Optional
+from app.utils.dependency import get_async_read_db, get_read_db, get_current_user_id_optional
 from app.schemas import search as search_schema
 from app.utils.text_utils import clean_title
+from app.utils.pagination import total_pages
+from app.crud import search as search_crud
+from app.crud.user_state import resolve_artist_state
+from app.services.autocomplete import TOP_K, get_autocomplete_index
 
 router = APIRouter(prefix="/search", tags=["Search"])
 
 # 공연 검색
 @router.get("/performance", response_model=search_schema.PerformanceSearchResponse)
-def search_performance(
+async def search_performance(
     keyword: str = Query(..., description="검색 키워드"),
     page: int = Query(1, ge=1),
     size: int = Query(10, ge=1),
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = Query(None, description="이전 응답의 nextCursor"),
+    count: bool = Query(True, description="false면 COUNT 생략"),
+    db: AsyncSession = Depends(get_async_read_db)
 ):
-    skip = (page - 1) * size
+    return await db.run_sync(_search_performance, keyword, page, size, cursor, count)
 
-    # 공연 제목에서만 검색
-    performance_query = db.query(Performance).join(Venue).filter(
-        (Performance.title.ilike(f"%{keyword}%"))
-    )
-    total = performance_query.count()
-    performances = performance_query.offset(skip).limit(size).all()
+def _search_performance(db: Session, keyword: str, page: int, size: int, cursor: Optional[str], count: bool):
+    # 공연 제목에서만 검색 (MySQL: FULLTEXT 관련도순)
+    result = search_crud.search_performances(db, keyword, size=size, page=page, cursor=cursor, with_count=count)
+    performances = result.items
 
     performance_items = [
         search_schema.PerformanceSearchItem(
@@ -43,25 +43,30 @@ def search_performance(
     ]
 
     return search_schema.PerformanceSearchResponse(
-        page=page,
-        totalPages=(total + size - 1) // size,
-        performance=performance_items
+        page=result.page,
+        totalPages=total_pages(result.total, size),
+        performance=performance_items,
+        nextCursor=result.next_cursor,
+        hasNext=result.has_next,
     )
 
 
 # 공연장 검색
 @router.get("/venue", response_model=search_schema.VenueSearchResponse)
-def search_venue(
+async def search_venue(
     keyword: str = Query(..., description="검색 키워드"),
     page: int = Query(1, ge=1),
     size: int = Query(10, ge=1),
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = Query(None, description="이전 응답의 nextCursor"),
+    count: bool = Query(True, description="false면 COUNT 생략"),
+    db: AsyncSession = Depends(get_async_read_db)
 ):
-    skip = (page - 1) * size
+    return await db.run_sync(_search_venue, keyword, page, size, cursor, count)
 
-    venue_query = db.query(Venue).filter(Venue.name.ilike(f"%{keyword}%"))
-    total = venue_query.count()
-    venues = venue_query.offset(skip).limit(size).all()
+def _search_venue(db: Session, keyword: str, page: int, size: int, cursor: Optional[str], count: bool):
+    # 공연장 이름/주소 검색
+    result = search_crud.search_venues(db, keyword, size=size, page=page, cursor=cursor, with_count=count)
+    venues = result.items
 
     venue_items = [
         search_schema.VenueSearchItem(
@@ -73,46 +78,64 @@ def search_venue(
     ]
 
     return search_schema.VenueSearchResponse(
-        page=page,
-        totalPages=(total + size - 1) // size,
-        venues=venue_items
+        page=result.page,
+        totalPages=total_pages(result.total, size),
+        venues=venue_items,
+        nextCursor=result.next_cursor,
+        hasNext=result.has_next,
     )
 
 
 # 아티스트 검색
 @router.get("/artist", response_model=search_schema.ArtistSearchResponse)
-def search_artist(
+async def search_artist(
     keyword: str,
     page: int = Query(1, ge=1),
     size: int = Query(10, ge=1),
-    db: Session = Depends(get_db),
-    current_user: Optional[User] = Depends(get_current_user_optional)  # <-- optional로 변경
+    cursor: Optional[str] = Query(None, description="이전 응답의 nextCursor"),
+    count: bool = Query(True, description="false면 COUNT 생략"),
+    db: AsyncSession = Depends(get_async_read_db),
+    user_id: Optional[int] = Depends(get_current_user_id_optional)  # 토큰만 검증 (user 조회 없음)
 ):
-    skip = (page - 1) * size
-    artists = db.query(Artist).filter(Artist.name.contains(keyword)).offset(skip).limit(size).all()
-    total = db.query(Artist).filter(Artist.name.contains(keyword)).count()
-
-    result = []
-    for a in artists:
-        isLiked = False
-        isAlarmEnabled = False
-        if current_user:  # 로그인 유저인 경우만 체크
-            isLiked = db.query(UserFavoriteArtist).filter_by(user_id=current_user.id, artist_id=a.id).first() is not None
-            isAlarmEnabled = db.query(UserArtistTicketAlarm).filter_by(user_id=current_user.id, artist_id=a.id).first() is not None
-        
-        result.append(
-            search_schema.ArtistSearchItem(
-                id=a.id,
-                name=a.name,
-                profile_url=a.image_url,
-                isLiked=isLiked,
-                isAlarmEnabled=isAlarmEnabled
-            )
-        )
+    return await db.run_sync(_search_artist, keyword, page, size, cursor, count, user_id)
+
+def _search_artist(db: Session, keyword: str, page: int, size: int, cursor: Optional[str], count: bool, user_id: Optional[int]):
+    result = search_crud.search_artists(db, keyword, size=size, page=page, cursor=cursor, with_count=count)
+    artists = result.items
+
+    # 로그인 유저면 찜/알림 여부를 페이지 단위로 한 번에
+    state = resolve_artist_state(db, user_id, [a.id for a in artists])
+
+    items = [
+        search_schema.ArtistSearchItem(
+            id=a.id,
+            name=a.name,
+            profile_url=a.image_url,
+            isLiked=state.is_liked(a.id),
+            isAlarmEnabled=state.is_alarmed(a.id)
+        ) for a in artists
+    ]
 
     return search_schema.ArtistSearchResponse(
-        page=page,
-        totalPages=(total + size - 1) // size,
-        artists=result
+        page=result.page,
+        totalPages=total_pages(result.total, size),
+        artists=items,
+        nextCursor=result.next_cursor,
+        hasNext=result.has_next,
     )
 
+
+# 검색어 자동완성 (초성 검색 지원: 'ㅇㄷ', '인ㄷ')
+@router.get("/suggest", response_model=search_schema.SuggestResponse)
+def suggest(
+    q: str = Query(..., min_length=1, max_length=50, description="입력 중인 검색어"),
+    limit: int = Query(10, ge=1, le=TOP_K),
+    type: Optional[List[str]] = Query(None, description="artist / venue / performance (여러 개 가능)"),
+    db: Session = Depends(get_read_db),
+):
+    index = get_autocomplete_index(db)
+    items = [
+        search_schema.SuggestItem(type=e.type, id=e.id, label=e.label)
+        for e in index.suggest(q, limit=limit, types=type)
+    ]
+    return search_schema.SuggestResponse(query=q, items=items)
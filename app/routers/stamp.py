@@ -7,7 +7,8 @@ from calendar import monthrange
 
 from app import models
 from app.database import get_db
-from app.utils.dependency import get_current_user
+from app.utils.dependency import get_current_user, get_current_user_id
+from app.utils.time_window import date_range_filter, now_kst
 
 from app.schemas.stamp import (
     AvailableStampResponse,
@@ -25,27 +26,24 @@ router = APIRouter(prefix="/stamps", tags=["Stamps"])
 @router.get("/available", response_model=List[AvailableStampResponse])
 def get_available_stamps(
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user),
+    user_id: int = Depends(get_current_user_id),
     days: int = Query(3, ge=1, le=30),
 ):
-    today = datetime.now(timezone.utc).date()
+    today = now_kst().date()
     start_date = today - timedelta(days=days - 1)
 
     already_stamped_ids = {
         p_id
         for (p_id,) in db.query(models.Stamp.performance_id)
-        .filter(models.Stamp.user_id == current_user.id)
+        .filter(models.Stamp.user_id == user_id)
         .all()
     }
 
     performances = (
         db.query(models.Performance)
         .options(joinedload(models.Performance.venue))
-        .filter(
-            models.Performance.date >= start_date,
-            models.Performance.date <= today,
-        )
-        .order_by(models.Performance.date.desc())
+        .filter(*date_range_filter(start_date, today))
+        .order_by(models.Performance.start_at.desc())
         .all()
     )
 
@@ -75,12 +73,12 @@ def get_collected_stamps(
     startYear: Optional[int] = Query(None, ge=1970, le=2100),
     endYear: Optional[int] = Query(None, ge=1970, le=2100),
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user),
+    user_id: int = Depends(get_current_user_id),
 ):
     q = (
         db.query(models.Stamp)
         .options(joinedload(models.Stamp.performance).joinedload(models.Performance.venue))
-        .filter(models.Stamp.user_id == current_user.id)
+        .filter(models.Stamp.user_id == user_id)
     )
 
     if startMonth and endMonth and startYear and endYear:
@@ -91,17 +89,13 @@ def get_collected_stamps(
             sM, eM = eM, sM
         start_date = date(sY, sM, 1)
         end_date = date(eY, eM, monthrange(eY, eM)[1])
-        q = q.join(models.Performance).filter(
-            models.Performance.date.between(start_date, end_date)
-        )
+        q = q.join(models.Performance).filter(*date_range_filter(start_date, end_date))
 
     elif startMonth and endMonth:
-        year = datetime.now(timezone.utc).year
+        year = now_kst().year
         start_date = date(year, startMonth, 1)
         end_date = date(year, endMonth, monthrange(year, endMonth)[1])
-        q = q.join(models.Performance).filter(
-            models.Performance.date.between(start_date, end_date)
-        )
+        q = q.join(models.Performance).filter(*date_range_filter(start_date, end_date))
 
     stamps = q.order_by(models.Stamp.created_at.desc()).all()
 
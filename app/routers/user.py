@@ -1,17 +1,20 @@
 from fastapi import APIRouter, Depends, File, UploadFile, HTTPException, Query
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
+from typing import Optional
 import datetime
 import os
 from pathlib import Path
 
 from app.database import get_db
-from app.utils.dependency import get_current_user
+from app.utils.dependency import get_current_user, get_current_user_id
 from app.utils.gcs import upload_to_gcs, delete_from_gcs
+from app.utils.pagination import paginate_query, total_pages
 
 # crud
 from app.crud import user as user_crud
 from app.crud import user_favorite_performance as fav_perf_crud
 from app.crud import user_favorite_artist as fav_artist_crud
+from app.crud.user_state import resolve_artist_state
 
 # schemas
 from app.schemas import user as user_schema
@@ -119,18 +122,25 @@ def update_user_settings(
 def get_liked_performances(
     page: int = Query(1, ge=1),
     size: int = Query(10, ge=1),
+    cursor: Optional[str] = Query(None, description="이전 응답의 nextCursor"),
+    count: bool = Query(True, description="false면 COUNT 생략"),
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    user_id: int = Depends(get_current_user_id),
 ):
-    skip = (page - 1) * size
-
+    # PK (user_id, 대상 id) 인덱스를 그대로 타도록 대상 id 내림차순
     liked_performance_query = (
         db.query(Performance)
+        .options(joinedload(Performance.venue))   # p.venue.name → 행마다 SELECT venue 방지
         .join(UserFavoritePerformance, UserFavoritePerformance.performance_id == Performance.id)
-        .filter(UserFavoritePerformance.user_id == current_user.id)
+        .filter(UserFavoritePerformance.user_id == user_id)
+    )
+    page_result = paginate_query(
+        liked_performance_query, order=[(UserFavoritePerformance.performance_id, True)], size=size, page=page,
+        cursor=cursor, with_count=count, sort_key="liked_performance",
+        count_query=db.query(UserFavoritePerformance.performance_id).filter(UserFavoritePerformance.user_id == user_id),
+        key=lambda row: (row.id,),
     )
-    total = liked_performance_query.count()
-    performances = liked_performance_query.offset(skip).limit(size).all()
+    performances = page_result.items
 
     result = [
         fav_perf_schema.UserLikedPerformanceResponse(
@@ -143,10 +153,11 @@ def get_liked_performances(
         ) for p in performances
     ]
 
-    total_pages = (total + size - 1) // size
     return fav_perf_schema.UserLikedPerformanceListResponse(
-        page=page,
-        totalPages=total_pages,
+        page=page_result.page,
+        totalPages=total_pages(page_result.total, size),
+        nextCursor=page_result.next_cursor,
+        hasNext=page_result.has_next,
         performances=result
     )
 
@@ -155,39 +166,42 @@ def get_liked_performances(
 def get_liked_artists(
     page: int = Query(1, ge=1),
     size: int = Query(10, ge=1),
+    cursor: Optional[str] = Query(None, description="이전 응답의 nextCursor"),
+    count: bool = Query(True, description="false면 COUNT 생략"),
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    user_id: int = Depends(get_current_user_id),
 ):
-    skip = (page - 1) * size
-
+    # PK (user_id, 대상 id) 인덱스를 그대로 타도록 대상 id 내림차순
     liked_artist_query = (
         db.query(Artist)
         .join(UserFavoriteArtist, UserFavoriteArtist.artist_id == Artist.id)
-        .filter(UserFavoriteArtist.user_id == current_user.id)
+        .filter(UserFavoriteArtist.user_id == user_id)
+    )
+    page_result = paginate_query(
+        liked_artist_query, order=[(UserFavoriteArtist.artist_id, True)], size=size, page=page,
+        cursor=cursor, with_count=count, sort_key="liked_artist",
+        count_query=db.query(UserFavoriteArtist.artist_id).filter(UserFavoriteArtist.user_id == user_id),
+        key=lambda row: (row.id,),
     )
-    total = liked_artist_query.count()
-    artists = liked_artist_query.offset(skip).limit(size).all()
-
-    result = []
-    for artist in artists:
-        isAlarmEnabled = db.query(UserArtistTicketAlarm).filter_by(
-            user_id=current_user.id,
-            artist_id=artist.id
-        ).first() is not None
-
-        result.append(
-            fav_artist_schema.UserLikedArtistResponse(
-                id=artist.id,
-                name=artist.name,
-                image_url=artist.image_url,
-                isLiked=True,
-                isAlarmEnabled=isAlarmEnabled
-            )
-        )
-
-    total_pages = (total + size - 1) // size
+    artists = page_result.items
+
+    # 알림 여부는 페이지 단위로 한 번에
+    state = resolve_artist_state(db, user_id, [a.id for a in artists])
+
+    result = [
+        fav_artist_schema.UserLikedArtistResponse(
+            id=artist.id,
+            name=artist.name,
+            image_url=artist.image_url,
+            isLiked=True,
+            isAlarmEnabled=state.is_alarmed(artist.id)
+        ) for artist in artists
+    ]
+
     return fav_artist_schema.UserLikedArtistListResponse(
-        page=page,
-        totalPages=total_pages,
+        page=page_result.page,
+        totalPages=total_pages(page_result.total, size),
+        nextCursor=page_result.next_cursor,
+        hasNext=page_result.has_next,
         artists=result
     )
\ No newline at end of file
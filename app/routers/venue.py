@@ -1,18 +1,21 @@
 from fastapi import APIRouter, Depends, Query, HTTPException
 from sqlalchemy.orm import Session, joinedload
-from app.database import get_db
+from app.utils.dependency import get_read_db   # 조회 전용 → read replica
 from app.models.venue import Venue
 from app.models.performance import Performance
 from app.models.review import Review
 from app.schemas.venue import VenueListResponse, VenueListItem, VenueDetailResponse, VenuePerformanceItem
 
 from app.crud import venue as venue_crud
+from app.utils.pagination import paginate_query, total_pages
 from typing import Optional, List, Union
 from sqlalchemy import or_
+from app.services.response_cache import CachedRoute, cache_response
 
 router = APIRouter(
     prefix="/venue",
-    tags=["Venue"]
+    tags=["Venue"],
+    route_class=CachedRoute,
 )
 #공욘장리스틎회
 @router.get("", response_model=VenueListResponse)
@@ -20,9 +23,10 @@ def get_venue_list(
     region: Union[List[str], str, None] = Query(None, description="지역 필터"),
     page: int = Query(1, ge=1),
     size: int = Query(10, ge=1),
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = Query(None, description="이전 응답의 nextCursor"),
+    count: bool = Query(True, description="false면 COUNT 생략"),
+    db: Session = Depends(get_read_db)
 ):
-    skip = (page - 1) * size
     query = db.query(Venue)
 
     # ✅ region을 항상 배열로 변환 + 내부 콤마도 분리
@@ -45,23 +49,31 @@ def get_venue_list(
         conditions = [Venue.region.ilike(f"%{r}%") for r in region_list]
         query = query.filter(or_(*conditions))
 
-    total = query.count()
-    venues = query.offset(skip).limit(size).all()
+    page_result = paginate_query(
+        query, order=[(Venue.id, False)], size=size, page=page,
+        cursor=cursor, with_count=count, sort_key="venue",
+    )
 
     result = [
         VenueListItem(id=v.id, name=v.name,        address=v.address,         region=v.region, image_url=v.image_url)
-        for v in venues
+        for v in page_result.items
     ]
 
-    total_pages = (total + size - 1) // size
-    return VenueListResponse(page=page, totalPages=total_pages, venue=result)
+    return VenueListResponse(
+        page=page_result.page,
+        totalPages=total_pages(page_result.total, size),
+        venue=result,
+        nextCursor=page_result.next_cursor,
+        hasNext=page_result.has_next,
+    )
 
 
 
 @router.get("/{venue_id}", response_model=VenueDetailResponse)
+@cache_response(ttl=120, tags=["venue", "performance"])
 def get_venue_detail(
     venue_id: int,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     venue = venue_crud.get_venue_by_id(db, venue_id)
     if not venue:
@@ -27,9 +27,11 @@ class ArtistListItem(BaseModel):
 
 # 아티스트 목록 응답 전체 구조
 class ArtistListResponse(BaseModel):
-    page: int
-    totalPages: int
+    page: Optional[int] = None
+    totalPages: Optional[int] = None
     artists: List[ArtistListItem]
+    nextCursor: Optional[str] = None
+    hasNext: Optional[bool] = None
 
 # 공연 미리보기용 구조 (아티스트 상세 페이지에서 사용)
 class PerformanceSimple(BaseModel):
@@ -1,6 +1,6 @@
 #app/schemas/naerby.py
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import Optional, List
 
 # 근처 공연장 정보 응답 모델
@@ -9,6 +9,9 @@ class NearbyVenueResponse(BaseModel):
     name: str
     latitude: float
     longitude: float
+    address: Optional[str] = None
+    image_url: Optional[str] = None
+    distance_km: Optional[float] = None  # 요청 좌표로부터 거리
 
 # 지도 내 공연장/공연 조회 시 사용되는 요청 모델 (지도 좌표 범위)
 class PerformanceBoundsRequest(BaseModel):
@@ -17,6 +20,26 @@ class PerformanceBoundsRequest(BaseModel):
     ne_lat: float
     ne_lng: float
 
+# 줌 레벨 포함 클러스터 요청 모델
+class ClusterRequest(PerformanceBoundsRequest):
+    zoom: int = Field(..., ge=0, le=22)
+
+# 지도 클러스터 (공연장 1곳이면 venue_id/name 포함)
+class MapCluster(BaseModel):
+    latitude: float
+    longitude: float
+    venue_count: int
+    performance_count: int
+    venue_id: Optional[int] = None
+    name: Optional[str] = None
+
+# 클러스터 응답 모델 (zoom: 타일이 너무 많으면 낮춰진 실제 줌)
+class ClusterResponse(BaseModel):
+    zoom: int
+    tiles: int
+    cacheHits: int
+    clusters: List[MapCluster]
+
 # 공연 요약 정보 (장소별 공연 리스트에 포함되는 간략 정보)
 class PerformanceSummary(BaseModel):
     id: int
@@ -1,8 +1,9 @@
 # app/schemas/performance.py
 
 from pydantic import BaseModel
-from typing import Optional, List
+from typing import Optional, List, Union
 from datetime import datetime, time, date
+from datetime import time as dt_time
 
 
 class ArtistSimple(BaseModel):
@@ -36,6 +37,8 @@ class PerformanceListResponse(BaseModel):
     page: Optional[int] = None
     totalPages: Optional[int] = None
     performances: List[PerformanceListItem]
+    nextCursor: Optional[str] = None   # 다음 페이지 cursor (없으면 마지막 페이지)
+    hasNext: Optional[bool] = None
 
 
 class RecommendationResponse(BaseModel):
@@ -89,3 +92,35 @@ class PerformanceTicketOpenListResponse(BaseModel):
     page: Optional[int] = None
     totalPages: Optional[int] = None
     performances: List[PerformanceTicketOpenItem]
+
+
+# 공연 일괄 등록 (POST /performance/bulk, python -m app.scripts.ingest_performances)
+# 공연장은 venue_id 또는 venue_instagram, 아티스트는 artist_ids 또는 artist_names 로 지정
+class PerformanceBulkItem(BaseModel):
+    title: str
+    venue_id: Optional[int] = None
+    venue_instagram: Optional[str] = None
+    date: date
+    time: Optional[dt_time] = None
+    price: Optional[Union[str, int]] = None
+    ticket_open_date: Optional[date] = None
+    ticket_open_time: Optional[dt_time] = None
+    detail_url: Optional[str] = None
+    image_url: Optional[str] = None
+    shortcode: Optional[str] = None          # 인스타 게시물 shortcode (중복 판별)
+    artist_ids: List[int] = []
+    artist_names: List[str] = []
+
+
+class PerformanceBulkError(BaseModel):
+    index: int
+    error: str
+
+
+class PerformanceBulkResponse(BaseModel):
+    received: int
+    created: int
+    duplicates: int
+    performanceIds: List[int]
+    errors: List[PerformanceBulkError]
+    notifyJobId: Optional[int] = None
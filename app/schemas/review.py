@@ -61,9 +61,11 @@ class ReviewOut(BaseModel):
 # ---------- 리스트 ----------
 class ReviewListOut(BaseModel):
     items: List[ReviewOut] = []
-    total: int = 0
-    page: int = 1
+    total: Optional[int] = 0        # count=false 또는 cursor 모드면 None
+    page: Optional[int] = 1
     size: int = 0
+    nextCursor: Optional[str] = None
+    hasNext: Optional[bool] = None
 
     class Config:
         orm_mode = True
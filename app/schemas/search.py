@@ -21,17 +21,21 @@ class VenueSearchItem(BaseModel):
 
 # 공연 검색 결과 응답 모델 (공연 탭에서 사용)
 class PerformanceSearchResponse(BaseModel):
-    page: int
-    totalPages: int
+    page: Optional[int] = None
+    totalPages: Optional[int] = None
     performance: List[PerformanceSearchItem]
+    nextCursor: Optional[str] = None
+    hasNext: Optional[bool] = None
    # venue: List[VenueSearchItem]
    
 
 # 공연장 검색 결과에서 개별 공연장 정보 담는 모델
 class VenueSearchResponse(BaseModel):
-    page: int
-    totalPages: int
+    page: Optional[int] = None
+    totalPages: Optional[int] = None
     venues: List[VenueSearchItem]
+    nextCursor: Optional[str] = None
+    hasNext: Optional[bool] = None
 
 
 # 아티스트 검색 결과에서 개별 아티스트 정보 담는 모델
@@ -44,6 +48,19 @@ class ArtistSearchItem(BaseModel):
 
 # 아티스트 검색 결과 응답 모델
 class ArtistSearchResponse(BaseModel):
-    page: int
-    totalPages: int
+    page: Optional[int] = None
+    totalPages: Optional[int] = None
     artists: List[ArtistSearchItem]
+    nextCursor: Optional[str] = None
+    hasNext: Optional[bool] = None
+
+# 자동완성 항목 (type: artist / venue / performance)
+class SuggestItem(BaseModel):
+    type: str
+    id: int
+    label: str
+
+# 자동완성 응답 모델
+class SuggestResponse(BaseModel):
+    query: str
+    items: List[SuggestItem]
@@ -14,6 +14,8 @@ class UserLikedArtistResponse(BaseModel):
 
 # 찜한 아티스트 목록 응답 모델(페이징 포함)
 class UserLikedArtistListResponse(BaseModel):
-    page: int
-    totalPages: int
+    page: Optional[int] = None
+    totalPages: Optional[int] = None
+    nextCursor: Optional[str] = None
+    hasNext: Optional[bool] = None
     artists: List[UserLikedArtistResponse]
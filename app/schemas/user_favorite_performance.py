@@ -16,6 +16,8 @@ class UserLikedPerformanceResponse(BaseModel):
 
 # 찜한 공연 목록 응답 모델(페이징 포함)
 class UserLikedPerformanceListResponse(BaseModel):
-    page: int
-    totalPages: int
+    page: Optional[int] = None
+    totalPages: Optional[int] = None
+    nextCursor: Optional[str] = None
+    hasNext: Optional[bool] = None
     performances: List[UserLikedPerformanceResponse]
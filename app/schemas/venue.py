@@ -15,9 +15,11 @@ class VenueListItem(BaseModel):
 
 # 공연장 목록 전체 응답(페이징 포함)
 class VenueListResponse(BaseModel):
-    page: int
-    totalPages: int
+    page: Optional[int] = None
+    totalPages: Optional[int] = None
     venue: List[VenueListItem]
+    nextCursor: Optional[str] = None
+    hasNext: Optional[bool] = None
 
     class Config:
         orm_mode = True
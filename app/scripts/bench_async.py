@@ -0,0 +1,180 @@
+# app/scripts/bench_async.py
+# 동기(get_db + 스레드풀) vs 비동기(get_async_db + run_sync) 라우터 부하 비교
+# 같은 조회 함수(홈 오늘 공연 / 공연 목록 / 주변 공연장)를 두 방식의 엔드포인트로 띄우고
+# 동시 요청 수를 바꿔가며 req/s, p95 측정 (httpx ASGITransport, 응답 캐시 없는 라우트)
+# 실행: python -m app.scripts.bench_async --db-url mysql+pymysql://user:pw@127.0.0.1:3307/bench --concurrency 1,10,50,100
+#       (기본은 SQLite 파일. --latency-ms 는 MySQL에서만 SELECT SLEEP 으로 네트워크 왕복 흉내)
+# 주의: 대상 DB의 venue/performance 테이블을 지우고 다시 만든다 → 벤치 전용 DB에서만 실행
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from datetime import datetime, time as dt_time, timedelta
+
+import httpx
+from fastapi import Depends, FastAPI
+from sqlalchemy import create_engine, insert, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+import app.models  # noqa: F401
+from app.crud import nearby as nearby_crud
+from app.models.performance import Performance
+from app.models.venue import Venue
+from app.routers.performance import _performance_list
+from app.routers.performance_home import _today_performances
+from app.utils.time_window import now_kst
+
+ROUTES = {
+    "today": "/performance/home/today",
+    "list": "/performance?sort=date&size=20&count=false",
+    "nearby": "/nearby/venue?lat=37.55&lng=126.92&radius=5",
+}
+
+
+def async_url(url: str) -> str:
+    for sync, aio in (("mysql+pymysql://", "mysql+aiomysql://"), ("sqlite://", "sqlite+aiosqlite://")):
+        if url.startswith(sync):
+            return url.replace(sync, aio, 1)
+    return url
+
+
+def seed(db: Session, venues: int, performances: int, seed_: int = 42):
+    rng = random.Random(seed_)
+    db.execute(insert(Venue), [
+        {"id": i + 1, "name": f"bench venue {i}", "address": f"서울 마포구 {i}", "region": "서울",
+         "instagram_account": f"bench{i}", "latitude": 37.5 + rng.random() * 0.1, "longitude": 126.9 + rng.random() * 0.1}
+        for i in range(venues)
+    ])
+    today = now_kst().date()
+    rows = []
+    for i in range(performances):
+        d, t = today + timedelta(days=rng.randint(-3, 60)), dt_time(rng.choice([18, 19, 20]), 0)
+        rows.append({
+            "title": f"bench performance {i}", "venue_id": rng.randint(1, venues), "date": d, "time": t,
+            "price": "",
+            "created_at": datetime.utcnow(), "updated_at": datetime.utcnow(),
+        })
+    db.execute(insert(Performance), rows)
+    db.commit()
+
+
+def build_app(sync_url: str, latency_ms: int) -> FastAPI:
+    engine = create_engine(sync_url, pool_size=20, max_overflow=80) if not sync_url.startswith("sqlite") \
+        else create_engine(sync_url, connect_args={"check_same_thread": False})
+    aengine = create_async_engine(async_url(sync_url))
+    Local = sessionmaker(bind=engine, autoflush=False)
+    ALocal = async_sessionmaker(aengine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
+    sleep = text("SELECT SLEEP(:s)") if latency_ms and engine.dialect.name == "mysql" else None
+
+    def get_db():
+        with Local() as db:
+            yield db
+
+    async def get_async_db():
+        async with ALocal() as db:
+            yield db
+
+    def _wait(db: Session):
+        if sleep is not None:
+            db.execute(sleep, {"s": latency_ms / 1000})
+
+    def today(db: Session):
+        _wait(db)
+        return _today_performances(db)
+
+    def plist(db: Session):
+        _wait(db)
+        return _performance_list(db, None, "date", 1, 20, None, False).model_dump()
+
+    def nearby(db: Session):
+        _wait(db)
+        return nearby_crud.get_nearby_venues(db, 37.55, 126.92, 5.0, None)
+
+    bench = FastAPI()
+    for name, fn in (("today", today), ("list", plist), ("nearby", nearby)):
+        path = ROUTES[name].split("?")[0]
+
+        def sync_endpoint(db: Session = Depends(get_db), fn=fn):
+            return fn(db)
+
+        async def async_endpoint(db: AsyncSession = Depends(get_async_db), fn=fn):
+            return await db.run_sync(fn)
+
+        bench.get("/sync" + path)(sync_endpoint)
+        bench.get("/async" + path)(async_endpoint)
+    bench.state.engines = (engine, aengine)
+    return bench
+
+
+async def _load(client: httpx.AsyncClient, path: str, concurrency: int, total: int):
+    samples, errors = [], 0
+    queue = iter(range(total))
+
+    async def worker():
+        nonlocal errors
+        for _ in queue:
+            t0 = time.perf_counter()
+            res = await client.get(path)
+            samples.append((time.perf_counter() - t0) * 1000)
+            if res.status_code != 200:
+                errors += 1
+
+    t0 = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - t0
+    samples.sort()
+    p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+    return total / elapsed, statistics.median(samples), p95, errors
+
+
+async def run(bench: FastAPI, routes, levels, requests_per_level: int):
+    transport = httpx.ASGITransport(app=bench)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for name in routes:
+            for mode in ("sync", "async"):
+                await client.get(f"/{mode}{ROUTES[name]}")     # 워밍업 (커넥션/매퍼)
+            print(f"\n[{name}] {ROUTES[name]}")
+            print(f"{'conc':>5} {'mode':>6} {'req/s':>9} {'p50(ms)':>9} {'p95(ms)':>9} {'err':>4}")
+            for c in levels:
+                for mode in ("sync", "async"):
+                    rps, p50, p95, err = await _load(client, f"/{mode}{ROUTES[name]}", c, max(requests_per_level, c))
+                    print(f"{c:>5} {mode:>6} {rps:>9.1f} {p50:>9.1f} {p95:>9.1f} {err:>4}")
+    for e in bench.state.engines:
+        dispose = e.dispose()
+        if asyncio.iscoroutine(dispose):
+            await dispose
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--db-url", default="sqlite:///./bench_async.sqlite3")
+    ap.add_argument("--venues", type=int, default=200)
+    ap.add_argument("--performances", type=int, default=5000)
+    ap.add_argument("--concurrency", default="1,10,50")
+    ap.add_argument("--requests", type=int, default=300, help="동시성 단계별 요청 수")
+    ap.add_argument("--routes", default=",".join(ROUTES))
+    ap.add_argument("--latency-ms", type=int, default=0, help="요청마다 DB 왕복 지연 추가 (MySQL 전용)")
+    ap.add_argument("--reuse", action="store_true", help="기존 데이터 재사용 (seed 생략)")
+    args = ap.parse_args()
+
+    engine = create_engine(args.db_url)
+    if not args.reuse:
+        tables = [Performance.__table__, Venue.__table__]
+        for t in tables:
+            t.drop(engine, checkfirst=True)
+        for t in reversed(tables):
+            t.create(engine)
+        with sessionmaker(bind=engine)() as db:
+            seed(db, args.venues, args.performances)
+        print(f"[bench_async] seeded venues={args.venues} performances={args.performances}")
+    engine.dispose()
+
+    bench = build_app(args.db_url, args.latency_ms)
+    levels = [int(c) for c in args.concurrency.split(",")]
+    asyncio.run(run(bench, args.routes.split(","), levels, args.requests))
+
+
+if __name__ == "__main__":
+    main()
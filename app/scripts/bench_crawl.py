@@ -0,0 +1,70 @@
+# app/scripts/bench_crawl.py
+# 인스타그램 크롤러 처리량 벤치 (fake_instagram_server 를 같은 프로세스에서 띄움, 네트워크 불필요)
+# 실행: python -m app.scripts.bench_crawl --accounts 200 --contexts 2 --pages-per-context 4 --host-interval 0.05
+#       python -m app.scripts.bench_crawl --accounts 50 --baseline      # 페이지 1개 + 리소스 차단 없음과 비교
+#       python -m app.scripts.bench_crawl --url http://127.0.0.1:8766   # 별도 uvicorn 으로 띄운 fake 서버 사용
+# - --known-ratio: 이전 실행에서 본 shortcode 와 같은(새 게시물 없는) 계정 비율 → 게시물 클릭 없이 끝나는 계정
+# - 차단된 이미지/폰트/영상 요청 수는 fake 서버 /__stats 의 증가량으로 확인
+import argparse
+import asyncio
+import threading
+import time
+
+import httpx
+
+from app.scripts import fake_instagram_server
+from app.services.instagram.crawler import crawl_accounts
+
+
+def _serve(port: int) -> None:
+    import uvicorn
+
+    server = uvicorn.Server(uvicorn.Config(fake_instagram_server.app, port=port, log_level="warning"))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+
+
+def _run(url: str, accounts: list, previous: dict, **options) -> dict:
+    before = httpx.get(f"{url}/__stats").json()
+    result = asyncio.run(crawl_accounts(
+        accounts, lambda account, sc, fingerprint: previous.get(account) != sc, base_url=url, **options
+    ))
+    after = httpx.get(f"{url}/__stats").json()
+    result["server"] = {k: after[k] - before[k] for k in ("profiles", "posts", "images", "fonts", "media")}
+    return result
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--accounts", type=int, default=100)
+    ap.add_argument("--contexts", type=int, default=2)
+    ap.add_argument("--pages-per-context", type=int, default=4)
+    ap.add_argument("--host-interval", type=float, default=0.05, help="fake 서버 대상이라 기본값을 짧게")
+    ap.add_argument("--known-ratio", type=float, default=0.8)
+    ap.add_argument("--baseline", action="store_true", help="페이지 1개 + 리소스 차단 없음으로 한 번 더 실행")
+    ap.add_argument("--url", default=None, help="fake 서버 주소 (없으면 127.0.0.1:--port 로 직접 띄움)")
+    ap.add_argument("--port", type=int, default=8766)
+    ap.add_argument("--headed", action="store_true")
+    args = ap.parse_args()
+
+    url = args.url
+    if not url:
+        _serve(args.port)
+        url = f"http://127.0.0.1:{args.port}"
+    accounts = [f"bench_venue{i}" for i in range(args.accounts)]
+    known = int(len(accounts) * args.known_ratio)
+    previous = {a: fake_instagram_server.shortcode(a) for a in accounts[:known]} if not args.url else {}
+
+    runs = [("pool", dict(contexts=args.contexts, pages_per_context=args.pages_per_context, block_resources=True))]
+    if args.baseline:
+        runs.append(("baseline", dict(contexts=1, pages_per_context=1, block_resources=False)))
+    for name, options in runs:
+        result = _run(url, accounts, previous, host_interval=args.host_interval, headless=not args.headed, **options)
+        s = result["stats"]
+        print(f"[bench_crawl] {name:<8} workers={s['workers']} checked={s['checked']} new={s['new']} "
+              f"failed={s['failed']} {s['seconds']}s {s['accounts_per_s']} accounts/s server={result['server']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,238 @@
+# app/scripts/bench_load.py
+# 실제 FastAPI 앱(app.main)에 엔드포인트 가중 믹스를 재생하는 부하 벤치
+# - 엔드포인트별/전체 p50/p95/p99, 요청당 쿼리 수(Server-Timing 헤더의 db desc), DB 시간
+# - --out 으로 결과 JSON 저장(커밋 해시 포함) → 다른 커밋에서 --compare 로 비교
+# 실행: python -m app.scripts.gen_synthetic --db-url sqlite:///./synthetic.sqlite3 --preset medium
+#       python -m app.scripts.bench_load --db-url sqlite:///./synthetic.sqlite3 --requests 3000 --concurrency 20 --out before.json
+#       (코드 변경 후) python -m app.scripts.bench_load --db-url sqlite:///./synthetic.sqlite3 --compare before.json
+#       실행 중인 서버 대상: --base-url http://127.0.0.1:8000 (DB 는 서버 설정 그대로)
+# - --db-url 이 없으면 앱 설정(DB_HOST/DB_PORT ...) 의 DB 를 그대로 사용
+# - 응답 캐시까지 포함한 실제 수치가 기본. DB 경로만 보려면 RESPONSE_CACHE_BACKEND=off
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import subprocess
+import time
+from collections import defaultdict
+from datetime import date, timedelta
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+
+# (이름, 가중치, 경로 템플릿, 로그인 필요) — 앱 트래픽 비중을 흉내 (홈/공연 상세가 대부분)
+MIX = [
+    ("home_today", 10, "/performance/home/today", False),
+    ("home_recent", 5, "/performance/home/recent", False),
+    ("home_ticket_opening", 3, "/performance/home/ticket-opening?startDate={today}&endDate={week}", False),
+    ("home_recommendation", 4, "/performance/home/recommendation", True),
+    ("performance_list", 10, "/performance?sort=date&page={page}&size=20", False),
+    ("performance_trending", 5, "/performance/trending?size=20", False),
+    ("performance_detail", 15, "/performance/{performance_id}", False),
+    ("venue_list", 4, "/venue?page={page}&size=20", False),
+    ("venue_detail", 5, "/venue/{venue_id}", False),
+    ("venue_reviews", 4, "/venue/{venue_id}/review?page={page}", False),
+    ("calendar_summary", 3, "/calendar/summary?year={year}&month={month}", False),
+    ("search_performance", 6, "/search/performance?keyword={keyword}", False),
+    ("nearby_venue", 4, "/nearby/venue?lat={lat}&lng={lng}&radius=3", False),
+    ("my_liked_performances", 4, "/user/me/like/performance?page={page}", True),
+    ("notifications", 4, "/notifications", True),
+    ("stamps_collected", 2, "/stamps/collected", True),
+]
+KEYWORDS = ["인디", "밴드", "재즈", "홍대", "어쿠스틱 라이브", "페스티벌", "단독 공연"]
+
+
+def _pct(samples: List[float], p: float) -> float:
+    return samples[min(len(samples) - 1, int(len(samples) * p))] if samples else 0.0
+
+
+def _server_timing(header: Optional[str]) -> Tuple[Optional[int], Optional[float]]:
+    """'db;dur=3.2;desc="4 queries", app;...' → (4, 3.2)"""
+    for part in (header or "").split(","):
+        fields = dict(f.strip().split("=", 1) for f in part.split(";")[1:] if "=" in f)
+        if part.strip().startswith("db"):
+            queries = fields.get("desc", "").strip('"').split(" ")[0]
+            return (int(queries) if queries.isdigit() else None), float(fields.get("dur", 0))
+    return None, None
+
+
+def _use_db_url(db_url: str) -> None:
+    """in-process 실행: app.database import 전에 비동기 URL 지정 + 동기 세션을 db_url 로 재바인딩"""
+    from app.utils.db_routing import to_async_url
+
+    os.environ["ASYNC_DATABASE_URL"] = to_async_url(db_url)
+    os.environ.setdefault("DB_POOL_WARMUP", "0")
+    from sqlalchemy import create_engine
+
+    import app.database as database
+    kwargs = {"connect_args": {"check_same_thread": False}} if db_url.startswith("sqlite") else {}
+    bench_engine = create_engine(db_url, **kwargs)
+    database.SessionLocal.configure(bind=bench_engine)
+    database.ReadSessionLocal.configure(bind=bench_engine)
+
+
+def _sample_ids(rng: random.Random, limit: int = 5000) -> dict:
+    from app.database import SessionLocal
+    from app.models import Performance, User, Venue
+
+    def sample(column):
+        ids = [i for (i,) in db.query(column)]
+        return rng.sample(ids, min(limit, len(ids)))
+
+    with SessionLocal() as db:
+        ids = {"performance": sample(Performance.id), "venue": sample(Venue.id), "user": sample(User.id)}
+        coords = db.query(Venue.latitude, Venue.longitude).limit(200).all()
+    if not ids["performance"] or not ids["venue"]:
+        raise SystemExit("[bench_load] 공연/공연장 데이터가 없음 → app.scripts.gen_synthetic 먼저 실행")
+    ids["coords"] = coords
+    return ids
+
+
+def _requests(rng: random.Random, total: int, ids: dict, mix) -> List[tuple]:
+    today = date.today()
+    names, weights = [m[0] for m in mix], [m[1] for m in mix]
+    by_name = {m[0]: m for m in mix}
+    plan = []
+    for name in rng.choices(names, weights, k=total):
+        _, _, template, auth = by_name[name]
+        lat, lng = rng.choice(ids["coords"])
+        path = template.format(
+            today=today, week=today + timedelta(days=7), page=rng.choice([1, 1, 1, 2, 3]),
+            performance_id=rng.choice(ids["performance"]), venue_id=rng.choice(ids["venue"]),
+            year=today.year, month=today.month, keyword=rng.choice(KEYWORDS), lat=lat, lng=lng,
+        )
+        plan.append((name, path, rng.choice(ids["user"]) if auth and ids["user"] else None))
+    return plan
+
+
+async def _replay(client: httpx.AsyncClient, plan: List[tuple], concurrency: int) -> dict:
+    from app.utils.auth.auth import create_access_token
+
+    tokens: Dict[int, str] = {}
+    results = defaultdict(lambda: {"ms": [], "queries": [], "db_ms": [], "errors": 0})
+    queue = iter(plan)
+
+    async def worker():
+        for name, path, user_id in queue:
+            cookies = None
+            if user_id is not None:
+                cookies = {"access_token": tokens.setdefault(user_id, create_access_token(user_id))}
+            t0 = time.perf_counter()
+            res = await client.get(path, cookies=cookies)
+            r = results[name]
+            r["ms"].append((time.perf_counter() - t0) * 1000)
+            if res.status_code >= 400:
+                r["errors"] += 1
+            queries, db_ms = _server_timing(res.headers.get("server-timing"))
+            if queries is not None:
+                r["queries"].append(queries)
+                r["db_ms"].append(db_ms)
+
+    t0 = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - t0
+
+    summary = {}
+    for name, r in list(results.items()) + [("ALL", _merge(results.values()))]:
+        ms = sorted(r["ms"])
+        summary[name] = {
+            "n": len(ms), "errors": r["errors"],
+            "p50_ms": round(statistics.median(ms), 2), "p95_ms": round(_pct(ms, 0.95), 2),
+            "p99_ms": round(_pct(ms, 0.99), 2),
+            "queries_avg": round(statistics.mean(r["queries"]), 2) if r["queries"] else None,
+            "queries_max": max(r["queries"]) if r["queries"] else None,
+            "db_ms_avg": round(statistics.mean(r["db_ms"]), 2) if r["db_ms"] else None,
+        }
+    summary["ALL"]["rps"] = round(len(plan) / elapsed, 1)
+    return summary
+
+
+def _merge(rows) -> dict:
+    merged = {"ms": [], "queries": [], "db_ms": [], "errors": 0}
+    for r in rows:
+        for k in ("ms", "queries", "db_ms"):
+            merged[k] += r[k]
+        merged["errors"] += r["errors"]
+    return merged
+
+
+def _print(summary: dict, baseline: Optional[dict]) -> None:
+    def delta(name, key):
+        old = ((baseline or {}).get(name) or {}).get(key)
+        new = summary[name].get(key)
+        if old in (None, 0) or new is None:
+            return ""
+        return f"({(new - old) / old * 100:+.0f}%)"
+
+    print(f"{'endpoint':<24} {'n':>6} {'err':>4} {'p50':>8} {'p95':>8} {'p99':>8} {'q/req':>6} {'q max':>5} {'db ms':>7}")
+    for name in sorted(summary, key=lambda n: (n == "ALL", n)):
+        s = summary[name]
+        q = "-" if s["queries_avg"] is None else f"{s['queries_avg']:.1f}"
+        print(f"{name:<24} {s['n']:>6} {s['errors']:>4} {s['p50_ms']:>8.1f} {s['p95_ms']:>8.1f} {s['p99_ms']:>8.1f} "
+              f"{q:>6} {s['queries_max'] if s['queries_max'] is not None else '-':>5} "
+              f"{s['db_ms_avg'] if s['db_ms_avg'] is not None else '-':>7} {delta(name, 'p95_ms')} {delta(name, 'queries_avg')}")
+    print(f"throughput: {summary['ALL']['rps']} req/s {delta('ALL', 'rps')}")
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def run(args) -> dict:
+    mix = MIX
+    if args.only:
+        wanted = set(args.only.split(","))
+        mix = [m for m in MIX if m[0] in wanted]
+    rng = random.Random(args.seed)
+    ids = _sample_ids(rng)
+    plan = _requests(rng, args.requests, ids, mix)
+
+    if args.base_url:
+        client = httpx.AsyncClient(base_url=args.base_url, timeout=30)
+    else:
+        from app.main import app
+        client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench", timeout=30)
+    async with client:
+        if args.warmup:
+            await _replay(client, plan[:args.warmup], args.concurrency)     # 커넥션/매퍼/컴파일 캐시 워밍업
+        return await _replay(client, plan, args.concurrency)
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--db-url", default=None, help="in-process 실행 시 대상 DB (없으면 앱 설정)")
+    ap.add_argument("--base-url", default=None, help="실행 중인 서버에 보낼 때 (예: http://127.0.0.1:8000)")
+    ap.add_argument("--requests", type=int, default=2000)
+    ap.add_argument("--concurrency", type=int, default=10)
+    ap.add_argument("--warmup", type=int, default=200, help="측정 전 버리는 요청 수")
+    ap.add_argument("--only", default=None, help="콤마 구분 엔드포인트 이름만 (기본: 전체 믹스)")
+    ap.add_argument("--seed", type=int, default=7)
+    ap.add_argument("--out", default=None, help="결과 JSON 저장 경로")
+    ap.add_argument("--compare", default=None, help="이전 --out JSON 과 p95/쿼리 수/처리량 비교")
+    args = ap.parse_args()
+
+    if args.db_url:
+        _use_db_url(args.db_url)
+    summary = asyncio.run(run(args))
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            prev = json.load(f)
+        baseline = prev["summary"]
+        print(f"[bench_load] compare with {args.compare} (commit {prev.get('commit')})")
+    _print(summary, baseline)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump({"commit": _git_commit(), "args": vars(args), "summary": summary}, f, ensure_ascii=False, indent=2)
+        print(f"[bench_load] saved {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+# app/scripts/bench_push.py
+# Expo 푸시 전송 처리량 벤치마크 (fake 서버 사용, 네트워크 불필요)
+# 실행: python -m app.scripts.bench_push --messages 5000
+#       python -m app.scripts.bench_push --url http://127.0.0.1:8765   # 별도 uvicorn으로 띄운 fake 서버 사용
+import argparse
+import asyncio
+import time
+
+import httpx
+
+from app.scripts import fake_expo_server
+from app.utils import notify as expo
+
+
+def _messages(n: int) -> list:
+    return [
+        expo.build_expo_message(
+            f"ExponentPushToken[{'unregistered' if i % 50 == 0 else 'bench'}-{i}]",
+            "벤치마크", f"메시지 {i}", {"nid": i},
+        )
+        for i in range(n)
+    ]
+
+
+def _client(url: str | None, **kw) -> httpx.AsyncClient:
+    if url:
+        return httpx.AsyncClient(base_url=url, **kw)
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=fake_expo_server.app), **kw)
+
+
+async def bench_legacy(messages: list, url: str | None) -> float:
+    """기존 방식: 메시지마다 새 클라이언트 + 1건씩 POST + 무제한 gather"""
+    async def _one(m):
+        async with _client(url) as c:
+            r = await c.post(expo.EXPO_PUSH_URL, json=m)
+            return r.json()
+
+    t0 = time.perf_counter()
+    await asyncio.gather(*(_one(m) for m in messages))
+    return time.perf_counter() - t0
+
+
+async def bench_batched(messages: list, url: str | None, max_in_flight: int) -> tuple[float, list]:
+    """신규 방식: 공유 클라이언트 + 100건 batch + 동시 요청 제한 + 재시도"""
+    async with _client(url) as c:
+        t0 = time.perf_counter()
+        tickets = await expo.send_expo_push_batch(messages, client=c, max_in_flight=max_in_flight)
+        return time.perf_counter() - t0, tickets
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--messages", type=int, default=2000)
+    ap.add_argument("--max-in-flight", type=int, default=expo.EXPO_MAX_IN_FLIGHT)
+    ap.add_argument("--url", default=None, help="fake 서버 주소 (없으면 in-process ASGI)")
+    ap.add_argument("--skip-legacy", action="store_true")
+    args = ap.parse_args()
+
+    if args.url:
+        # 절대 URL로 요청하므로 fake 서버 주소로 교체
+        expo.EXPO_PUSH_URL = f"{args.url.rstrip('/')}/--/api/v2/push/send"
+        expo.EXPO_RECEIPTS_URL = f"{args.url.rstrip('/')}/--/api/v2/push/getReceipts"
+
+    msgs = _messages(args.messages)
+    print(f"messages={len(msgs)} latency={fake_expo_server.LATENCY_MS}ms error_rate={fake_expo_server.ERROR_RATE}")
+
+    if not args.skip_legacy:
+        dt = asyncio.run(bench_legacy(msgs, args.url))
+        print(f"[legacy ] {dt:8.3f}s  {len(msgs) / dt:10.1f} msg/s")
+
+    dt, tickets = asyncio.run(bench_batched(msgs, args.url, args.max_in_flight))
+    ok = sum(1 for t in tickets if t.get("status") == "ok")
+    dead = sum(1 for t in tickets if expo.is_device_not_registered(t))
+    print(f"[batched] {dt:8.3f}s  {len(msgs) / dt:10.1f} msg/s  ok={ok} device_not_registered={dead}")
+
+
+if __name__ == "__main__":
+    main()
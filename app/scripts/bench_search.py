@@ -0,0 +1,117 @@
+# app/scripts/bench_search.py
+# 검색 벤치마크: LIKE '%kw%' vs ngram FULLTEXT MATCH ... AGAINST
+# 실행: python -m app.scripts.bench_search --db-url mysql+pymysql://user:pw@127.0.0.1:3307/bench --rows 200000
+#       (SQLite로 돌리면 LIKE만 측정)
+# 주의: 대상 DB의 venue/artist/performance 테이블을 지우고 다시 만든다 → 벤치 전용 DB에서만 실행
+import argparse
+import random
+import statistics
+import time
+from datetime import date, datetime, time as dt_time, timedelta
+
+from sqlalchemy import create_engine, insert, text
+from sqlalchemy.dialects.mysql import match
+from sqlalchemy.orm import sessionmaker
+
+import app.models  # noqa: F401
+from app.crud.search import FULLTEXT_INDEXES, boolean_query, fulltext_ddl
+from app.models.artist import Artist
+from app.models.performance import Performance
+from app.models.venue import Venue
+
+# 코퍼스 재료 (실제 공연 제목/공연장 이름 형태를 흉내)
+WORDS = [
+    "인디", "밴드", "어쿠스틱", "단독", "공연", "콘서트", "라이브", "페스티벌", "겨울", "여름", "봄밤",
+    "쇼케이스", "투어", "앵콜", "재즈", "포크", "록", "펑크", "사운드", "클럽", "홍대", "연남", "망원",
+    "합정", "성수", "데뷔", "기념", "새앨범", "발매", "릴리즈", "파티", "스페셜", "나이트", "선셋", "vol",
+]
+DISTRICTS = ["마포구", "서대문구", "용산구", "성동구", "종로구", "강남구", "부산진구", "수영구", "해운대구"]
+KEYWORDS = ["인디", "단독 공연", "홍대 클럽", "재즈", "어쿠스틱 라이브", "새앨범 발매", "페스티벌", "록"]
+
+
+def _title(rng: random.Random) -> str:
+    return " ".join(rng.sample(WORDS, rng.randint(2, 5))) + f" #{rng.randint(1, 999)}"
+
+
+def seed(db, rows: int, seed_: int = 42):
+    rng = random.Random(seed_)
+    n_venue, n_artist = max(rows // 100, 10), max(rows // 20, 10)
+    db.execute(insert(Venue), [
+        {"id": i + 1, "name": f"{rng.choice(WORDS)}{rng.choice(WORDS)} {rng.choice(['홀', '클럽', '스튜디오', '라운지'])}",
+         "address": f"서울 {rng.choice(DISTRICTS)} {rng.choice(WORDS)}로 {rng.randint(1, 300)}", "region": "서울",
+         "instagram_account": f"bench{i}", "latitude": 37.5, "longitude": 127.0}
+        for i in range(n_venue)
+    ])
+    db.execute(insert(Artist), [{"id": i + 1, "name": f"{rng.choice(WORDS)}{rng.choice(WORDS)}{i}"} for i in range(n_artist)])
+    today = date.today()
+    for start in range(0, rows, 5000):
+        batch = []
+        for i in range(start, min(rows, start + 5000)):
+            d, t = today + timedelta(days=rng.randint(-600, 90)), dt_time(19, 0)
+            batch.append({
+                "title": _title(rng), "venue_id": rng.randint(1, n_venue), "date": d, "time": t,
+                "price": "",
+                "created_at": datetime.utcnow(), "updated_at": datetime.utcnow(),
+            })
+        db.execute(insert(Performance), batch)
+    db.commit()
+
+
+def _timed(fn, repeat: int):
+    samples, result = [], None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = fn()
+        samples.append((time.perf_counter() - t0) * 1000)
+    return statistics.median(samples), result
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--db-url", default="sqlite:///./bench_search.sqlite3")
+    ap.add_argument("--rows", type=int, default=100_000)
+    ap.add_argument("--repeat", type=int, default=10)
+    ap.add_argument("--reuse", action="store_true", help="기존 데이터 재사용 (seed 생략)")
+    args = ap.parse_args()
+
+    engine = create_engine(args.db_url)
+    is_mysql = engine.dialect.name == "mysql"
+    tables = [Performance.__table__, Artist.__table__, Venue.__table__]
+    if not args.reuse:
+        for t in tables:
+            t.drop(engine, checkfirst=True)
+        for t in reversed(tables):
+            t.create(engine)
+    db = sessionmaker(bind=engine)()
+    if not args.reuse:
+        t0 = time.perf_counter()
+        seed(db, args.rows)
+        if is_mysql:
+            for table, name, cols in FULLTEXT_INDEXES:
+                db.execute(text(fulltext_ddl(table, name, cols)))
+            db.commit()
+        print(f"seeded {args.rows} performances in {time.perf_counter() - t0:.1f}s")
+
+    print(f"{'keyword':<14} {'LIKE ms':>9} {'LIKE hits':>10} {'FT ms':>9} {'FT hits':>9}  overlap")
+    for kw in KEYWORDS:
+        words = kw.split()
+        like_q = db.query(Performance.id)
+        for w in words:
+            like_q = like_q.filter(Performance.title.contains(w, autoescape=True))
+        like_ms, like_ids = _timed(lambda: {r[0] for r in like_q.all()}, args.repeat)
+
+        if is_mysql and boolean_query(kw):
+            score = match(Performance.title, against=boolean_query(kw)).in_boolean_mode()
+            ft_q = db.query(Performance.id).filter(score)
+            ft_ms, ft_ids = _timed(lambda: {r[0] for r in ft_q.all()}, args.repeat)
+            overlap = len(like_ids & ft_ids) / max(len(like_ids), 1)
+            print(f"{kw:<14} {like_ms:>9.2f} {len(like_ids):>10} {ft_ms:>9.2f} {len(ft_ids):>9}  {overlap:.0%}")
+        else:
+            reason = "ngram보다 짧음 → LIKE fallback" if is_mysql else "FULLTEXT 미지원"
+            print(f"{kw:<14} {like_ms:>9.2f} {len(like_ids):>10} {'-':>9} {'-':>9}  ({reason})")
+
+    db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+# app/scripts/bench_start_at.py
+# "예정 공연" 조건 벤치마크: 기존 (date, time) OR 조건 vs start_at 범위 조건
+# 실행: python -m app.scripts.bench_start_at --rows 200000
+#       python -m app.scripts.bench_start_at --db-url mysql+pymysql://user:pw@127.0.0.1:3307/bench   # 벤치 전용 DB!
+# 주의: 대상 DB에 venue/performance 테이블을 만들고 더미 데이터를 넣는다 (운영 DB에 쓰지 말 것)
+import argparse
+import random
+import statistics
+import time
+from datetime import date, datetime, time as dt_time, timedelta
+
+from sqlalchemy import and_, create_engine, insert, or_, text
+from sqlalchemy.orm import sessionmaker
+
+import app.models  # noqa: F401  (relationship 대상 매퍼 등록)
+from app.models.performance import Performance
+from app.models.venue import Venue
+from app.utils.time_window import now_kst, past_filter, today_remaining_filter, upcoming_filter
+
+
+def _seed(db, rows: int, venues: int):
+    db.execute(insert(Venue), [
+        {"id": i + 1, "name": f"bench venue {i}", "address": "서울", "region": "서울",
+         "instagram_account": f"bench{i}", "latitude": 37.5, "longitude": 127.0}
+        for i in range(venues)
+    ])
+    today = now_kst().date()
+    batch = []
+    for i in range(rows):
+        d = today + timedelta(days=random.randint(-700, 120))  # 대부분 지난 공연 (실데이터 분포)
+        t = dt_time(random.choice([17, 18, 19, 20]), random.choice([0, 30]))
+        batch.append({
+            "title": f"bench {i}", "venue_id": random.randint(1, venues), "date": d, "time": t,
+            "price": "",
+            "created_at": datetime.utcnow(), "updated_at": datetime.utcnow(),
+        })
+        if len(batch) >= 5000:
+            db.execute(insert(Performance), batch)
+            batch.clear()
+    if batch:
+        db.execute(insert(Performance), batch)
+    db.commit()
+
+
+def _legacy_upcoming(now: datetime):
+    return or_(
+        Performance.date > now.date(),
+        and_(Performance.date == now.date(), or_(Performance.time == None, Performance.time >= now.time())),
+    )
+
+
+def _legacy_today_remaining(now: datetime):
+    return and_(Performance.date == now.date(), Performance.time >= now.time())
+
+
+def _explain(db, query) -> str:
+    stmt = query.statement.compile(db.bind, compile_kwargs={"literal_binds": True})
+    prefix = "EXPLAIN QUERY PLAN " if db.bind.dialect.name == "sqlite" else "EXPLAIN "
+    rows = db.execute(text(prefix + str(stmt))).all()
+    return "\n      ".join(" | ".join(str(c) for c in r) for r in rows)
+
+
+def _time(fn, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - t0) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--db-url", default="sqlite:///./bench_start_at.sqlite3")
+    ap.add_argument("--rows", type=int, default=100_000)
+    ap.add_argument("--venues", type=int, default=300)
+    ap.add_argument("--repeat", type=int, default=20)
+    ap.add_argument("--reuse", action="store_true", help="기존 데이터 재사용 (seed 생략)")
+    args = ap.parse_args()
+
+    engine = create_engine(args.db_url)
+    if not args.reuse:
+        Performance.__table__.drop(engine, checkfirst=True)
+        Venue.__table__.drop(engine, checkfirst=True)
+        Venue.__table__.create(engine)
+        Performance.__table__.create(engine)  # ix_performance_start_at / ix_performance_venue_start_at 포함
+    db = sessionmaker(bind=engine)()
+    if not args.reuse:
+        t0 = time.perf_counter()
+        _seed(db, args.rows, args.venues)
+        print(f"seeded {args.rows} rows in {time.perf_counter() - t0:.1f}s")
+
+    now = now_kst()
+    venue_id = 1
+    cases = [
+        ("upcoming list (limit 20)",
+         db.query(Performance.id).filter(_legacy_upcoming(now)).order_by(Performance.date, Performance.time, Performance.id).limit(20),
+         db.query(Performance.id).filter(upcoming_filter(now)).order_by(Performance.start_at, Performance.id).limit(20)),
+        ("upcoming count",
+         db.query(Performance.id).filter(_legacy_upcoming(now)),
+         db.query(Performance.id).filter(upcoming_filter(now))),
+        ("venue past (limit 20)",
+         db.query(Performance.id).filter(Performance.venue_id == venue_id, ~_legacy_upcoming(now))
+           .order_by(Performance.date.desc(), Performance.time.desc()).limit(20),
+         db.query(Performance.id).filter(Performance.venue_id == venue_id, past_filter(now))
+           .order_by(Performance.start_at.desc()).limit(20)),
+        ("today remaining",
+         db.query(Performance.id).filter(_legacy_today_remaining(now)),
+         db.query(Performance.id).filter(*today_remaining_filter(now))),
+    ]
+
+    for name, legacy, new in cases:
+        run = (lambda q: q.count()) if "count" in name else (lambda q: q.all())
+        ms_old = _time(lambda: run(legacy), args.repeat)
+        ms_new = _time(lambda: run(new), args.repeat)
+        print(f"\n[{name}] legacy {ms_old:.2f}ms → start_at {ms_new:.2f}ms ({ms_old / max(ms_new, 1e-6):.1f}x)")
+        print(f"  legacy plan:\n      {_explain(db, legacy)}")
+        print(f"  start_at plan:\n      {_explain(db, new)}")
+
+    db.close()
+
+
+if __name__ == "__main__":
+    main()
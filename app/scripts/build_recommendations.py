@@ -0,0 +1,21 @@
+# app/scripts/build_recommendations.py
+# 추천 테이블(user_recommendation) 재계산
+# 실행: python -m app.scripts.build_recommendations [--top-n 30]
+#       (cron / Cloud Scheduler 로 하루 몇 번 실행)
+import argparse
+
+from app.database import SessionLocal
+from app.services.recommend import RECOMMEND_TOP_N, build_recommendations
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--top-n", type=int, default=RECOMMEND_TOP_N)
+    args = ap.parse_args()
+
+    with SessionLocal() as db:
+        build_recommendations(db, top_n=args.top_n)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+# app/scripts/crawl_accounts.py
+# 크롤링 대상 계정 관리 (crawl_account 테이블)
+# 실행: python -m app.scripts.crawl_accounts import-json          # 기존 account_list.json + previous_posts.json 이전
+#       python -m app.scripts.crawl_accounts add mudaeruk @clubfreebird
+#       python -m app.scripts.crawl_accounts remove mudaeruk
+#       python -m app.scripts.crawl_accounts list
+import argparse
+
+from app.database import SessionLocal
+from app.models.crawl_state import CrawlAccount
+from app.services.instagram.account_loader import add_accounts, import_json_state, remove_account
+from app.services.instagram.get_post import ACCOUNTS_PATH, PREVIOUS_POSTS_PATH
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    sub = ap.add_subparsers(dest="command", required=True)
+    imp = sub.add_parser("import-json")
+    imp.add_argument("--accounts", default=ACCOUNTS_PATH)
+    imp.add_argument("--previous-posts", default=PREVIOUS_POSTS_PATH)
+    sub.add_parser("add").add_argument("accounts", nargs="+")
+    sub.add_parser("remove").add_argument("accounts", nargs="+")
+    sub.add_parser("list")
+    args = ap.parse_args()
+
+    with SessionLocal() as db:
+        if args.command == "import-json":
+            print(f"[crawl_accounts] imported {import_json_state(db, args.accounts, args.previous_posts)} accounts")
+        elif args.command == "add":
+            print(f"[crawl_accounts] added {add_accounts(db, args.accounts)} accounts")
+        elif args.command == "remove":
+            for account in args.accounts:
+                print(f"[crawl_accounts] {account}: {'removed' if remove_account(db, account) else 'not found'}")
+        else:
+            for a in db.query(CrawlAccount).order_by(CrawlAccount.account):
+                print(f"{'+' if a.is_active else '-'} {a.account:<30} {a.last_shortcode or '-':<14} "
+                      f"checked={a.last_checked_at or '-'} fails={a.fail_count}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+# app/scripts/fake_expo_server.py
+# 오프라인 벤치마크용 Expo Push API 흉내 서버
+# 실행: uvicorn app.scripts.fake_expo_server:app --port 8765
+#       EXPO_BASE_URL=http://127.0.0.1:8765 로 지정하면 app.utils.notify가 여기로 전송
+#
+# env 옵션
+#   FAKE_EXPO_LATENCY_MS   : 요청당 지연 (기본 50ms)
+#   FAKE_EXPO_ERROR_RATE   : 429/503 응답 비율 (기본 0.0)
+# 토큰에 "unregistered"가 들어있으면 ticket 단계에서, "stale"이 들어있으면 receipt 단계에서
+# DeviceNotRegistered 로 응답
+import os
+import asyncio
+import random
+import uuid
+from typing import Any, Dict, List, Union
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+LATENCY_MS = float(os.getenv("FAKE_EXPO_LATENCY_MS", "50"))
+ERROR_RATE = float(os.getenv("FAKE_EXPO_ERROR_RATE", "0"))
+MAX_BATCH = 100
+
+app = FastAPI(title="fake-expo")
+
+# ticket id → receipt
+_receipts: Dict[str, dict] = {}
+stats = {"send_requests": 0, "messages": 0, "receipt_requests": 0, "throttled": 0}
+
+
+def _dead(token: str) -> dict:
+    return {
+        "status": "error",
+        "message": f'"{token}" is not a registered push notification recipient',
+        "details": {"error": "DeviceNotRegistered"},
+    }
+
+
+async def _maybe_fail():
+    await asyncio.sleep(LATENCY_MS / 1000)
+    if ERROR_RATE and random.random() < ERROR_RATE:
+        stats["throttled"] += 1
+        code = random.choice([429, 503])
+        return JSONResponse({"errors": [{"code": "TOO_MANY_REQUESTS"}]}, status_code=code, headers={"Retry-After": "0"})
+    return None
+
+
+@app.post("/--/api/v2/push/send")
+async def send(request: Request):
+    stats["send_requests"] += 1
+    failed = await _maybe_fail()
+    if failed:
+        return failed
+
+    body: Union[Dict[str, Any], List[Dict[str, Any]]] = await request.json()
+    single = isinstance(body, dict)
+    messages = [body] if single else body
+    if len(messages) > MAX_BATCH:
+        return JSONResponse({"errors": [{"code": "PUSH_TOO_MANY_NOTIFICATIONS"}]}, status_code=400)
+
+    tickets = []
+    for m in messages:
+        stats["messages"] += 1
+        token = m.get("to") or ""
+        if "unregistered" in token:
+            tickets.append(_dead(token))
+            continue
+        tid = uuid.uuid4().hex
+        _receipts[tid] = _dead(token) if "stale" in token else {"status": "ok"}
+        tickets.append({"status": "ok", "id": tid})
+
+    return {"data": tickets[0] if single else tickets}
+
+
+@app.post("/--/api/v2/push/getReceipts")
+async def get_receipts(request: Request):
+    stats["receipt_requests"] += 1
+    failed = await _maybe_fail()
+    if failed:
+        return failed
+    body = await request.json()
+    ids = body.get("ids") or []
+    return {"data": {i: _receipts[i] for i in ids if i in _receipts}}
+
+
+@app.get("/__stats")
+def get_stats():
+    return stats
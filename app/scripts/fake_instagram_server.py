@@ -0,0 +1,131 @@
+# app/scripts/fake_instagram_server.py
+# 오프라인 크롤링 벤치용 인스타그램 흉내 서버 (HTML fixture)
+# 실행: uvicorn app.scripts.fake_instagram_server:app --port 8766
+#       INSTAGRAM_BASE_URL=http://127.0.0.1:8766 python -m app.crawl   (또는 python -m app.scripts.bench_crawl)
+#
+# 실제 페이지처럼 동작하는 부분만 흉내
+# - /{account}/      : 빈 껍데기 HTML → 스크립트가 FAKE_IG_RENDER_MS 뒤에 게시물 링크(a[href="/p/.."]) 12개를 그림
+#                      (썸네일 이미지, 웹폰트, 자동재생 영상 포함 → 리소스 차단 효과 확인용)
+# - 게시물 링크 클릭 : /api/p/{shortcode} 를 fetch 해서 div[role="dialog"] (h1._ap3a 본문 + img) 를 띄움
+# - shortcode 는 (계정, generation) 해시 → POST /__rotate 로 generation 을 올리면 모든 계정에 새 게시물
+#
+# env 옵션
+#   FAKE_IG_LATENCY_MS       : HTML/API 응답 지연 (기본 80ms)
+#   FAKE_IG_RENDER_MS        : 프로필 게시물 링크를 그리기까지 클라이언트 지연 (기본 300ms)
+#   FAKE_IG_ASSET_LATENCY_MS : 이미지/폰트/영상 응답 지연 (기본 150ms)
+#   FAKE_IG_EMPTY_RATE       : 게시물이 없는 계정 비율 (기본 0.05)
+import asyncio
+import hashlib
+import os
+from typing import Optional
+
+from fastapi import FastAPI, Request
+from fastapi.responses import HTMLResponse, Response
+
+LATENCY_MS = float(os.getenv("FAKE_IG_LATENCY_MS", "80"))
+RENDER_MS = int(os.getenv("FAKE_IG_RENDER_MS", "300"))
+ASSET_LATENCY_MS = float(os.getenv("FAKE_IG_ASSET_LATENCY_MS", "150"))
+EMPTY_RATE = float(os.getenv("FAKE_IG_EMPTY_RATE", "0.05"))
+POSTS_PER_PROFILE = 12
+
+app = FastAPI(title="fake-instagram")
+
+state = {"generation": 0}
+stats = {"profiles": 0, "posts": 0, "images": 0, "fonts": 0, "media": 0}
+
+# 1x1 GIF. 크기보다는 지연(FAKE_IG_ASSET_LATENCY_MS)으로 비용을 흉내
+_GIF = bytes.fromhex("47494638396101000100800000ffffff00000021f90401000000002c00000000010001000002024401003b")
+
+
+def _hash(*parts) -> str:
+    return hashlib.md5(":".join(str(p) for p in parts).encode()).hexdigest()
+
+
+def shortcode(account: str, index: int = 0, generation: Optional[int] = None) -> str:
+    """index 0 이 최신 게시물"""
+    generation = state["generation"] if generation is None else generation
+    return "F" + _hash(account, generation - index)[:10]
+
+
+def _is_empty(account: str) -> bool:
+    return int(_hash("empty", account)[:8], 16) / 0xFFFFFFFF < EMPTY_RATE
+
+
+async def _latency(ms: float):
+    if ms > 0:
+        await asyncio.sleep(ms / 1000)
+
+
+_PROFILE_HTML = """<!doctype html>
+<html><head><meta charset="utf-8"><title>@{account}</title>
+<style>@font-face {{ font-family: ig; src: url(/static/font/ig.woff2) format("woff2"); }} body {{ font-family: ig; }}</style>
+</head><body>
+<header><img src="/static/img/profile-{account}.jpg"><h2>{account}</h2></header>
+<video src="/static/media/{account}.mp4" autoplay muted></video>
+<main id="grid"></main>
+<script>
+const shortcodes = {shortcodes};
+setTimeout(() => {{
+  const grid = document.getElementById("grid");
+  for (const sc of shortcodes) {{
+    const a = document.createElement("a");
+    a.href = "/p/" + sc + "/";
+    a.innerHTML = '<img src="/static/img/' + sc + '.jpg">';
+    a.addEventListener("click", async (e) => {{
+      e.preventDefault();
+      const post = await (await fetch("/api/p/" + sc)).json();
+      const dialog = document.createElement("div");
+      dialog.setAttribute("role", "dialog");
+      const h1 = document.createElement("h1");
+      h1.className = "_ap3a";
+      h1.innerText = post.text;
+      const img = document.createElement("img");
+      img.src = post.image_url;
+      dialog.append(h1, img);
+      document.body.append(dialog);
+    }});
+    grid.append(a);
+  }}
+}}, {render_ms});
+</script>
+</body></html>"""
+
+
+@app.get("/static/{kind}/{name}")
+async def asset(kind: str, name: str):
+    stats[{"img": "images", "font": "fonts"}.get(kind, "media")] += 1
+    await _latency(ASSET_LATENCY_MS)
+    media_type = {"img": "image/gif", "font": "font/woff2"}.get(kind, "video/mp4")
+    return Response(_GIF if kind == "img" else b"\x00" * 1024, media_type=media_type)
+
+
+@app.get("/api/p/{code}")
+async def post(code: str, request: Request):
+    stats["posts"] += 1
+    await _latency(LATENCY_MS)
+    base = str(request.base_url).rstrip("/")
+    return {
+        "shortcode": code,
+        "text": f"[공연 안내] {code}\n2025.09.{int(_hash(code)[:2], 16) % 28 + 1:02d} 19:30\n예매 30,000원",
+        "image_url": f"{base}/static/img/{code}.jpg",
+    }
+
+
+@app.get("/__stats")
+def get_stats():
+    return {**stats, "generation": state["generation"]}
+
+
+@app.post("/__rotate")
+def rotate():
+    """모든 계정에 새 게시물 1개씩 (최신 shortcode 변경)"""
+    state["generation"] += 1
+    return {"generation": state["generation"]}
+
+
+@app.get("/{account}/", response_class=HTMLResponse)
+async def profile(account: str):
+    stats["profiles"] += 1
+    await _latency(LATENCY_MS)
+    codes = [] if _is_empty(account) else [shortcode(account, i) for i in range(POSTS_PER_PROFILE)]
+    return _PROFILE_HTML.format(account=account, shortcodes=codes, render_ms=RENDER_MS)
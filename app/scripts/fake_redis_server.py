@@ -0,0 +1,138 @@
+# app/scripts/fake_redis_server.py
+# 로컬 개발/벤치마크용 Redis 흉내 서버 (RESP2, 응답 캐시가 쓰는 명령만)
+# 실행: python -m app.scripts.fake_redis_server --port 6390
+#       RESPONSE_CACHE_BACKEND=redis RESPONSE_CACHE_URL=redis://127.0.0.1:6390/0 로 API 서버 실행
+#
+# 지원 명령: PING AUTH SELECT GET SET(EX/PX) DEL EXISTS SADD SMEMBERS EXPIRE PEXPIRE DBSIZE FLUSHDB FLUSHALL
+# 데이터는 프로세스 메모리에만 있음 (재시작하면 비워짐)
+import argparse
+import asyncio
+import time
+from typing import Dict, Optional, Tuple
+
+# key → (값: bytes | set, 만료 시각 monotonic 또는 None)
+_store: Dict[bytes, Tuple[object, Optional[float]]] = {}
+stats = {"commands": 0, "connections": 0}
+
+
+def _alive(key: bytes):
+    item = _store.get(key)
+    if item is None:
+        return None
+    if item[1] is not None and item[1] <= time.monotonic():
+        del _store[key]
+        return None
+    return item
+
+
+def _bulk(v: Optional[bytes]) -> bytes:
+    return b"$-1\r\n" if v is None else b"$%d\r\n%s\r\n" % (len(v), v)
+
+
+def _int(n: int) -> bytes:
+    return b":%d\r\n" % n
+
+
+def _err(msg: str) -> bytes:
+    return f"-ERR {msg}\r\n".encode()
+
+
+def handle(args) -> bytes:
+    stats["commands"] += 1
+    cmd = args[0].upper()
+    if cmd == b"PING":
+        return b"+PONG\r\n"
+    if cmd in (b"AUTH", b"SELECT"):
+        return b"+OK\r\n"
+    if cmd == b"GET":
+        item = _alive(args[1])
+        if item is not None and not isinstance(item[0], bytes):
+            return b"-WRONGTYPE Operation against a key holding the wrong kind of value\r\n"
+        return _bulk(item[0] if item else None)
+    if cmd == b"SET":
+        expire = None
+        opts = [a.upper() for a in args[3:]]
+        for i, opt in enumerate(opts):
+            if opt in (b"EX", b"PX") and i + 1 < len(opts):
+                sec = int(args[3 + i + 1]) / (1000 if opt == b"PX" else 1)
+                expire = time.monotonic() + sec
+        _store[args[1]] = (args[2], expire)
+        return b"+OK\r\n"
+    if cmd == b"DEL":
+        return _int(sum(1 for k in args[1:] if _alive(k) is not None and _store.pop(k, None) is not None))
+    if cmd == b"EXISTS":
+        return _int(sum(1 for k in args[1:] if _alive(k) is not None))
+    if cmd == b"SADD":
+        item = _alive(args[1])
+        members = item[0] if item else set()
+        if not isinstance(members, set):
+            return b"-WRONGTYPE Operation against a key holding the wrong kind of value\r\n"
+        before = len(members)
+        members.update(args[2:])
+        _store[args[1]] = (members, item[1] if item else None)
+        return _int(len(members) - before)
+    if cmd == b"SMEMBERS":
+        item = _alive(args[1])
+        members = item[0] if item and isinstance(item[0], set) else set()
+        return b"*%d\r\n" % len(members) + b"".join(_bulk(m) for m in members)
+    if cmd in (b"EXPIRE", b"PEXPIRE"):
+        item = _alive(args[1])
+        if item is None:
+            return _int(0)
+        sec = int(args[2]) / (1000 if cmd == b"PEXPIRE" else 1)
+        _store[args[1]] = (item[0], time.monotonic() + sec)
+        return _int(1)
+    if cmd == b"DBSIZE":
+        return _int(sum(1 for k in list(_store) if _alive(k) is not None))
+    if cmd in (b"FLUSHDB", b"FLUSHALL"):
+        _store.clear()
+        return b"+OK\r\n"
+    return _err(f"unknown command '{cmd.decode(errors='replace')}'")
+
+
+async def _read_command(reader: asyncio.StreamReader):
+    line = await reader.readline()
+    if not line:
+        return None
+    if not line.startswith(b"*"):           # inline 명령 (redis-cli/telnet)
+        return line.strip().split()
+    args = []
+    for _ in range(int(line[1:-2])):
+        n = int((await reader.readline())[1:-2])
+        args.append((await reader.readexactly(n + 2))[:-2])
+    return args
+
+
+async def _serve(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+    stats["connections"] += 1
+    try:
+        while True:
+            args = await _read_command(reader)
+            if args is None:
+                break
+            if args:
+                writer.write(handle(args))
+                await writer.drain()
+    except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+        pass
+    finally:
+        writer.close()
+
+
+async def main_async(host: str, port: int):
+    server = await asyncio.start_server(_serve, host, port)
+    print(f"[fake_redis] listening on {host}:{port}")
+    async with server:
+        await server.serve_forever()
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=6390)
+    args = ap.parse_args()
+    asyncio.run(main_async(args.host, args.port))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,221 @@
+# app/scripts/gen_synthetic.py
+# 대용량 합성 데이터 생성기 (쿼리 스케일링 확인 / bench_load 용)
+# 실행: python -m app.scripts.gen_synthetic --db-url sqlite:///./synthetic.sqlite3 --users 100000 --likes 1000000 --notifications 5000000
+#       python -m app.scripts.gen_synthetic --db-url mysql+pymysql://user:pw@127.0.0.1:3307/bench --preset large
+# - seed_all_data(venue_data/artist_data 수작업 데이터)와 달리 행 수를 파라미터로 지정
+# - 인기 편중: 찜/알림/스탬프/리뷰는 소수 공연(공연장)에 몰리도록 skew (--skew 클수록 편중)
+# - (user, performance) 같은 복합 유니크 키는 set 없이 만들어서 수백만 행도 메모리 일정
+# - 같은 --seed 면 같은 데이터 → 커밋 간 bench_load 결과 비교 가능
+# 주의: 대상 DB의 모든 테이블을 지우고 다시 만든다 → 벤치 전용 DB에서만 실행
+import argparse
+import json
+import random
+import time
+from datetime import date, datetime, time as dt_time, timedelta
+from typing import Iterable, Iterator, Tuple
+
+from sqlalchemy import create_engine, event, insert, text
+from sqlalchemy.orm import sessionmaker
+
+import app.models  # noqa: F401
+from app.constants.notification_types import FAVORITE_PERFORMANCE_D1, NEW_PERFORMANCE_BY_ARTIST, TICKET_OPEN
+from app.crud.search import FULLTEXT_INDEXES, fulltext_ddl
+from app.database import Base
+from app.models import (
+    Artist, Notification, Performance, PerformanceArtist, Review, Stamp, User, UserFavoriteArtist,
+    UserFavoritePerformance, UserPerformanceTicketAlarm, Venue,
+)
+from app.scripts.bench_search import DISTRICTS, WORDS
+from app.services.counters import reconcile_like_counts
+from app.services.trending import recompute_trending
+
+NOTIFICATION_TYPES = (NEW_PERFORMANCE_BY_ARTIST, TICKET_OPEN, FAVORITE_PERFORMANCE_D1)
+REGIONS = ["서울", "서울", "서울", "경기", "부산", "대구", "광주", "대전"]
+
+PRESETS = {
+    "small": dict(users=1_000, venues=50, artists=300, performances=2_000, likes=20_000, artist_likes=3_000,
+                  alarms=5_000, reviews=2_000, stamps=5_000, notifications=50_000),
+    "medium": dict(users=20_000, venues=300, artists=3_000, performances=30_000, likes=200_000, artist_likes=40_000,
+                   alarms=50_000, reviews=30_000, stamps=60_000, notifications=500_000),
+    "large": dict(users=100_000, venues=1_000, artists=10_000, performances=200_000, likes=1_000_000,
+                  artist_likes=200_000, alarms=300_000, reviews=200_000, stamps=300_000, notifications=5_000_000),
+}
+
+
+def _skewed_index(rng: random.Random, size: int, skew: float) -> int:
+    """0 쪽(인기 상위)에 몰리는 인덱스. skew=1 이면 균등"""
+    return min(size - 1, int(size * rng.random() ** skew))
+
+
+def unique_pairs(rng: random.Random, n: int, left: int, right: int, skew: float) -> Iterator[Tuple[int, int]]:
+    """
+    (left 인덱스, right 인덱스) 중복 없는 n 쌍
+    left 는 순환하고, 각 left 는 skew 된 시작점부터 right 를 연속으로 가져감
+    → 같은 left 안에서 right 가 겹치지 않으므로 set 없이 유니크 (최대 left*right 쌍)
+    """
+    if n > left * right:
+        raise ValueError(f"requested {n} pairs but only {left * right} unique pairs exist")
+    offsets = [_skewed_index(rng, right, skew) for _ in range(left)]
+    for i in range(n):
+        u, k = i % left, i // left
+        yield u, (offsets[u] + k) % right
+
+
+def _title(rng: random.Random) -> str:
+    return " ".join(rng.sample(WORDS, rng.randint(2, 5))) + f" #{rng.randint(1, 999)}"
+
+
+def _recent(rng: random.Random, now: datetime, days: int) -> datetime:
+    return now - timedelta(seconds=rng.randint(0, days * 86400))
+
+
+def _bulk(db, model, rows: Iterable[dict], batch: int) -> int:
+    """Core INSERT 를 batch 단위 executemany (ORM 이벤트/identity map 없이)"""
+    table, buf, n, t0 = model.__table__, [], 0, time.perf_counter()
+    for row in rows:
+        buf.append(row)
+        if len(buf) >= batch:
+            db.execute(insert(table), buf)
+            db.commit()
+            n += len(buf)
+            buf = []
+            print(f"\r[gen_synthetic] {table.name}: {n:,}", end="", flush=True)
+    if buf:
+        db.execute(insert(table), buf)
+        db.commit()
+        n += len(buf)
+    print(f"\r[gen_synthetic] {table.name}: {n:,} rows in {time.perf_counter() - t0:.1f}s")
+    return n
+
+
+def generate(db, *, users: int, venues: int, artists: int, performances: int, likes: int, artist_likes: int,
+             alarms: int, reviews: int, stamps: int, notifications: int, skew: float = 3.0,
+             batch: int = 5000, seed: int = 42) -> None:
+    rng = random.Random(seed)
+    now = datetime.utcnow()
+    today = date.today()
+
+    _bulk(db, User, ({
+        "id": i + 1, "kakao_id": f"synthetic-{i + 1}", "nickname": f"user{i + 1}", "is_completed": True,
+        "alarm_enabled": rng.random() < 0.5, "location_enabled": rng.random() < 0.3,
+        "push_token": f"ExponentPushToken[synthetic-{i + 1}]" if rng.random() < 0.2 else None,
+        "email_verified": False, "created_at": _recent(rng, now, 365), "updated_at": now,
+    } for i in range(users)), batch)
+
+    _bulk(db, Venue, ({
+        "id": i + 1,
+        "name": f"{rng.choice(WORDS)}{rng.choice(WORDS)} {rng.choice(['홀', '클럽', '스튜디오', '라운지'])} {i + 1}",
+        "address": f"{rng.choice(REGIONS)} {rng.choice(DISTRICTS)} {rng.choice(WORDS)}로 {rng.randint(1, 300)}",
+        "region": rng.choice(REGIONS), "instagram_account": f"synthetic_venue{i + 1}",
+        "latitude": 37.45 + rng.random() * 0.2, "longitude": 126.85 + rng.random() * 0.25,
+    } for i in range(venues)), batch)
+
+    _bulk(db, Artist, ({
+        "id": i + 1, "name": f"{rng.choice(WORDS)}{rng.choice(WORDS)}{i + 1}",
+        "instagram_account": f"synthetic_artist{i + 1}",
+    } for i in range(artists)), batch)
+
+    def perf_rows():
+        for i in range(performances):
+            d = today + timedelta(days=rng.randint(-365, 90))
+            t = dt_time(rng.choice([18, 19, 19, 20, 20, 21]), rng.choice([0, 30]))
+            ticket = d - timedelta(days=rng.randint(7, 30))
+            created = min(now, datetime.combine(ticket, dt_time(0)) - timedelta(days=rng.randint(0, 10)))
+            yield {
+                "id": i + 1, "title": _title(rng), "venue_id": _skewed_index(rng, venues, 1.5) + 1,
+                "date": d, "time": t,
+                "ticket_open_date": ticket, "ticket_open_time": dt_time(20, 0),
+                "price": f"{rng.choice([15, 20, 25, 30, 35])},000원", "created_at": created, "updated_at": created,
+            }
+    _bulk(db, Performance, perf_rows(), batch)
+
+    # 공연당 출연 아티스트 1~3 (공연 순환 → 공연별 연속 아티스트라 유니크)
+    lineup = sum(rng.choice([1, 1, 2, 3]) for _ in range(performances))
+    _bulk(db, PerformanceArtist, ({"performance_id": p + 1, "artist_id": a + 1}
+                                  for p, a in unique_pairs(rng, min(lineup, performances * artists), performances,
+                                                           artists, 1.5)), batch)
+
+    # 인기 순위 → 공연 id (skew 인덱스 0 이 가장 인기)
+    popular = list(range(1, performances + 1))
+    rng.shuffle(popular)
+
+    _bulk(db, UserFavoritePerformance, ({
+        "user_id": u + 1, "performance_id": popular[p], "created_at": _recent(rng, now, 60),
+    } for u, p in unique_pairs(rng, likes, users, performances, skew)), batch)
+
+    _bulk(db, UserFavoriteArtist, ({"user_id": u + 1, "artist_id": a + 1}
+                                   for u, a in unique_pairs(rng, artist_likes, users, artists, skew)), batch)
+
+    _bulk(db, UserPerformanceTicketAlarm, ({"user_id": u + 1, "performance_id": popular[p]}
+                                           for u, p in unique_pairs(rng, alarms, users, performances, skew)), batch)
+
+    _bulk(db, Stamp, ({
+        "user_id": u + 1, "performance_id": popular[p], "created_at": _recent(rng, now, 365),
+    } for u, p in unique_pairs(rng, stamps, users, performances, skew)), batch)
+
+    _bulk(db, Review, ({
+        "user_id": rng.randint(1, users), "venue_id": _skewed_index(rng, venues, skew) + 1,
+        "content": " ".join(rng.choices(WORDS, k=rng.randint(5, 30))), "created_at": _recent(rng, now, 365),
+        "like_count": 0,
+    } for _ in range(reviews)), batch)
+
+    # 알림 유니크 키 (user_id, type, payload_json) → right = 타입 x 공연
+    types = len(NOTIFICATION_TYPES)
+
+    def notification_rows():
+        for u, k in unique_pairs(rng, notifications, users, performances * types, skew):
+            perf_id = popular[k // types]
+            yield {
+                "user_id": u + 1, "type": NOTIFICATION_TYPES[k % types], "title": "공연 알림",
+                "body": f"공연 #{perf_id} 소식", "link_url": f"/performance/{perf_id}",
+                "payload_json": json.dumps({"performance_id": perf_id}, separators=(",", ":")),
+                "is_read": rng.random() < 0.7, "created_at": _recent(rng, now, 90),
+            }
+    _bulk(db, Notification, notification_rows(), batch)
+
+    # 비정규화 컬럼(performance.like_count / trending_score) 채우기
+    reconcile_like_counts(db)
+    recompute_trending(db)
+
+
+def _sqlite_fast_writes(engine) -> None:
+    @event.listens_for(engine, "connect")
+    def _pragmas(dbapi_conn, record):
+        cur = dbapi_conn.cursor()
+        cur.execute("PRAGMA journal_mode=WAL")
+        cur.execute("PRAGMA synchronous=OFF")
+        cur.close()
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--db-url", default="sqlite:///./synthetic.sqlite3")
+    ap.add_argument("--preset", choices=sorted(PRESETS), default="small", help="개별 옵션이 있으면 그 값이 우선")
+    for name in PRESETS["small"]:
+        ap.add_argument(f"--{name.replace('_', '-')}", type=int, default=None)
+    ap.add_argument("--skew", type=float, default=3.0, help="인기 편중 (1 = 균등)")
+    ap.add_argument("--batch-size", type=int, default=5000)
+    ap.add_argument("--seed", type=int, default=42)
+    args = ap.parse_args()
+
+    counts = {k: (getattr(args, k) if getattr(args, k) is not None else v) for k, v in PRESETS[args.preset].items()}
+    engine = create_engine(args.db_url)
+    is_mysql = engine.dialect.name == "mysql"
+    if engine.dialect.name == "sqlite":
+        _sqlite_fast_writes(engine)
+
+    t0 = time.perf_counter()
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    with sessionmaker(bind=engine)() as db:
+        generate(db, skew=args.skew, batch=args.batch_size, seed=args.seed, **counts)
+        if is_mysql:
+            for table, name, cols in FULLTEXT_INDEXES:
+                db.execute(text(fulltext_ddl(table, name, cols)))
+            db.commit()
+    engine.dispose()
+    print(f"[gen_synthetic] {counts} done in {time.perf_counter() - t0:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
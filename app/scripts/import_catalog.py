@@ -0,0 +1,26 @@
+# app/scripts/import_catalog.py
+# 공연장/아티스트 CSV·JSONL 대량 upsert (app/services/bulk_import.py)
+# 실행: python -m app.scripts.import_catalog venue venues.csv
+#       python -m app.scripts.import_catalog artist artists.jsonl --chunk-size 2000
+#       python -m app.scripts.import_catalog venue venues.csv --dry-run   (검증만, 쓰기 없음)
+# 자연 키(venue.instagram_account / artist.name) 기준이라 여러 번 돌려도 안전
+import argparse
+
+from app.database import SessionLocal
+from app.services.bulk_import import DEFAULT_CHUNK_SIZE, SPECS, import_file
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("entity", choices=sorted(SPECS))
+    ap.add_argument("path", help=".csv 또는 .jsonl")
+    ap.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    ap.add_argument("--dry-run", action="store_true")
+    args = ap.parse_args()
+
+    with SessionLocal() as db:
+        import_file(db, args.entity, args.path, chunk_size=args.chunk_size, dry_run=args.dry_run)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+# app/scripts/ingest_performances.py
+# 공연 일괄 등록 CLI (app/services/performance_ingest.py, POST /performance/bulk 와 같은 로직)
+# 실행: python -m app.scripts.ingest_performances shows.ndjson [--batch-size 500] [--create-artists] [--no-notify]
+#       python -m app.scripts.ingest_performances shows.json      (JSON 배열)
+#       cat shows.ndjson | python -m app.scripts.ingest_performances -
+# 배치마다 한 트랜잭션 + 알림 fan-out 작업 1건. 다시 돌려도 shortcode/(공연장, 날짜, 시각, 제목) 중복은 건너뜀
+import argparse
+import json
+import sys
+import time
+from typing import Iterator
+
+from app.database import SessionLocal
+from app.services.performance_ingest import MAX_BATCH, ingest_performances, parse_items
+
+
+def read_records(path: str) -> Iterator[dict]:
+    f = sys.stdin if path == "-" else open(path, encoding="utf-8-sig")
+    try:
+        if path.endswith(".json"):
+            data = json.load(f)
+            yield from ((data.get("performances") or []) if isinstance(data, dict) else data)
+            return
+        for line in f:       # NDJSON: 한 줄씩 스트리밍
+            if line.strip():
+                yield json.loads(line)
+    finally:
+        if f is not sys.stdin:
+            f.close()
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("path", help=".ndjson/.jsonl, .json 또는 - (stdin, NDJSON)")
+    ap.add_argument("--batch-size", type=int, default=500, help=f"트랜잭션당 공연 수 (최대 {MAX_BATCH})")
+    ap.add_argument("--create-artists", action="store_true", help="artist_names 중 없는 아티스트 생성")
+    ap.add_argument("--no-notify", action="store_true", help="새 공연 알림 작업 등록 안 함")
+    args = ap.parse_args()
+    batch_size = max(1, min(args.batch_size, MAX_BATCH))
+
+    totals = {"received": 0, "created": 0, "duplicates": 0, "errors": 0, "jobs": 0}
+    t0 = time.perf_counter()
+
+    def flush(batch, offset):
+        items, errors = parse_items(batch)
+        with SessionLocal() as db:
+            res = ingest_performances(db, items, create_missing_artists=args.create_artists,
+                                      notify=not args.no_notify, errors=errors)
+        for e in res["errors"]:
+            print(f"[ingest] #{offset + e['index']}: {e['error']}")
+        for k in ("received", "created", "duplicates"):
+            totals[k] += res[k]
+        totals["errors"] += len(res["errors"])
+        totals["jobs"] += 1 if res["notifyJobId"] else 0
+
+    batch, offset = [], 0
+    for record in read_records(args.path):
+        batch.append(record)
+        if len(batch) >= batch_size:
+            flush(batch, offset)
+            offset += len(batch)
+            batch = []
+    if batch:
+        flush(batch, offset)
+
+    elapsed = time.perf_counter() - t0
+    print(f"[ingest] {totals} in {elapsed:.1f}s ({totals['received'] / elapsed if elapsed else 0:.0f} rows/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,21 @@
+# app/scripts/insert_artists.py
+# 아티스트 목록(CSV/JSONL) → artist 테이블 upsert (name 기준, 다시 돌려도 중복 없음)
+# 실행: python -m app.scripts.insert_artists artists.csv [--dry-run]
+#       (= python -m app.scripts.import_catalog artist artists.csv)
+import argparse
+
+from app.database import SessionLocal
+from app.services.bulk_import import import_file
+
+
+def insert_artists(path: str, dry_run: bool = False) -> dict:
+    with SessionLocal() as db:
+        return import_file(db, "artist", path, dry_run=dry_run)
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser()
+    ap.add_argument("path", help=".csv 또는 .jsonl")
+    ap.add_argument("--dry-run", action="store_true")
+    args = ap.parse_args()
+    insert_artists(args.path, args.dry_run)
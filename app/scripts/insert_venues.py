@@ -1,23 +1,21 @@
 # app/scripts/insert_venues.py
+# venue_data.py (수작업 목록) → venue 테이블 upsert
+# instagram_account 기준이라 다시 돌려도 중복 행 없이 이름/주소만 갱신 (app/services/bulk_import.py)
+# 실행: python -m app.scripts.insert_venues [--dry-run]
+#       (CSV/JSONL 은 python -m app.scripts.import_catalog venue <파일>)
+import argparse
 
-from sqlalchemy.orm import Session
 from app.database import SessionLocal
-from app.models.venue import Venue
 from app.scripts.venue_data import venue_data  # 경로 주의: scripts 내부에 있을 경우
+from app.services.bulk_import import import_list
+
+
+def insert_venues(dry_run: bool = False) -> dict:
+    with SessionLocal() as db:
+        return import_list(db, "venue", venue_data, dry_run=dry_run)
 
-def insert_venues():
-    session: Session = SessionLocal()
-    try:
-        for data in venue_data:
-            venue = Venue(**data)
-            session.add(venue)
-        session.commit()
-        print("✅ 공연장 데이터 삽입 완료")
-    except Exception as e:
-        session.rollback()
-        print(f"❌ 에러 발생: {e}")
-    finally:
-        session.close()
 
 if __name__ == "__main__":
-    insert_venues()
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--dry-run", action="store_true")
+    insert_venues(ap.parse_args().dry_run)
@@ -0,0 +1,22 @@
+# app/scripts/recompute_trending.py
+# 공연 trending_score 재계산
+# 실행: python -m app.scripts.recompute_trending [--half-life-hours 72] [--window-days 30]
+#       (cron / Cloud Scheduler 로 1시간마다 실행)
+import argparse
+
+from app.database import SessionLocal
+from app.services.trending import HALF_LIFE_HOURS, WINDOW_DAYS, recompute_trending
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--half-life-hours", type=float, default=HALF_LIFE_HOURS)
+    ap.add_argument("--window-days", type=int, default=WINDOW_DAYS)
+    args = ap.parse_args()
+
+    with SessionLocal() as db:
+        recompute_trending(db, half_life_hours=args.half_life_hours, window_days=args.window_days)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,21 @@
+# app/scripts/reconcile_like_counts.py
+# performance.like_count / review.like_count 보정
+# 실행: python -m app.scripts.reconcile_like_counts [--dry-run]
+#       (cron / Cloud Scheduler 로 하루 1번 실행, --dry-run 은 어긋난 행만 출력)
+import argparse
+
+from app.database import SessionLocal
+from app.services.counters import reconcile_like_counts
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--dry-run", action="store_true")
+    args = ap.parse_args()
+
+    with SessionLocal() as db:
+        reconcile_like_counts(db, dry_run=args.dry_run)
+
+
+if __name__ == "__main__":
+    main()
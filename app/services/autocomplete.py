@@ -0,0 +1,281 @@
+# app/services/autocomplete.py
+# 검색어 자동완성 (/search/suggest)
+# - 아티스트 이름 / 공연장 이름 / 예정 공연 제목을 prefix trie에 적재 (프로세스 메모리)
+# - 노드마다 인기순 상위 TOP_K 항목을 들고 있어서 조회는 prefix 길이만큼만 내려가면 끝
+# - 초성 검색: 'ㅇㄷ' 같은 순수 초성은 초성 trie, '인ㄷ' 같은 혼합은 음절 trie에서 초성 분기
+# - 같은 프로세스의 INSERT/UPDATE/DELETE는 이벤트로 즉시 반영, 다른 인스턴스 변경/지난 공연 정리는 주기적 재구성
+import threading
+import time as _time
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import event, func
+from sqlalchemy.orm import Session
+
+from app.models.artist import Artist
+from app.models.performance import Performance, combine_start_at
+from app.models.user_favorite_artist import UserFavoriteArtist
+from app.models.venue import Venue
+from app.utils.text_utils import choseong_of, clean_title, is_choseong, normalize_search_key, to_choseong
+from app.utils.time_window import now_kst, upcoming_filter
+
+TOP_K = 20                      # 노드당 보관 상위 항목 수 (= limit 최대)
+REBUILD_SECONDS = 600
+SUGGEST_TYPES = ("artist", "venue", "performance")
+
+EntryKey = Tuple[str, int]      # (type, id)
+
+
+class Entry:
+    __slots__ = ("type", "id", "label", "score")
+
+    def __init__(self, type_: str, id_: int, label: str, score: float = 0.0):
+        self.type, self.id, self.label, self.score = type_, id_, label, score
+
+    @property
+    def key(self) -> EntryKey:
+        return self.type, self.id
+
+
+class _Node:
+    __slots__ = ("children", "top", "ends")
+
+    def __init__(self):
+        self.children: Dict[str, "_Node"] = {}
+        self.top: List[EntryKey] = []     # 이 prefix 아래 인기순 상위 TOP_K
+        self.ends: Set[EntryKey] = set()  # 키가 정확히 여기서 끝나는 항목
+
+
+class PrefixTrie:
+    """키 문자열 → 항목. 노드별 top 리스트는 (하위 ends ∪ 자식 top)의 상위 TOP_K"""
+
+    def __init__(self, entries: Dict[EntryKey, Entry]):
+        self.root = _Node()
+        self.entries = entries   # 점수 조회용 (인덱스 전체 공유)
+
+    def _rank(self, k: EntryKey):
+        e = self.entries[k]
+        return -e.score, e.label
+
+    def add(self, key: str, ek: EntryKey) -> None:
+        node = self.root
+        path = [node]
+        for ch in key:
+            node = node.children.setdefault(ch, _Node())
+            path.append(node)
+        node.ends.add(ek)
+        rank = self._rank(ek)
+        for n in path:
+            if ek in n.top:
+                continue
+            if len(n.top) < TOP_K or rank < self._rank(n.top[-1]):
+                n.top.append(ek)
+                n.top.sort(key=self._rank)
+                del n.top[TOP_K:]
+
+    def remove(self, key: str, ek: EntryKey) -> None:
+        node = self.root
+        path = [node]
+        for ch in key:
+            node = node.children.get(ch)
+            if node is None:
+                return
+            path.append(node)
+        node.ends.discard(ek)
+        # 깊은 노드부터 top 재계산 (자식 top이 먼저 맞아야 부모가 맞음)
+        for n in reversed(path):
+            if ek in n.top:
+                pool = set(n.ends)
+                for c in n.children.values():
+                    pool.update(c.top)
+                pool.discard(ek)
+                n.top = sorted(pool, key=self._rank)[:TOP_K]
+
+    def find(self, prefix: str) -> Optional[_Node]:
+        node = self.root
+        for ch in prefix:
+            node = node.children.get(ch)
+            if node is None:
+                return None
+        return node
+
+    def find_mixed(self, query: str, max_nodes: int = 2000) -> List[_Node]:
+        """'인ㄷ' 처럼 음절 + 초성 혼합 prefix. 초성 자리에서는 그 초성으로 시작하는 모든 음절 자식으로 분기"""
+        frontier = [self.root]
+        for ch in query:
+            nxt = []
+            for node in frontier:
+                if is_choseong(ch):
+                    nxt.extend(c for k, c in node.children.items() if k == ch or choseong_of(k) == ch)
+                else:
+                    c = node.children.get(ch)
+                    if c is not None:
+                        nxt.append(c)
+            frontier = nxt[:max_nodes]
+            if not frontier:
+                break
+        return frontier
+
+
+def _keys_for(label: str) -> List[str]:
+    """전체 + 단어 시작 위치부터의 suffix ('인디 밴드 공연' → 인디밴드공연, 밴드공연, 공연)"""
+    words = (label or "").lower().split()
+    keys = ["".join(words[i:]) for i in range(len(words))]
+    return [k for k in dict.fromkeys(keys) if k]
+
+
+class AutocompleteIndex:
+    def __init__(self):
+        self.entries: Dict[EntryKey, Entry] = {}
+        self.syllable = PrefixTrie(self.entries)
+        self.choseong = PrefixTrie(self.entries)
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def upsert(self, type_: str, id_: int, label: str, score: Optional[float] = None) -> None:
+        with self._lock:
+            old = self.entries.get((type_, id_))
+            if old is not None:
+                if score is None:
+                    score = old.score
+                self.remove(type_, id_)
+            e = Entry(type_, id_, label, score or 0.0)
+            self.entries[e.key] = e
+            for k in _keys_for(label):
+                self.syllable.add(k, e.key)
+                self.choseong.add(to_choseong(k), e.key)
+
+    def remove(self, type_: str, id_: int) -> None:
+        with self._lock:
+            e = self.entries.get((type_, id_))
+            if e is None:
+                return
+            for k in _keys_for(e.label):
+                self.syllable.remove(k, e.key)
+                self.choseong.remove(to_choseong(k), e.key)
+            del self.entries[e.key]
+
+    def suggest(self, query: str, *, limit: int = 10, types: Optional[Iterable[str]] = None) -> List[Entry]:
+        q = normalize_search_key(query)
+        if not q:
+            return []
+        types = set(types or SUGGEST_TYPES)
+        with self._lock:
+            if all(is_choseong(c) for c in q):
+                node = self.choseong.find(q)
+                nodes = [node] if node else []
+            elif any(is_choseong(c) for c in q):
+                nodes = self.syllable.find_mixed(q)
+            else:
+                node = self.syllable.find(q)
+                nodes = [node] if node else []
+
+            seen: Set[EntryKey] = set()
+            pool: List[Entry] = []
+            for n in nodes:
+                for ek in n.top:
+                    if ek not in seen and ek[0] in types:
+                        seen.add(ek)
+                        pool.append(self.entries[ek])
+        pool.sort(key=lambda e: (-e.score, e.label))
+        return pool[:limit]
+
+
+# ---------- 구성 / 갱신 ----------
+def build_autocomplete_index(db: Session) -> AutocompleteIndex:
+    idx = AutocompleteIndex()
+
+    artist_likes = dict(
+        db.query(UserFavoriteArtist.artist_id, func.count()).group_by(UserFavoriteArtist.artist_id).all()
+    )
+    for aid, name in db.query(Artist.id, Artist.name).all():
+        idx.upsert("artist", aid, name, artist_likes.get(aid, 0))
+
+    venue_perfs = dict(
+        db.query(Performance.venue_id, func.count()).filter(upcoming_filter()).group_by(Performance.venue_id).all()
+    )
+    for vid, name in db.query(Venue.id, Venue.name).all():
+        idx.upsert("venue", vid, name, venue_perfs.get(vid, 0))
+
+    for pid, title, likes in (
+        db.query(Performance.id, Performance.title, Performance.like_count).filter(upcoming_filter()).all()
+    ):
+        idx.upsert("performance", pid, clean_title(title), likes or 0)
+    return idx
+
+
+_lock = threading.Lock()
+_index: Optional[AutocompleteIndex] = None
+_built_at = 0.0
+_pending: deque = deque()      # 이벤트로 들어온 변경 (다음 조회 때 반영)
+_dirty = False                 # True 면 다음 조회 때 전체 재구성 (대량 import 등)
+
+
+def _stale() -> bool:
+    return _index is None or _dirty or _time.monotonic() - _built_at >= REBUILD_SECONDS
+
+
+def get_autocomplete_index(db: Session) -> AutocompleteIndex:
+    global _index, _built_at, _dirty
+    if _stale():
+        with _lock:
+            if _stale():
+                _dirty = False  # 빌드 중 들어온 무효화는 다시 dirty로 남도록 먼저 내림
+                _pending.clear()
+                t0 = _time.perf_counter()
+                _index = build_autocomplete_index(db)
+                _built_at = _time.monotonic()
+                print(f"[autocomplete] rebuilt ({len(_index)} entries, {(_time.perf_counter() - t0) * 1000:.0f}ms)")
+    while _pending:
+        try:
+            op, type_, id_, label = _pending.popleft()
+        except IndexError:
+            break
+        if op == "upsert":
+            _index.upsert(type_, id_, label)
+        else:
+            _index.remove(type_, id_)
+    return _index
+
+
+def invalidate_autocomplete_index() -> None:
+    """다음 조회 때 전체 재구성. ORM 이벤트를 안 타는 Core 대량 쓰기(바뀐 id 를 모를 때)용"""
+    global _dirty
+    _dirty = True
+
+
+def queue_autocomplete_upserts(type_: str, items: Iterable[Tuple[int, str]]) -> None:
+    """Core INSERT 로 만든 항목을 (id, label) 로 직접 반영 (ORM 이벤트와 같은 큐)"""
+    for id_, label in items:
+        if label:
+            _pending.append(("upsert", type_, id_, label))
+
+
+def _label_of(target) -> Tuple[str, Optional[str]]:
+    if isinstance(target, Artist):
+        return "artist", target.name
+    if isinstance(target, Venue):
+        return "venue", target.name
+    return "performance", clean_title(target.title) if target.title else None
+
+
+def _on_upsert(mapper, connection, target):
+    type_, label = _label_of(target)
+    # start_at 은 DB 생성 컬럼이라 flush 직후엔 아직 로드 전 → date/time 으로 직접 계산
+    start_at = combine_start_at(target.date, target.time) if type_ == "performance" else None
+    if type_ == "performance" and (start_at is None or start_at < now_kst()):
+        _pending.append(("remove", type_, target.id, None))
+    elif label:
+        _pending.append(("upsert", type_, target.id, label))
+
+
+def _on_delete(mapper, connection, target):
+    _pending.append(("remove", _label_of(target)[0], target.id, None))
+
+
+for _model in (Artist, Venue, Performance):
+    event.listen(_model, "after_insert", _on_upsert)
+    event.listen(_model, "after_update", _on_upsert)
+    event.listen(_model, "after_delete", _on_delete)
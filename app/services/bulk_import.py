@@ -0,0 +1,207 @@
+# app/services/bulk_import.py
+# 카탈로그(공연장/아티스트) 대량 upsert
+# - CSV / JSONL 을 한 줄씩 읽어서(스트리밍) 검증 → chunk 단위로 INSERT ... ON DUPLICATE KEY UPDATE (SQLite/PG: ON CONFLICT)
+# - 자연 키(venue.instagram_account, artist.name) 기준이라 같은 파일을 여러 번 돌려도 중복 행이 안 생김
+# - 검증은 모델 컬럼 정의를 그대로 사용: NOT NULL(기본값 없는) 컬럼 필수, String 길이, Integer/Float 변환
+# - 파일에 없는 컬럼은 건드리지 않음 (예: image_url 없는 CSV 로 돌려도 기존 image_url 유지)
+# - Core 쓰기라 ORM after_insert/after_update 이벤트를 안 탐 → 응답 캐시 태그 + 인메모리 인덱스
+#   (공연장 공간 인덱스, 지도 타일, 자동완성) 를 커밋 후 직접 무효화
+# 실행: python -m app.scripts.import_catalog venue venues.csv [--chunk-size 1000] [--dry-run]
+import csv
+import json
+import os
+import time as _time
+from typing import Callable, Dict, Iterable, Iterator, List, Sequence, Tuple
+
+from sqlalchemy import Float, Integer, String, event
+from sqlalchemy.orm import Session
+
+from app.models.artist import Artist
+from app.models.venue import Venue
+from app.services.autocomplete import invalidate_autocomplete_index
+from app.services.map_tiles import invalidate_tile_cache
+from app.services.response_cache import mark_tables_changed
+from app.services.venue_index import invalidate_venue_index
+
+DEFAULT_CHUNK_SIZE = 1000
+MAX_ERROR_LOG = 20          # 거부된 레코드 사유는 앞에서부터 이만큼만 출력
+
+
+class ImportSpec:
+    """모델 + 자연 키. 검증 규칙은 모델 컬럼에서 읽음"""
+
+    def __init__(self, name: str, model, keys: Sequence[str]):
+        self.name = name
+        self.model = model
+        self.table = model.__table__
+        self.keys = tuple(keys)
+        self.columns = {c.name: c for c in self.table.columns if not c.primary_key}
+        self.required = {
+            c.name for c in self.columns.values()
+            if not c.nullable and c.default is None and c.server_default is None
+        } | set(self.keys)
+
+
+SPECS: Dict[str, ImportSpec] = {
+    "venue": ImportSpec("venue", Venue, ("instagram_account",)),
+    "artist": ImportSpec("artist", Artist, ("name",)),
+}
+
+
+# ---------- 읽기 ----------
+def read_records(path: str) -> Iterator[Tuple[int, dict]]:
+    """(줄 번호, 레코드) 스트리밍. 확장자로 판별: .csv / .jsonl(.ndjson)"""
+    ext = os.path.splitext(path)[1].lower()
+    with open(path, encoding="utf-8-sig", newline="") as f:
+        if ext == ".csv":
+            for i, row in enumerate(csv.DictReader(f), start=2):     # 1행은 헤더
+                yield i, row
+        elif ext in (".jsonl", ".ndjson"):
+            for i, line in enumerate(f, start=1):
+                if line.strip():
+                    yield i, json.loads(line)
+        else:
+            raise ValueError(f"지원하지 않는 형식: {path} (.csv / .jsonl)")
+
+
+# ---------- 검증 ----------
+def clean_record(spec: ImportSpec, record: dict) -> dict:
+    """모델 컬럼 기준 정리/변환. 잘못된 값이면 ValueError"""
+    row = {}
+    for name, value in record.items():
+        col = spec.columns.get(name)
+        if col is None:
+            continue                        # 모르는 컬럼(id 포함)은 무시
+        if isinstance(value, str):
+            value = value.strip()
+            if value == "":
+                value = None
+        if value is not None:
+            if isinstance(col.type, Float):
+                value = float(value)
+            elif isinstance(col.type, Integer):
+                value = int(value)
+            elif isinstance(col.type, String):
+                value = str(value)
+                if col.type.length and len(value) > col.type.length:
+                    raise ValueError(f"{name} 길이 {len(value)} > {col.type.length}")
+        row[name] = value
+    missing = sorted(n for n in spec.required if row.get(n) is None)
+    if missing:
+        raise ValueError(f"필수 값 없음: {', '.join(missing)}")
+    for lat_lng, limit in (("latitude", 90), ("longitude", 180)):
+        if row.get(lat_lng) is not None and not -limit <= row[lat_lng] <= limit:
+            raise ValueError(f"{lat_lng} 범위 밖: {row[lat_lng]}")
+    return row
+
+
+# ---------- 쓰기 ----------
+def _upsert_statement(db: Session, spec: ImportSpec, columns: Sequence[str]):
+    """values 없이 만든 문장 → executemany (컴파일 캐시 재사용 + 드라이버가 multi-row VALUES 로 묶음)"""
+    update_cols = [c for c in columns if c not in spec.keys]
+    dialect = db.get_bind().dialect.name
+    if dialect == "mysql":
+        from sqlalchemy.dialects.mysql import insert
+        stmt = insert(spec.table)
+        # 갱신할 컬럼이 없으면 키 자신을 대입(= no-op) → 중복이어도 에러 없이 통과
+        return stmt.on_duplicate_key_update(
+            {c: stmt.inserted[c] for c in update_cols} or {spec.keys[0]: stmt.inserted[spec.keys[0]]}
+        )
+    if dialect in ("sqlite", "postgresql"):
+        if dialect == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert
+        else:
+            from sqlalchemy.dialects.postgresql import insert
+        stmt = insert(spec.table)
+        if not update_cols:
+            return stmt.on_conflict_do_nothing(index_elements=list(spec.keys))
+        return stmt.on_conflict_do_update(
+            index_elements=list(spec.keys), set_={c: stmt.excluded[c] for c in update_cols}
+        )
+    raise NotImplementedError(f"upsert 미지원 DB: {dialect}")
+
+
+def on_commit(db: Session, fn: Callable[[], None]) -> None:
+    """
+    다음 커밋 직후 fn 한 번 실행. 커밋 전에 무효화하면 그 사이 다른 요청이
+    옛 데이터로 인덱스를 다시 만들어 버림 (롤백되면 다음 커밋 때 실행되지만 무효화라 무해)
+    """
+    event.listen(db, "after_commit", lambda session: fn(), once=True)
+
+
+def _invalidate_indexes(table_name: str) -> None:
+    if table_name == "venue":
+        invalidate_venue_index()
+        invalidate_tile_cache()
+    if table_name in ("venue", "artist"):
+        invalidate_autocomplete_index()     # 바뀐 id 를 모르므로 전체 재구성
+
+
+def upsert_rows(db: Session, spec: ImportSpec, rows: Iterable[dict]) -> int:
+    """
+    한 chunk upsert. 같은 키가 chunk 안에 여러 번 있으면 마지막 값만 사용
+    컬럼 구성이 다른 레코드는 따로 묶어서 (없는 컬럼은 갱신하지 않도록) 구성별로 한 문장씩
+    """
+    latest: Dict[tuple, dict] = {}
+    for row in rows:
+        latest[tuple(row[k] for k in spec.keys)] = row
+    groups: Dict[tuple, List[dict]] = {}
+    for row in latest.values():
+        groups.setdefault(tuple(sorted(row)), []).append(row)
+    for columns, group in groups.items():
+        db.execute(_upsert_statement(db, spec, columns), group)
+    mark_tables_changed(db, spec.table.name)     # 응답 캐시(venue/artist 태그) 무효화
+    on_commit(db, lambda: _invalidate_indexes(spec.table.name))
+    return len(latest)
+
+
+def import_records(
+    db: Session,
+    spec: ImportSpec,
+    records: Iterable[Tuple[int, dict]],
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    dry_run: bool = False,
+) -> dict:
+    """(줄 번호, 레코드) 스트림 → 검증 → chunk 마다 upsert + commit. 통계 dict 반환"""
+    t0 = _time.perf_counter()
+    stats = {"read": 0, "rejected": 0, "written": 0, "chunks": 0}
+    chunk: List[dict] = []
+
+    def flush():
+        if chunk and not dry_run:
+            stats["written"] += upsert_rows(db, spec, chunk)
+            db.commit()
+        stats["chunks"] += 1 if chunk else 0
+        chunk.clear()
+
+    for line_no, record in records:
+        stats["read"] += 1
+        try:
+            chunk.append(clean_record(spec, record))
+        except (ValueError, TypeError) as e:
+            stats["rejected"] += 1
+            if stats["rejected"] <= MAX_ERROR_LOG:
+                print(f"[bulk_import] {spec.name} line {line_no}: {e}")
+            continue
+        if len(chunk) >= chunk_size:
+            flush()
+    flush()
+
+    elapsed = _time.perf_counter() - t0
+    stats["dry_run"] = dry_run
+    stats["ms"] = round(elapsed * 1000)
+    stats["rows_per_s"] = round(stats["read"] / elapsed) if elapsed > 0 else None
+    print(f"[bulk_import] {spec.name} {stats}")
+    return stats
+
+
+def import_file(db: Session, entity: str, path: str, *, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                dry_run: bool = False) -> dict:
+    return import_records(db, SPECS[entity], read_records(path), chunk_size=chunk_size, dry_run=dry_run)
+
+
+def import_list(db: Session, entity: str, rows: Sequence[dict], *, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                dry_run: bool = False) -> dict:
+    """파이썬 리스트(venue_data 등) 입력. 줄 번호 대신 리스트 인덱스(1부터)"""
+    return import_records(db, SPECS[entity], enumerate(rows, start=1), chunk_size=chunk_size, dry_run=dry_run)
@@ -0,0 +1,73 @@
+# app/services/counters.py
+# 비정규화 좋아요 카운터 보정 (performance.like_count / review.like_count)
+# - 평소에는 찜/좋아요 API가 같은 트랜잭션에서 ±1 → 이 작업은 어긋난 행(drift)만 찾아서 고침
+# - 어긋남 원인: 직접 SQL로 지운 행, ON DELETE CASCADE, 배포 전 데이터 등
+# - 고칠 때는 UPDATE ... SET like_count = (SELECT COUNT(*) ...) 로 실행 시점의 실제 값을 씀 (계산~반영 사이 찜 경합 최소화)
+# 실행: python -m app.scripts.reconcile_like_counts [--dry-run]   (또는 작업 큐 kind="reconcile_like_counts")
+import time as _time
+from typing import Dict, List
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.models.performance import Performance
+from app.models.review import Review
+from app.models.review_like import ReviewLike
+from app.models.user_favorite_performance import UserFavoritePerformance
+
+FIX_CHUNK = 500
+
+# 카운터 이름 → (카운터 모델, 좋아요 행 모델, 대상 id 컬럼)
+COUNTERS = {
+    "performance": (Performance, UserFavoritePerformance, UserFavoritePerformance.performance_id),
+    "review": (Review, ReviewLike, ReviewLike.review_id),
+}
+
+
+def find_drift(db: Session, name: str) -> Dict[int, tuple]:
+    """저장값 != 실제 COUNT 인 행 → {id: (저장값, 실제값)}"""
+    model, _, ref_col = COUNTERS[name]
+    actual = dict(db.query(ref_col, func.count()).group_by(ref_col).all())
+    stored = dict(db.query(model.id, model.like_count).filter(model.like_count != 0).all())
+    drift = {}
+    for target_id in set(actual) | set(stored):
+        s, a = stored.get(target_id, 0), actual.get(target_id, 0)
+        if s != a:
+            drift[target_id] = (s, a)
+    # 좋아요 행은 있는데 대상이 없는 경우(고아 행)는 카운터가 없으므로 제외
+    if drift:
+        existing = set()
+        ids = list(drift)
+        for i in range(0, len(ids), FIX_CHUNK):
+            existing.update(r for (r,) in db.query(model.id).filter(model.id.in_(ids[i:i + FIX_CHUNK])).all())
+        drift = {k: v for k, v in drift.items() if k in existing}
+    return drift
+
+
+def _fix(db: Session, name: str, ids: List[int]) -> None:
+    model, like_model, ref_col = COUNTERS[name]
+    actual = select(func.count()).select_from(like_model).where(ref_col == model.id).scalar_subquery()
+    values = {model.like_count: actual}
+    if model is Performance:
+        values[Performance.updated_at] = Performance.updated_at
+    for i in range(0, len(ids), FIX_CHUNK):
+        db.query(model).filter(model.id.in_(ids[i:i + FIX_CHUNK])).update(values, synchronize_session=False)
+
+
+def reconcile_like_counts(db: Session, *, dry_run: bool = False) -> dict:
+    """카운터별 drift 탐지 → (dry_run 아니면) 실제 COUNT로 덮어쓰기"""
+    t0 = _time.perf_counter()
+    stats = {}
+    for name in COUNTERS:
+        drift = find_drift(db, name)
+        if drift and not dry_run:
+            _fix(db, name, sorted(drift))
+        stats[name] = len(drift)
+        for target_id, (s, a) in list(sorted(drift.items()))[:10]:
+            print(f"[counters] {name}#{target_id}: stored={s} actual={a}")
+    if not dry_run:
+        db.commit()
+    stats["dry_run"] = dry_run
+    stats["ms"] = round((_time.perf_counter() - t0) * 1000)
+    print(f"[counters] {stats}")
+    return stats
@@ -1,52 +1,135 @@
 # app/services/instagram/account_loader.py
-# 공연장 계정 목록 관리
+# 공연장 계정 목록 / 크롤링 상태 관리 (crawl_account, crawl_post 테이블)
+# - 실행마다 상태 조회 1번(load_crawl_state) + 결과 쓰기 1트랜잭션(save_crawl_results)
+#   → 크롤러 여러 개가 같은 상태를 공유하고, JSON 파일처럼 매번 통째로 다시 쓰지 않음
+# - 기존 JSON(account_list.json, previous_posts.json)은 import_json_state 로 한 번 옮김
+#   (python -m app.scripts.crawl_accounts import-json)
+import datetime as dt
 import json
 from pathlib import Path
+from typing import Dict, Iterable, Optional
 
-# 계정 목록 불러오기
+from sqlalchemy import bindparam, func, insert, or_, update
+from sqlalchemy.orm import Session
+
+from app.models.crawl_state import CrawlAccount, CrawlPost
+from app.services.bulk_import import ImportSpec, upsert_rows
+
+CRAWL_ACCOUNT_SPEC = ImportSpec("crawl_account", CrawlAccount, ("account",))
+
+
+# JSON 파일 읽기 (기존 상태 이전용)
 def load_json(path):
     path = Path(path)
     try:
         with open(path, "r", encoding="utf-8") as f:
             return json.load(f)
     except FileNotFoundError:
-        print(f"파일이 존재하지 않습니다: {path}. 새 파일을 생성합니다.")
-        return {}  # 파일이 없을 경우 빈 객체 반환
+        print(f"파일이 존재하지 않습니다: {path}.")
+        return {}
     except json.JSONDecodeError as e:
         print(f"JSON 파일을 로드할 수 없습니다: {e}. 빈 파일을 반환합니다.")
-        return {}  # JSON 오류가 발생한 경우 빈 객체 반환
-    except Exception as e:
-        print(f"예상치 못한 오류 발생: {e}. 빈 파일을 반환합니다.")
-        return {}  # 기타 오류 발생 시 빈 객체 반환
-
-# 계정 목록 로드
-def load_accounts(path):
-    data = load_json(path)
-    return data.get("accounts", [])
-
-# previous_posts.json 로드
-def load_previous_posts(path):
-    return load_json(path)
-
-# 계정 목록 저장하기(json 파일에)
-def save_accounts(path, account_list):
-    # 부모 디렉토리 없으면 생성
-    Path(path).parent.mkdir(parents=True, exist_ok=True)
-
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(account_list, f, ensure_ascii=False, indent=2)
-
-# 계정 목록에 새 계정 추가하기(중복x)
-def add_account(new_account):
-    accounts = load_accounts()
-    if new_account not in accounts:
-        accounts.append(new_account)
-        save_accounts(accounts)
-
-# 계정 목록에서 계정 제거
-def remove_account(account):
-    accounts = load_accounts()
-    if account in accounts:
-        accounts.remove(account)
-        save_accounts(accounts)
+        return {}
+
+
+def _account(value: str) -> str:
+    return value.strip().lstrip("@")
+
+
+# 크롤링할 계정 + 마지막 상태 (쿼리 1번)
+def load_crawl_state(db: Session, *, recheck_after: Optional[dt.timedelta] = None) -> Dict[str, dict]:
+    """recheck_after 를 주면 그 시간 안에 확인한 계정은 제외 (다른 크롤러가 방금 본 계정 건너뛰기)"""
+    q = db.query(CrawlAccount.account, CrawlAccount.last_shortcode, CrawlAccount.fingerprint).filter(
+        CrawlAccount.is_active.is_(True)
+    )
+    if recheck_after:
+        cutoff = dt.datetime.utcnow() - recheck_after
+        q = q.filter(or_(CrawlAccount.last_checked_at.is_(None), CrawlAccount.last_checked_at < cutoff))
+    return {
+        account: {"last_shortcode": shortcode, "fingerprint": fingerprint}
+        for account, shortcode, fingerprint in q.order_by(CrawlAccount.id).all()
+    }
+
+
+# 계정 추가 (이미 있으면 다시 활성화)
+def add_accounts(db: Session, accounts: Iterable[str], *, commit: bool = True) -> int:
+    rows = [{"account": _account(a), "is_active": True} for a in accounts if a and _account(a)]
+    n = upsert_rows(db, CRAWL_ACCOUNT_SPEC, rows) if rows else 0
+    if commit:
+        db.commit()
+    return n
+
+
+# 계정 제거 (상태는 남겨두고 크롤링만 중단)
+def remove_account(db: Session, account: str) -> bool:
+    n = db.query(CrawlAccount).filter(CrawlAccount.account == _account(account)).update(
+        {CrawlAccount.is_active: False}, synchronize_session=False
+    )
+    db.commit()
+    return n > 0
+
+
+# account_list.json + previous_posts.json → crawl_account
+def import_json_state(db: Session, accounts_path: str, previous_posts_path: str) -> int:
+    accounts = load_json(accounts_path).get("accounts", [])
+    previous = load_json(previous_posts_path)
+    rows = []
+    for a in dict.fromkeys(_account(a) for a in accounts if a):
+        row = {"account": a, "is_active": True}
+        if previous.get(a):
+            row["last_shortcode"] = previous[a]
+        rows.append(row)
+    n = upsert_rows(db, CRAWL_ACCOUNT_SPEC, rows) if rows else 0
+    db.commit()
+    return n
+
+
+# 크롤링 결과 저장: 계정 상태 UPDATE executemany 2번 + 새 게시물 INSERT 1번, 커밋 1번
+def save_crawl_results(db: Session, result: dict, *, checked_at: Optional[dt.datetime] = None) -> dict:
+    """
+    result: crawl_accounts() 반환값
+    - 정상 확인: last_shortcode / fingerprint / last_checked_at 갱신, 실패 횟수 초기화
+      (게시물이 안 보이면 last_shortcode 는 유지)
+    - 실패: last_checked_at / fail_count + 1 / last_error 만 → 다음 실행에서 다시 확인
+    """
+    checked_at = checked_at or dt.datetime.utcnow()
+    table = CrawlAccount.__table__
+    failed, posts = result["failed"], result["posts"]
 
+    ok_rows = [
+        {"b_account": account, "b_shortcode": state["shortcode"], "b_fingerprint": state["fingerprint"],
+         "b_changed": checked_at if account in posts else None}
+        for account, state in result["checked"].items() if account not in failed
+    ]
+    if ok_rows:
+        db.execute(
+            update(table).where(table.c.account == bindparam("b_account")).values(
+                last_shortcode=func.coalesce(bindparam("b_shortcode"), table.c.last_shortcode),
+                fingerprint=bindparam("b_fingerprint"),
+                last_checked_at=checked_at,
+                last_changed_at=func.coalesce(bindparam("b_changed"), table.c.last_changed_at),
+                fail_count=0,
+                last_error=None,
+            ),
+            ok_rows,
+        )
+    if failed:
+        db.execute(
+            update(table).where(table.c.account == bindparam("b_account")).values(
+                last_checked_at=checked_at, fail_count=table.c.fail_count + 1, last_error=bindparam("b_error"),
+            ),
+            [{"b_account": account, "b_error": error} for account, error in failed.items()],
+        )
+    new_posts = [p for account, p in posts.items() if account not in failed]
+    if new_posts:
+        # 다른 크롤러가 같은 게시물을 먼저 넣었으면 건너뜀
+        stmt = insert(CrawlPost.__table__).prefix_with("IGNORE", dialect="mysql").prefix_with("OR IGNORE", dialect="sqlite")
+        db.execute(stmt, [
+            {"account": p["account"], "shortcode": p["shortcode"], "text": p.get("text"),
+             "image_url": p.get("image_url"), "found_at": checked_at}
+            for p in new_posts
+        ])
+    db.commit()
+    stats = {"updated": len(ok_rows), "failed": len(failed), "new_posts": len(new_posts)}
+    print(f"[crawl_state] {stats}")
+    return stats
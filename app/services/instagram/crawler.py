@@ -0,0 +1,192 @@
+# app/services/instagram/crawler.py
+# 공연장 인스타그램 계정 최신 게시물 비동기 크롤러 (Playwright async API)
+# - 브라우저 1개 + 컨텍스트 N개 x 페이지 M개 풀 → 계정 N*M 개를 동시에 확인
+#   (컨텍스트마다 로그인 세션(storage_state) 을 따로 로드, 페이지는 워커 하나가 계속 재사용)
+# - 이미지/폰트/미디어 요청은 route 에서 차단 (img 의 src 속성은 DOM 에 남아 있어서 image_url 추출엔 영향 없음)
+# - 고정 대기(wait_for_timeout) 대신 셀렉터 대기: 프로필은 게시물 링크, 게시물은 dialog 본문/이미지
+# - 호스트별 요청 간격 제한: 동시성을 올려도 같은 호스트로 나가는 이동/클릭은 CRAWL_HOST_INTERVAL 간격 유지
+# - 계정마다 프로필 상단 게시물 shortcode 목록의 해시(fingerprint)를 같이 돌려줌 → 이전 값과 같으면 변화 없음 (ETag 처럼)
+# - INSTAGRAM_BASE_URL 로 대상 주소 교체 → app/scripts/fake_instagram_server.py 로 오프라인 벤치
+import asyncio
+import hashlib
+import os
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Sequence
+from urllib.parse import urlsplit
+
+INSTAGRAM_BASE_URL = os.getenv("INSTAGRAM_BASE_URL", "https://www.instagram.com").rstrip("/")
+CRAWL_CONTEXTS = int(os.getenv("CRAWL_CONTEXTS", "2"))                     # 브라우저 컨텍스트 수
+CRAWL_PAGES_PER_CONTEXT = int(os.getenv("CRAWL_PAGES_PER_CONTEXT", "2"))   # 컨텍스트당 페이지(워커) 수
+CRAWL_HOST_INTERVAL = float(os.getenv("CRAWL_HOST_INTERVAL", "1.0"))       # 같은 호스트 요청 간 최소 간격(초)
+CRAWL_NAV_TIMEOUT_MS = int(os.getenv("CRAWL_NAV_TIMEOUT_MS", "15000"))
+CRAWL_SELECTOR_TIMEOUT_MS = int(os.getenv("CRAWL_SELECTOR_TIMEOUT_MS", "8000"))
+
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+POST_LINK_SELECTOR = 'a[href*="/p/"]'
+POST_BODY_SELECTOR = 'div[role="dialog"] h1._ap3a, div[role="dialog"] img'
+FINGERPRINT_POSTS = 12      # fingerprint 에 쓰는 상단 게시물 수 (프로필 첫 화면)
+
+# dialog 안의 본문/첫 이미지 src 를 한 번에 읽음 (locator 마다 왕복하지 않도록)
+_POST_INFO_JS = """d => ({
+  text: d.querySelector('h1._ap3a') ? d.querySelector('h1._ap3a').innerText : null,
+  image_url: d.querySelector('img') ? d.querySelector('img').getAttribute('src') : null,
+})"""
+
+
+class HostRateLimiter:
+    """호스트별 다음 요청 가능 시각을 예약 → 예약한 시각까지 대기 (락은 예약할 때만 잡음)"""
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._next: Dict[str, float] = {}
+        self._lock = asyncio.Lock()
+
+    async def wait(self, url: str) -> None:
+        if self.interval <= 0:
+            return
+        host = urlsplit(url).hostname or ""
+        loop = asyncio.get_running_loop()
+        async with self._lock:
+            now = loop.time()
+            slot = max(now, self._next.get(host, 0.0))
+            self._next[host] = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+def shortcode_from_href(href: Optional[str]) -> Optional[str]:
+    """'/p/ABC123/' 또는 '/{account}/p/ABC123/' → 'ABC123'"""
+    if not href:
+        return None
+    parts = urlsplit(href).path.strip("/").split("/")
+    if "p" not in parts:
+        return None
+    i = parts.index("p")
+    return parts[i + 1] if len(parts) > i + 1 and parts[i + 1] else None
+
+
+def profile_fingerprint(shortcodes: Sequence[str]) -> Optional[str]:
+    """상단 게시물 shortcode 목록 → sha1. 새 게시물/삭제/고정 변경이 있으면 달라짐"""
+    if not shortcodes:
+        return None
+    return hashlib.sha1("|".join(shortcodes).encode()).hexdigest()
+
+
+async def recent_shortcodes(page, limiter: HostRateLimiter, account: str, *, base_url: str = INSTAGRAM_BASE_URL,
+                            limit: int = FINGERPRINT_POSTS) -> List[str]:
+    """프로필 페이지 상단 게시물 shortcode (위에서부터). 게시물 링크가 안 뜨면(비공개/게시물 없음) []"""
+    from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+    url = f"{base_url}/{account}/"
+    await limiter.wait(url)
+    await page.goto(url, wait_until="domcontentloaded", timeout=CRAWL_NAV_TIMEOUT_MS)
+    try:
+        await page.wait_for_selector(POST_LINK_SELECTOR, timeout=CRAWL_SELECTOR_TIMEOUT_MS)
+    except PlaywrightTimeoutError:
+        return []
+    hrefs = await page.eval_on_selector_all(POST_LINK_SELECTOR, "els => els.map(e => e.getAttribute('href'))")
+    shortcodes: List[str] = []
+    for href in hrefs:
+        shortcode = shortcode_from_href(href)
+        if shortcode and shortcode not in shortcodes:
+            shortcodes.append(shortcode)
+    return shortcodes[:limit]
+
+
+async def post_info(page, limiter: HostRateLimiter, shortcode: str) -> Optional[dict]:
+    """프로필 페이지에서 게시물 클릭 → dialog 의 본문/이미지가 뜰 때까지 대기 후 추출"""
+    await limiter.wait(page.url)
+    await page.locator(f'a[href*="/p/{shortcode}/"]').first.click()
+    await page.wait_for_selector(POST_BODY_SELECTOR, timeout=CRAWL_SELECTOR_TIMEOUT_MS)
+    return await page.eval_on_selector('div[role="dialog"]', _POST_INFO_JS)
+
+
+async def _block_heavy_resources(route) -> None:
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def open_pages(browser, *, contexts: int, pages_per_context: int, storage_state: Optional[str] = None,
+                     block_resources: bool = True) -> List:
+    pages = []
+    for _ in range(contexts):
+        kwargs = {"storage_state": storage_state} if storage_state and os.path.exists(storage_state) else {}
+        context = await browser.new_context(**kwargs)
+        if block_resources:
+            await context.route("**/*", _block_heavy_resources)
+        for _ in range(pages_per_context):
+            pages.append(await context.new_page())
+    return pages
+
+
+async def crawl_accounts(
+    accounts: Iterable[str],
+    is_new: Callable[[str, str, Optional[str]], bool],
+    *,
+    contexts: int = CRAWL_CONTEXTS,
+    pages_per_context: int = CRAWL_PAGES_PER_CONTEXT,
+    host_interval: float = CRAWL_HOST_INTERVAL,
+    storage_state: Optional[str] = None,
+    base_url: str = INSTAGRAM_BASE_URL,
+    block_resources: bool = True,
+    headless: bool = True,
+) -> dict:
+    """
+    계정별 최신 shortcode 확인 → is_new(account, shortcode, fingerprint) 가 True 면 게시물 본문/이미지 추출
+    반환: checked {account: {shortcode, fingerprint}} (게시물 없는 계정은 둘 다 None),
+          posts {account: {text, image_url, account, shortcode}}, failed {account: 오류}, stats
+    """
+    from playwright.async_api import async_playwright
+
+    queue = iter(list(accounts))
+    limiter = HostRateLimiter(host_interval)
+    checked: Dict[str, dict] = {}
+    posts: Dict[str, dict] = {}
+    failed: Dict[str, str] = {}
+    t0 = time.perf_counter()
+
+    async def worker(page):
+        for account in queue:           # 워커들이 같은 이터레이터를 나눠 가짐
+            try:
+                shortcodes = await recent_shortcodes(page, limiter, account, base_url=base_url)
+                shortcode = shortcodes[0] if shortcodes else None
+                fingerprint = profile_fingerprint(shortcodes)
+                checked[account] = {"shortcode": shortcode, "fingerprint": fingerprint}
+                if not shortcode:
+                    print(f"⚠️ 게시물 없음 @{account}")
+                    continue
+                if not is_new(account, shortcode, fingerprint):
+                    print(f"✅ No new post for @{account}")
+                    continue
+                info = await post_info(page, limiter, shortcode)
+                if info:
+                    posts[account] = {**info, "account": account, "shortcode": shortcode}
+                    print(f"게시물 추출 성공 @{account}")
+                else:
+                    failed[account] = "게시물 정보 추출 실패"
+                    print(f"⚠️ 게시물 정보 추출 실패 @{account}")
+            except Exception as e:
+                failed[account] = f"{e.__class__.__name__}: {e}"[:255]
+                print(f"❌ Failed @{account}: {e.__class__.__name__}: {e}")
+                if page.is_closed():        # 페이지가 죽었으면 같은 컨텍스트에서 새로 열어서 계속
+                    page = await page.context.new_page()
+
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=headless)
+        try:
+            pages = await open_pages(browser, contexts=contexts, pages_per_context=pages_per_context,
+                                     storage_state=storage_state, block_resources=block_resources)
+            await asyncio.gather(*(worker(page) for page in pages))
+        finally:
+            await browser.close()
+
+    elapsed = time.perf_counter() - t0
+    n = len(checked.keys() | failed.keys())
+    stats = {
+        "workers": contexts * pages_per_context, "checked": n, "new": len(posts), "failed": len(failed),
+        "seconds": round(elapsed, 2), "accounts_per_s": round(n / elapsed, 2) if elapsed > 0 else None,
+    }
+    print(f"[crawler] {stats}")
+    return {"checked": checked, "posts": posts, "failed": failed, "stats": stats}
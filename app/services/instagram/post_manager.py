@@ -1,12 +1,19 @@
 # app/services/instagram/post_manager.py
 # 중복 검사하고 데이터베이스에 저장
+from typing import Set
 
+from sqlalchemy import select, union
 from sqlalchemy.orm import Session
 from app import models, schemas
 
-# 같은 게시물 중복 저장 방지
-def is_duplicate_post(db: Session, shortcode: str) -> bool:
-    return db.query(models.Performance).filter(models.Performance.shortcode == shortcode).first() is not None
+# 이미 아는 게시물 shortcode 전체 (공연 + 크롤러가 찾은 게시물, 쿼리 1번)
+# 계정마다 조회하지 않고 실행 시작 때 한 번 읽어서 set 으로 비교
+def known_shortcodes(db: Session) -> Set[str]:
+    q = union(
+        select(models.Performance.shortcode).where(models.Performance.shortcode.isnot(None)),
+        select(models.CrawlPost.shortcode),
+    )
+    return {shortcode for (shortcode,) in db.execute(q)}
 
 # 게시물 정보 저장
 # extract_performance_info 처리 후에 저장해야 함
@@ -22,4 +29,4 @@ def save_post_to_db(db: Session, post_data: dict):
     db.add(new_post)
     db.commit()
     db.refresh(new_post)
-    return new_post
\ No newline at end of file
+    return new_post
@@ -0,0 +1,67 @@
+# app/services/job_handlers.py
+# 작업 큐 kind별 처리 함수 (app.services.jobs.run_worker에서 import)
+from sqlalchemy.orm import Session
+
+from app.models.notification import Notification
+from app.services.jobs import job_handler
+from app.services.notify import (
+    notify_artist_followers_on_new_performance,
+    notify_artist_followers_on_new_performances,
+    _send_push,
+)
+
+
+@job_handler("fanout_new_performance")
+def fanout_new_performance(db: Session, payload: dict) -> dict:
+    """공연 등록 → 아티스트 팔로워 알림 생성 (chunk insert) → 푸시 작업 등록"""
+    return notify_artist_followers_on_new_performance(
+        db,
+        performance_id=int(payload["performance_id"]),
+        artist_ids=payload.get("artist_ids") or [],
+        enqueue_push=True,
+    )
+
+
+@job_handler("fanout_new_performances")
+def fanout_new_performances(db: Session, payload: dict) -> dict:
+    """공연 일괄 등록 1건 → 전체 공연의 팔로워 알림을 한 번에 생성 → 푸시 작업 등록"""
+    return notify_artist_followers_on_new_performances(
+        db,
+        performances=payload.get("performances") or [],
+        enqueue_push=True,
+    )
+
+
+@job_handler("send_push")
+def send_push(db: Session, payload: dict) -> dict:
+    """notification_ids 묶음을 Expo batch 전송"""
+    ids = payload.get("notification_ids") or []
+    if not ids:
+        return {"sent": 0}
+    rows = (
+        db.query(Notification.id, Notification.user_id, Notification.title, Notification.body)
+        .filter(Notification.id.in_(ids))
+        .all()
+    )
+    return _send_push(db, rows)
+
+
+@job_handler("rebuild_recommendations")
+def rebuild_recommendations(db: Session, payload: dict) -> dict:
+    """item-item CF 추천 테이블 재계산 (주기 실행: cron에서 enqueue 또는 스크립트 직접 실행)"""
+    from app.services.recommend import RECOMMEND_TOP_N, build_recommendations
+    return build_recommendations(db, top_n=int(payload.get("top_n") or RECOMMEND_TOP_N))
+
+
+@job_handler("recompute_trending")
+def recompute_trending(db: Session, payload: dict) -> dict:
+    """공연 trending_score 감쇠 재계산 (주기 실행: cron에서 enqueue 또는 스크립트 직접 실행)"""
+    from app.services.trending import HALF_LIFE_HOURS, recompute_trending as _recompute
+    return _recompute(db, half_life_hours=float(payload.get("half_life_hours") or HALF_LIFE_HOURS))
+
+
+@job_handler("reconcile_like_counts")
+def reconcile_like_counts(db: Session, payload: dict) -> dict:
+    """performance/review like_count 를 실제 좋아요 행 수와 비교해 보정 (하루 1번 정도)"""
+    from app.services.counters import reconcile_like_counts as _reconcile
+    return _reconcile(db, dry_run=bool(payload.get("dry_run")))
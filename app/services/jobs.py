@@ -0,0 +1,231 @@
+# app/services/jobs.py
+# DB 기반 작업 큐: 라우터는 enqueue만, 실제 처리는 워커(python -m app.worker)가 담당
+import json
+import os
+import socket
+import threading
+import time as _time
+import traceback
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional
+
+from sqlalchemy.orm import Session
+
+from app.models.job import Job, JOB_QUEUED, JOB_RUNNING, JOB_DONE, JOB_FAILED
+
+JOB_LEASE_SECONDS = 300      # running 상태로 이 시간 넘게 멈춰 있으면 워커가 죽은 것으로 보고 재큐잉
+JOB_RETRY_BASE_SECONDS = 10  # 재시도 간격: 10s, 20s, 40s ...
+JOB_HEARTBEAT_SECONDS = JOB_LEASE_SECONDS / 5  # 실행 중인 작업의 locked_at 갱신 주기
+
+# kind → handler(db, payload) -> dict
+JOB_HANDLERS: Dict[str, Callable[[Session, dict], Optional[dict]]] = {}
+
+
+def job_handler(kind: str):
+    """작업 종류별 처리 함수 등록용 데코레이터"""
+    def _wrap(fn):
+        JOB_HANDLERS[kind] = fn
+        return fn
+    return _wrap
+
+
+def default_worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def enqueue_job(
+    db: Session,
+    kind: str,
+    payload: Optional[dict] = None,
+    *,
+    run_after: Optional[datetime] = None,
+    max_attempts: int = 5,
+    commit: bool = True,
+) -> Job:
+    """
+    작업 등록. commit=False면 호출 측 트랜잭션에 같이 묶인다
+    (예: 공연 INSERT와 같은 커밋 → 공연은 생겼는데 알림 작업은 없는 상황 방지)
+    """
+    job = Job(
+        kind=kind,
+        payload_json=json.dumps(payload or {}, ensure_ascii=False),
+        status=JOB_QUEUED,
+        attempts=0,
+        max_attempts=max_attempts,
+        run_after=run_after or datetime.utcnow(),
+    )
+    db.add(job)
+    if commit:
+        db.commit()
+    else:
+        db.flush()
+    return job
+
+
+def requeue_stale_jobs(db: Session, *, lease_seconds: int = JOB_LEASE_SECONDS) -> int:
+    """lease가 만료된 running 작업을 다시 queued로"""
+    expired = datetime.utcnow() - timedelta(seconds=lease_seconds)
+    n = (
+        db.query(Job)
+        .filter(Job.status == JOB_RUNNING, Job.locked_at < expired)
+        .update({Job.status: JOB_QUEUED, Job.locked_by: None, Job.locked_at: None}, synchronize_session=False)
+    )
+    db.commit()
+    return n
+
+
+def claim_jobs(db: Session, *, worker_id: str, limit: int = 10, kinds: Optional[List[str]] = None) -> List[Job]:
+    """
+    실행 가능한 작업을 SELECT ... FOR UPDATE SKIP LOCKED 로 가져와 running 처리.
+    여러 워커가 동시에 돌아도 같은 작업을 두 번 잡지 않는다.
+    """
+    now = datetime.utcnow()
+    q = db.query(Job).filter(Job.status == JOB_QUEUED, Job.run_after <= now)
+    if kinds:
+        q = q.filter(Job.kind.in_(kinds))  # limit() 이후에는 filter 불가 → 먼저 적용
+    jobs = (
+        q.order_by(Job.run_after.asc(), Job.id.asc())
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+        .all()
+    )
+    for job in jobs:
+        job.status = JOB_RUNNING
+        job.locked_by = worker_id
+        job.locked_at = now
+        job.attempts = (job.attempts or 0) + 1
+    db.commit()
+    return jobs
+
+
+def renew_lease(db: Session, job_id: int, worker_id: str) -> bool:
+    """
+    내가 잡고 있는 running 작업의 locked_at 갱신.
+    False면 lease가 만료돼 재큐잉됐거나 다른 워커가 가져간 것 → 실행/완료 처리하면 안 됨
+    """
+    n = (
+        db.query(Job)
+        .filter(Job.id == job_id, Job.status == JOB_RUNNING, Job.locked_by == worker_id)
+        .update({Job.locked_at: datetime.utcnow()}, synchronize_session=False)
+    )
+    db.commit()
+    return n > 0
+
+
+class _LeaseHeartbeat:
+    """작업 실행 동안 별도 스레드/세션으로 locked_at 을 주기적으로 갱신 (오래 걸리는 작업이 재큐잉되지 않도록)"""
+
+    def __init__(self, session_factory, job_id: int, worker_id: str, interval: float = JOB_HEARTBEAT_SECONDS):
+        self.session_factory = session_factory
+        self.job_id = job_id
+        self.worker_id = worker_id
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=f"job-heartbeat-{job_id}", daemon=True)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                with self.session_factory() as db:
+                    if not renew_lease(db, self.job_id, self.worker_id):
+                        return
+            except Exception as e:
+                print(f"[job] #{self.job_id} heartbeat failed: {e}")
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+
+def _finish_job(db: Session, job_id: int, worker_id: Optional[str], values: dict) -> bool:
+    """최종 상태 기록. worker_id 가 있으면 아직 내가 잡고 있는 경우에만 (다른 워커가 가져간 작업을 덮어쓰지 않음)"""
+    q = db.query(Job).filter(Job.id == job_id)
+    if worker_id:
+        q = q.filter(Job.status == JOB_RUNNING, Job.locked_by == worker_id)
+    n = q.update(values, synchronize_session=False)
+    db.commit()
+    if not n:
+        print(f"[job] #{job_id} lease lost (taken over by another worker), result not recorded")
+    return n > 0
+
+
+def run_job(db: Session, job: Job, worker_id: Optional[str] = None) -> bool:
+    """작업 하나 실행. 실패 시 attempts/max_attempts에 따라 재시도 예약 또는 failed 처리"""
+    job_id, kind = job.id, job.kind
+    attempts, max_attempts = job.attempts, job.max_attempts
+    handler = JOB_HANDLERS.get(kind)
+    try:
+        if handler is None:
+            raise RuntimeError(f"no handler for job kind '{kind}'")
+        payload = json.loads(job.payload_json) if job.payload_json else {}
+        result = handler(db, payload)
+    except Exception as e:
+        db.rollback()
+        values = {
+            Job.last_error: f"{e.__class__.__name__}: {e}\n{traceback.format_exc(limit=5)}"[:4000],
+            Job.locked_by: None,
+            Job.locked_at: None,
+        }
+        if attempts >= max_attempts:
+            values[Job.status] = JOB_FAILED
+        else:
+            values[Job.status] = JOB_QUEUED
+            values[Job.run_after] = datetime.utcnow() + timedelta(seconds=JOB_RETRY_BASE_SECONDS * (2 ** (attempts - 1)))
+        _finish_job(db, job_id, worker_id, values)
+        print(f"[job] #{job_id} {kind} failed (attempt {attempts}/{max_attempts}): {e}")
+        return False
+
+    return _finish_job(db, job_id, worker_id, {
+        Job.status: JOB_DONE,
+        Job.locked_by: None,
+        Job.locked_at: None,
+        Job.last_error: None,
+        Job.result_json: json.dumps(result, ensure_ascii=False, default=str) if result is not None else None,
+    })
+
+
+def run_worker(
+    session_factory,
+    *,
+    worker_id: Optional[str] = None,
+    batch_size: int = 10,
+    poll_interval: float = 1.0,
+    once: bool = False,
+    kinds: Optional[List[str]] = None,
+) -> dict:
+    """작업 큐 소비 루프. once=True면 비어 있을 때까지 처리하고 종료"""
+    # 핸들러 등록 (import 시점에 @job_handler 실행)
+    import app.services.job_handlers  # noqa: F401
+
+    worker_id = worker_id or default_worker_id()
+    stats = {"done": 0, "failed": 0}
+    last_reap = 0.0
+    print(f"[worker] {worker_id} started (kinds={kinds or 'all'})")
+
+    while True:
+        with session_factory() as db:
+            if _time.monotonic() - last_reap > JOB_LEASE_SECONDS / 2:
+                requeue_stale_jobs(db)
+                last_reap = _time.monotonic()
+
+            jobs = claim_jobs(db, worker_id=worker_id, limit=batch_size, kinds=kinds)
+            for job in jobs:
+                # 배치 앞쪽 작업이 오래 걸렸으면 lease 가 만료됐을 수 있음 → 실행 직전에 갱신, 이미 넘어갔으면 건너뜀
+                if not renew_lease(db, job.id, worker_id):
+                    print(f"[job] #{job.id} lease lost before run, skipped")
+                    continue
+                with _LeaseHeartbeat(session_factory, job.id, worker_id):
+                    ok = run_job(db, job, worker_id)
+                if ok:
+                    stats["done"] += 1
+                else:
+                    stats["failed"] += 1
+
+        if not jobs:
+            if once:
+                return stats
+            _time.sleep(poll_interval)
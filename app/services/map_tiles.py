@@ -0,0 +1,207 @@
+# app/services/map_tiles.py
+# 지도 타일 단위 클러스터링 + 짧은 TTL 캐시 (/nearby/performance/cluster)
+# - 요청 bounds를 줌 레벨의 Web Mercator 타일(256px)로 스냅
+# - 타일 하나를 CLUSTER_DIV x CLUSTER_DIV 칸으로 나눠 칸마다 공연장을 묶음 (줌이 높으면 공연장 단위)
+# - 타일 결과는 (줌, x, y, KST 날짜) 키로 캐시, 공연/공연장 변경 시 전체 무효화
+import math
+import threading
+import time as _time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import event, func
+from sqlalchemy.orm import Session
+
+from app.models.performance import Performance
+from app.models.venue import Venue
+from app.utils.time_window import now_kst, today_remaining_filter
+
+MAX_LAT = 85.05112878
+MIN_ZOOM, MAX_ZOOM = 3, 20
+MAX_TILES_PER_REQUEST = 64   # 넘으면 줌을 낮춰서 타일 수를 줄임
+CLUSTER_DIV = 4              # 타일당 4x4 = 64px 칸
+VENUE_ZOOM = 16              # 이 줌 이상이면 클러스터링 없이 공연장 단위
+TILE_TTL_SECONDS = 60
+TILE_CACHE_MAX = 5000
+
+TileKey = Tuple[int, int, int]
+
+
+# ---------- 타일 좌표 ----------
+def lnglat_to_tile_f(lat: float, lng: float, z: int) -> Tuple[float, float]:
+    """위경도 → 줌 z의 실수 타일 좌표 (x, y)"""
+    lat = max(-MAX_LAT, min(MAX_LAT, lat))
+    n = 2 ** z
+    x = (lng + 180.0) / 360.0 * n
+    lat_r = math.radians(lat)
+    y = (1.0 - math.log(math.tan(lat_r) + 1.0 / math.cos(lat_r)) / math.pi) / 2.0 * n
+    return min(max(x, 0.0), n - 1e-9), min(max(y, 0.0), n - 1e-9)
+
+
+def tile_bounds(z: int, x: int, y: int) -> Tuple[float, float, float, float]:
+    """타일 (z, x, y) → (sw_lat, sw_lng, ne_lat, ne_lng)"""
+    n = 2 ** z
+
+    def _lat(yy):
+        return math.degrees(math.atan(math.sinh(math.pi * (1 - 2 * yy / n))))
+
+    return _lat(y + 1), x / n * 360.0 - 180.0, _lat(y), (x + 1) / n * 360.0 - 180.0
+
+
+def tiles_for_bounds(sw_lat: float, sw_lng: float, ne_lat: float, ne_lng: float, zoom: int) -> Tuple[int, List[TileKey]]:
+    """bounds를 덮는 타일 목록. 너무 많으면 줌을 낮춘다 → (실제 줌, 타일들)"""
+    z = max(MIN_ZOOM, min(MAX_ZOOM, zoom))
+    while True:
+        x0, y0 = lnglat_to_tile_f(ne_lat, sw_lng, z)   # 좌상단
+        x1, y1 = lnglat_to_tile_f(sw_lat, ne_lng, z)   # 우하단
+        xs = range(int(x0), int(x1) + 1)
+        ys = range(int(y0), int(y1) + 1)
+        if len(xs) * len(ys) <= MAX_TILES_PER_REQUEST or z <= MIN_ZOOM:
+            return z, [(z, x, y) for x in xs for y in ys]
+        z -= 1
+
+
+# ---------- 캐시 ----------
+class TileCache:
+    """TTL + 최대 개수(LRU) 딕셔너리. generation이 바뀌면 이전 항목은 전부 무효"""
+
+    def __init__(self, ttl: float = TILE_TTL_SECONDS, max_items: int = TILE_CACHE_MAX):
+        self.ttl = ttl
+        self.max_items = max_items
+        self._data: "OrderedDict[tuple, Tuple[float, list]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.generation = 0
+
+    def get(self, key: tuple) -> Optional[list]:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            expires, value = item
+            if expires < _time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: tuple, value: list) -> None:
+        with self._lock:
+            self._data[key] = (_time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_items:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.generation += 1
+
+    def __len__(self):
+        return len(self._data)
+
+
+tile_cache = TileCache()
+
+
+def invalidate_tile_cache() -> None:
+    tile_cache.clear()
+
+
+# 같은 프로세스에서 공연/공연장이 바뀌면 즉시 무효화 (다른 인스턴스는 TTL로 반영)
+@event.listens_for(Performance, "after_insert")
+@event.listens_for(Performance, "after_update")
+@event.listens_for(Performance, "after_delete")
+@event.listens_for(Venue, "after_update")
+@event.listens_for(Venue, "after_delete")
+def _on_change(mapper, connection, target):
+    invalidate_tile_cache()
+
+
+# ---------- 타일 계산 ----------
+def _load_venues(db: Session, tiles: List[TileKey]) -> List[tuple]:
+    """missing 타일들을 덮는 bbox에서 '오늘 남은 공연'이 있는 공연장 + 공연 수 (쿼리 1번)"""
+    bounds = [tile_bounds(*t) for t in tiles]
+    sw_lat = min(b[0] for b in bounds)
+    sw_lng = min(b[1] for b in bounds)
+    ne_lat = max(b[2] for b in bounds)
+    ne_lng = max(b[3] for b in bounds)
+    return (
+        db.query(Venue.id, Venue.name, Venue.latitude, Venue.longitude, func.count(Performance.id))
+        .join(Performance, Performance.venue_id == Venue.id)
+        .filter(
+            Venue.latitude >= sw_lat, Venue.latitude <= ne_lat,
+            Venue.longitude >= sw_lng, Venue.longitude <= ne_lng,
+            *today_remaining_filter(),
+        )
+        .group_by(Venue.id, Venue.name, Venue.latitude, Venue.longitude)
+        .all()
+    )
+
+
+def _cluster_tile(z: int, venues: List[tuple]) -> List[dict]:
+    """한 타일 안 공연장들을 칸 단위로 묶기. 좌표는 공연 수 가중 평균"""
+    if z >= VENUE_ZOOM:
+        return [
+            {"latitude": la, "longitude": ln, "venue_count": 1, "performance_count": cnt,
+             "venue_id": vid, "name": name}
+            for vid, name, la, ln, cnt in venues
+        ]
+
+    cells: Dict[Tuple[int, int], list] = {}
+    for v in venues:
+        fx, fy = lnglat_to_tile_f(v[2], v[3], z)
+        key = (int(fx * CLUSTER_DIV), int(fy * CLUSTER_DIV))
+        cells.setdefault(key, []).append(v)
+
+    out = []
+    for members in cells.values():
+        total = sum(m[4] for m in members)
+        c = {
+            "latitude": sum(m[2] * m[4] for m in members) / total,
+            "longitude": sum(m[3] * m[4] for m in members) / total,
+            "venue_count": len(members),
+            "performance_count": total,
+            "venue_id": None,
+            "name": None,
+        }
+        if len(members) == 1:
+            c.update(venue_id=members[0][0], name=members[0][1],
+                     latitude=members[0][2], longitude=members[0][3])
+        out.append(c)
+    return out
+
+
+def get_clusters(db: Session, sw_lat: float, sw_lng: float, ne_lat: float, ne_lng: float, zoom: int) -> dict:
+    z, tiles = tiles_for_bounds(sw_lat, sw_lng, ne_lat, ne_lng, zoom)
+    day = now_kst().date().isoformat()   # 날짜가 바뀌면 키도 바뀜
+
+    clusters: List[dict] = []
+    missing: List[TileKey] = []
+    for t in tiles:
+        cached = tile_cache.get((day, *t))
+        if cached is None:
+            missing.append(t)
+        else:
+            clusters.extend(cached)
+
+    if missing:
+        generation = tile_cache.generation
+        per_tile: Dict[TileKey, list] = {t: [] for t in missing}
+        for v in _load_venues(db, missing):
+            fx, fy = lnglat_to_tile_f(v[2], v[3], z)
+            key = (z, int(fx), int(fy))
+            if key in per_tile:
+                per_tile[key].append(v)
+        for t, venues in per_tile.items():
+            tile_clusters = _cluster_tile(z, venues)
+            # 계산 중에 무효화됐으면 캐시에 넣지 않음 (옛 데이터 고정 방지)
+            if tile_cache.generation == generation:
+                tile_cache.set((day, *t), tile_clusters)
+            clusters.extend(tile_clusters)
+
+    return {
+        "zoom": z,
+        "tiles": len(tiles),
+        "cacheHits": len(tiles) - len(missing),
+        "clusters": clusters,
+    }
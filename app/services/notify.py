@@ -1,11 +1,15 @@
 # app/services/notify.py
 import json
+import uuid
 import asyncio
+import time as _time
 from datetime import datetime, date, time, timedelta, timezone
-from typing import Iterable, List, Dict, Optional
+from typing import Callable, Iterable, List, Dict, Optional, Tuple
+from sqlalchemy import String, and_, cast, insert, literal
 from sqlalchemy.orm import Session
 
 from app.models.notification import Notification
+from app.models.push_ticket import PushTicket
 from app.models.performance import Performance
 from app.models.performance_artist import PerformanceArtist
 from app.models.user_favorite_performance import UserFavoritePerformance
@@ -13,13 +17,21 @@ from app.models.user_favorite_artist import UserFavoriteArtist
 from app.models.user_artist_ticketalarm import UserArtistTicketAlarm
 from app.models.user_performance_ticketalarm import UserPerformanceTicketAlarm
 from app.models.user import User
-from app.utils.notify import send_expo_push
+from app.utils.notify import (
+    build_expo_message, send_expo_push_batch, fetch_expo_receipts,
+    close_push_client, is_device_not_registered,
+)
 from app.constants.notification_types import (
     NEW_PERFORMANCE_BY_ARTIST, TICKET_OPEN, FAVORITE_PERFORMANCE_D1
 )
 
 KST = timezone(timedelta(hours=9))
 
+# set 기반 dispatch 기본값
+DISPATCH_CHUNK_SIZE = 1000      # bulk insert 1회당 row 수
+DISPATCH_LOOKBACK_DAYS = 7      # 이 기간보다 오래된 공연은 재스캔하지 않음
+PUSH_JOB_CHUNK_SIZE = 500       # send_push 작업 1건당 알림 수
+
 # ---------- 내부 유틸 ----------
 def _payload_key(perf_id: int) -> str:
     """payload_json과 동일한 직렬화 포맷(키 순서/구분자) 유지"""
@@ -86,58 +98,85 @@ def create_notification(
 
 
 def notify_artist_followers_on_new_performance(
-    db: Session, *, performance_id: int, artist_ids: Iterable[int]
+    db: Session, *, performance_id: int, artist_ids: Iterable[int],
+    chunk_size: int = DISPATCH_CHUNK_SIZE, enqueue_push: bool = False,
 ) -> dict:
     """
     공연 신규 등록 알림(팔로워/알림ON 유저 전원 대상).
-    - 중복 알림 방지 포함
-    - 대량 insert를 한 번의 commit으로 처리
+    - 중복 알림 방지 포함 (기존 알림 조회 + INSERT IGNORE)
+    - chunk 단위 bulk insert
+    - enqueue_push=True면 생성된 알림의 푸시 전송을 작업 큐(send_push)에 등록
     """
-    artist_ids = sorted(set(artist_ids or []))
-    if not artist_ids:
+    return notify_artist_followers_on_new_performances(
+        db, performances=[{"performance_id": performance_id, "artist_ids": list(artist_ids or [])}],
+        chunk_size=chunk_size, enqueue_push=enqueue_push,
+    )
+
+
+def notify_artist_followers_on_new_performances(
+    db: Session, *, performances: List[dict],
+    chunk_size: int = DISPATCH_CHUNK_SIZE, enqueue_push: bool = False,
+) -> dict:
+    """
+    여러 공연의 신규 등록 알림을 한 번에 (일괄 등록 1건 = fan-out 작업 1건)
+    - performances: [{"performance_id": ..., "artist_ids": [...]}, ...]
+    - 팔로워 조회 2회 + 기존 알림 조회 1회 → 공연 수와 무관하게 쿼리 수 일정
+    """
+    artists_by_perf: Dict[int, List[int]] = {}
+    for p in performances:
+        ids = sorted(set(p.get("artist_ids") or []))
+        if ids:
+            artists_by_perf[int(p["performance_id"])] = ids
+    if not artists_by_perf:
         return {"created": 0, "message": "no artists"}
 
-    # 대상 유저 수집: 찜 + 알림ON
-    fav_rows = db.query(UserFavoriteArtist.user_id)\
-        .filter(UserFavoriteArtist.artist_id.in_(artist_ids)).distinct().all()
-    alarm_rows = db.query(UserArtistTicketAlarm.user_id)\
-        .filter(UserArtistTicketAlarm.artist_id.in_(artist_ids)).distinct().all()
-    user_ids = sorted({uid for (uid,) in (fav_rows + alarm_rows)})
-    if not user_ids:
+    # 대상 유저 수집: 찜 + 알림ON (아티스트별)
+    all_artists = sorted({aid for ids in artists_by_perf.values() for aid in ids})
+    followers: Dict[int, set] = {}
+    for model in (UserFavoriteArtist, UserArtistTicketAlarm):
+        for aid, uid in db.query(model.artist_id, model.user_id).filter(model.artist_id.in_(all_artists)).all():
+            followers.setdefault(aid, set()).add(uid)
+    if not followers:
         return {"created": 0, "message": "no followers"}
 
-    perf = db.query(Performance).filter(Performance.id == performance_id).first()
-    if not perf:
+    titles = dict(db.query(Performance.id, Performance.title).filter(Performance.id.in_(list(artists_by_perf))).all())
+    if not titles:
         return {"created": 0, "message": "performance not found"}
 
-    payload_str = _payload_key(perf.id)
-
-    # 이미 존재하는 (user, payload) 조합 조회 → 중복 제거
-    existed_pairs = {
-        (n.user_id, n.payload_json)
-        for n in db.query(Notification.user_id, Notification.payload_json)
-                   .filter(Notification.type == NEW_PERFORMANCE_BY_ARTIST,
-                           Notification.payload_json == payload_str).all()
-    }
-
-    to_create: List[Notification] = []
-    for uid in user_ids:
-        if (uid, payload_str) in existed_pairs:
-            continue
-        to_create.append(_mk_notification(
-            user_id=uid,
-            type_=NEW_PERFORMANCE_BY_ARTIST,
-            title="새 공연 소식",
-            body=f"『{perf.title}』 공연이 등록되었습니다.",
-            link_url=f"/performance/{perf.id}",
-            payload={"performance_id": perf.id},
-        ))
+    # 이미 존재하는 (user, 공연) 제거 (uq 인덱스 범위 조회 1회)
+    payload_of = {pid: _payload_key(pid) for pid in titles}
+    existed = set(
+        db.query(Notification.user_id, Notification.payload_json)
+        .filter(Notification.type == NEW_PERFORMANCE_BY_ARTIST,
+                Notification.payload_json.in_(list(payload_of.values())))
+        .all()
+    )
+    pairs = []
+    for pid, title in titles.items():
+        user_ids = set().union(*(followers.get(aid, set()) for aid in artists_by_perf[pid]))
+        pairs += [(uid, pid, title) for uid in sorted(user_ids) if (uid, payload_of[pid]) not in existed]
+    if not pairs:
+        return {"created": 0}
+
+    # 푸시 작업은 알림 chunk 와 같은 커밋으로 등록 → 중간에 실패해 재시도해도
+    # 이미 커밋된 알림(재시도 때 existed 로 빠짐)의 푸시가 누락되지 않음
+    push_jobs = 0
+
+    def _enqueue_push(rows: list) -> None:
+        nonlocal push_jobs
+        from app.services.jobs import enqueue_job
+        ids = [n.id for n in rows]
+        for i in range(0, len(ids), PUSH_JOB_CHUNK_SIZE):
+            enqueue_job(db, "send_push", {"notification_ids": ids[i:i + PUSH_JOB_CHUNK_SIZE]}, commit=False)
+            push_jobs += 1
+
+    created = _bulk_insert_notifications(
+        db, type_=NEW_PERFORMANCE_BY_ARTIST, title="새 공연 소식",
+        body_fmt="『{title}』 공연이 등록되었습니다.",
+        pairs=pairs, chunk_size=chunk_size, on_chunk=_enqueue_push if enqueue_push else None,
+    )
 
-    if to_create:
-        db.add_all(to_create)
-        db.commit()
-        return {"created": len(to_create)}
-    return {"created": 0}
+    return {"performances": len(titles), "created": len(created), "push_jobs": push_jobs}
 
 
 def reconcile_new_performance_notifications(db: Session, since_hours: int = 72) -> dict:
@@ -202,11 +241,299 @@ def reconcile_new_performance_notifications(db: Session, since_hours: int = 72)
     return {"scanned_performances": len(perfs), "created_notifications": total_created}
 
 
+# ---------- Expo Push ----------
+PUSH_RECEIPT_MIN_AGE_MINUTES = 15   # Expo 권장: 전송 후 15분 뒤 receipt 조회
+PUSH_RECEIPT_MAX_AGE_HOURS = 24     # Expo는 receipt를 24시간만 보관
+
+async def _send_batch_and_close(messages: List[dict]) -> List[dict]:
+    try:
+        return await send_expo_push_batch(messages)
+    finally:
+        await close_push_client()
+
+def _clear_push_tokens(db: Session, pairs: Iterable[Tuple[int, str]]) -> int:
+    """DeviceNotRegistered 토큰 정리 (그 사이 새 토큰으로 바뀐 유저는 건드리지 않음)"""
+    cleared = 0
+    for uid, token in set(pairs):
+        cleared += db.query(User).filter(User.id == uid, User.push_token == token)\
+                     .update({User.push_token: None}, synchronize_session=False)
+    return cleared
+
+def _send_push(db: Session, notifications) -> dict:
+    """
+    생성된 알림(id/user_id/title/body)을 Expo Push로 전송
+    - 대상 유저 토큰은 한 번의 IN 조회
+    - 100개 단위 batch + 동시 요청 제한 + 재시도 (app.utils.notify)
+    - ok ticket은 push_ticket에 저장 → poll_push_receipts()에서 receipt 확인
+    """
+    notifications = list(notifications)
+    if not notifications:
+        return {"sent": 0, "ok": 0, "errors": 0, "cleared_tokens": 0}
+
+    user_ids = {n.user_id for n in notifications}
+    tokens: Dict[int, str] = {
+        uid: token for uid, token in
+        db.query(User.id, User.push_token)
+          .filter(User.id.in_(user_ids), User.alarm_enabled == True, User.push_token.isnot(None))
+          .all()
+    }
+
+    targets = [(n, tokens[n.user_id]) for n in notifications if tokens.get(n.user_id)]
+    if not targets:
+        return {"sent": 0, "ok": 0, "errors": 0, "cleared_tokens": 0}
+
+    messages = [build_expo_message(token, n.title, n.body, {"nid": n.id}) for n, token in targets]
+    tickets = asyncio.run(_send_batch_and_close(messages))
+
+    ok_rows, dead = [], []
+    for (n, token), ticket in zip(targets, tickets):
+        if ticket.get("status") == "ok" and ticket.get("id"):
+            ok_rows.append({"ticket_id": ticket["id"], "user_id": n.user_id,
+                            "notification_id": n.id, "push_token": token})
+        elif is_device_not_registered(ticket):
+            dead.append((n.user_id, token))
+
+    if ok_rows:
+        db.execute(insert(PushTicket), ok_rows)
+    cleared = _clear_push_tokens(db, dead)
+    db.commit()
+
+    return {"sent": len(targets), "ok": len(ok_rows), "errors": len(targets) - len(ok_rows), "cleared_tokens": cleared}
+
+
+def poll_push_receipts(db: Session, *, min_age_minutes: int = PUSH_RECEIPT_MIN_AGE_MINUTES, limit: int = 5000) -> dict:
+    """
+    저장된 push ticket의 receipt를 조회해서
+    - DeviceNotRegistered → user.push_token 정리
+    - 결과가 나온 ticket / 24시간 지난 ticket → 삭제
+    """
+    now = datetime.utcnow()
+    rows = (
+        db.query(PushTicket.id, PushTicket.ticket_id, PushTicket.user_id, PushTicket.push_token, PushTicket.created_at)
+        .filter(PushTicket.created_at <= now - timedelta(minutes=min_age_minutes))
+        .order_by(PushTicket.created_at.asc())
+        .limit(limit)
+        .all()
+    )
+    if not rows:
+        return {"checked": 0, "resolved": 0, "expired": 0, "cleared_tokens": 0}
+
+    async def _fetch() -> Dict[str, dict]:
+        try:
+            return await fetch_expo_receipts([r.ticket_id for r in rows])
+        finally:
+            await close_push_client()
+
+    receipts = asyncio.run(_fetch())
+
+    done_ids, dead, expired = [], [], 0
+    expire_before = now - timedelta(hours=PUSH_RECEIPT_MAX_AGE_HOURS)
+    for r in rows:
+        receipt = receipts.get(r.ticket_id)
+        if receipt is None:
+            if r.created_at <= expire_before:
+                done_ids.append(r.id)
+                expired += 1
+            continue
+        done_ids.append(r.id)
+        if is_device_not_registered(receipt):
+            dead.append((r.user_id, r.push_token))
+
+    cleared = _clear_push_tokens(db, dead)
+    if done_ids:
+        db.query(PushTicket).filter(PushTicket.id.in_(done_ids)).delete(synchronize_session=False)
+    db.commit()
+
+    return {"checked": len(rows), "resolved": len(done_ids) - expired, "expired": expired, "cleared_tokens": cleared}
+
+
+# ---------- Set 기반 Dispatch 유틸 ----------
+def _payload_sql(perf_id_col):
+    """_payload_key()와 동일한 문자열을 SQL 식으로 생성 ('{"performance_id":123}')"""
+    return literal('{"performance_id":', String) + cast(perf_id_col, String) + literal("}", String)
+
+def _due_cutoff_date(now_utc: datetime) -> date:
+    """
+    '대상일 전날 12:00 KST' 조건을 만족하는 마지막 대상일.
+    (now_kst >= (d - 1일) 12:00  <=>  d <= cutoff)
+    """
+    now_kst = now_utc.astimezone(KST)
+    if now_kst.time() >= time(12, 0):
+        return now_kst.date() + timedelta(days=1)
+    return now_kst.date()
+
+def _select_due_pairs(
+    db: Session, *, alarm_model, date_col, type_: str,
+    cutoff: Optional[date], since: Optional[date],
+) -> List[Tuple[int, int, str]]:
+    """
+    (user_id, performance_id, title) 중 아직 알림이 없는 조합을 한 번의 JOIN으로 조회.
+    notification은 uq_notification_user_type_payload 인덱스로 anti-join 한다.
+    """
+    q = (
+        db.query(alarm_model.user_id, Performance.id, Performance.title)
+        .join(Performance, Performance.id == alarm_model.performance_id)
+        .outerjoin(Notification, and_(
+            Notification.user_id == alarm_model.user_id,
+            Notification.type == type_,
+            Notification.payload_json == _payload_sql(Performance.id),
+        ))
+        .filter(date_col.isnot(None), Notification.id.is_(None))
+    )
+    if cutoff is not None:
+        q = q.filter(date_col <= cutoff)
+    if since is not None:
+        q = q.filter(date_col >= since)
+    return q.all()
+
+def _bulk_insert_notifications(
+    db: Session, *, type_: str, title: str, body_fmt: str,
+    pairs: List[Tuple[int, int, str]], chunk_size: int,
+    on_chunk: Optional[Callable[[list], None]] = None,
+) -> list:
+    """
+    chunk 단위 INSERT IGNORE (SQLite: INSERT OR IGNORE).
+    on_chunk(이번 chunk 에서 삽입된 row 목록) 은 chunk 커밋 직전에 호출 → 같은 트랜잭션 (푸시 작업 등록용)
+    동시에 다른 dispatch가 같은 알림을 만든 경우 uq_notification_user_type_payload에서 걸러진다.
+    반환: 이번에 삽입된 알림 row 목록(id, user_id, title, body) → 푸시 전송용
+    (dispatch_token 으로 재조회 → IGNORE 로 건너뛴, 다른 dispatch 가 넣은 행은 포함되지 않음)
+    """
+    stmt = (
+        insert(Notification)
+        .prefix_with("IGNORE", dialect="mysql")
+        .prefix_with("OR IGNORE", dialect="sqlite")
+    )
+    token = uuid.uuid4().hex
+    created = []
+    for i in range(0, len(pairs), chunk_size):
+        chunk = pairs[i:i + chunk_size]
+        rows = [{
+            "user_id": uid,
+            "type": type_,
+            "title": title,
+            "body": body_fmt.format(title=ptitle),
+            "link_url": f"/performance/{pid}",
+            "payload_json": _payload_key(pid),
+            "dispatch_token": token,
+        } for uid, pid, ptitle in chunk]
+        db.execute(stmt, rows)
+
+        # 방금 넣은 row의 id 회수 (uq 인덱스 범위 조회 + 이번 실행 token)
+        got = (
+            db.query(Notification.id, Notification.user_id, Notification.title,
+                     Notification.body, Notification.payload_json)
+            .filter(Notification.type == type_,
+                    Notification.user_id.in_({r["user_id"] for r in rows}),
+                    Notification.payload_json.in_({r["payload_json"] for r in rows}),
+                    Notification.dispatch_token == token)
+            .all()
+        )
+        if on_chunk is not None and got:
+            on_chunk(got)
+        db.commit()  # chunk마다 커밋 → 락/커넥션 점유 최소화
+        created.extend(got)
+    return created
+
+
+def _dispatch_set_based(
+    db: Session, *, now_utc: datetime, force_ticket_open: bool,
+    lookback_days: int, chunk_size: int, send_push: bool,
+) -> dict:
+    """due (user, performance) 조합을 SQL로 선별 → chunk bulk insert → 푸시"""
+    timings: Dict[str, float] = {}
+
+    def _lap(key: str, started: float):
+        timings[key] = round((_time.perf_counter() - started) * 1000, 2)
+
+    cutoff = _due_cutoff_date(now_utc)
+    since = cutoff - timedelta(days=lookback_days)
+
+    # (1) 예매오픈 알림
+    t0 = _time.perf_counter()
+    open_pairs = _select_due_pairs(
+        db,
+        alarm_model=UserPerformanceTicketAlarm,
+        date_col=Performance.ticket_open_date,
+        type_=TICKET_OPEN,
+        cutoff=None if force_ticket_open else cutoff,
+        since=None if force_ticket_open else since,
+    )
+    _lap("select_ticket_open", t0)
+
+    t0 = _time.perf_counter()
+    created_open = _bulk_insert_notifications(
+        db, type_=TICKET_OPEN, title="예매 오픈 알림",
+        body_fmt="『{title}』 예매가 곧 열립니다.",
+        pairs=open_pairs, chunk_size=chunk_size,
+    )
+    _lap("insert_ticket_open", t0)
+
+    # (2) 공연 D-1 알림
+    t0 = _time.perf_counter()
+    fav_pairs = _select_due_pairs(
+        db,
+        alarm_model=UserFavoritePerformance,
+        date_col=Performance.date,
+        type_=FAVORITE_PERFORMANCE_D1,
+        cutoff=cutoff,
+        since=since,
+    )
+    _lap("select_favorite_d1", t0)
+
+    t0 = _time.perf_counter()
+    created_fav = _bulk_insert_notifications(
+        db, type_=FAVORITE_PERFORMANCE_D1, title="공연 D-1 알림",
+        body_fmt="『{title}』 공연이 내일입니다.",
+        pairs=fav_pairs, chunk_size=chunk_size,
+    )
+    _lap("insert_favorite_d1", t0)
+
+    # (3) Expo Push 전송
+    push: Optional[dict] = None
+    if send_push:
+        t0 = _time.perf_counter()
+        push = _send_push(db, created_open + created_fav)
+        _lap("push", t0)
+
+    return {
+        "mode": "set",
+        "created_ticket_open": len(created_open),
+        "created_favorite_d1": len(created_fav),
+        "push": push,
+        "timings_ms": timings,
+    }
+
+
 # ---------- 통합 Dispatch (DB 알림 + 푸시 전송) ----------
-def dispatch_scheduled_notifications(db: Session, *, now_utc_override: Optional[datetime] = None) -> dict:
-    """DB 알림 생성 + Expo Push 전송까지 한 번에 처리"""
+def dispatch_scheduled_notifications(
+    db: Session,
+    *,
+    now_utc_override: Optional[datetime] = None,
+    force_ticket_open: bool = False,
+    mode: str = "set",
+    lookback_days: int = DISPATCH_LOOKBACK_DAYS,
+    chunk_size: int = DISPATCH_CHUNK_SIZE,
+    send_push: bool = True,
+) -> dict:
+    """
+    DB 알림 생성 + Expo Push 전송까지 한 번에 처리
+    - mode="set"  : SQL JOIN으로 due 조합만 선별, chunk bulk insert (기본값)
+    - mode="scan" : 기존 방식 (알림 테이블 전체 로드 후 파이썬에서 판정)
+    """
+    now_utc = now_utc_override or datetime.utcnow()
+    now_utc = now_utc.replace(tzinfo=timezone.utc) if now_utc.tzinfo is None else now_utc.astimezone(timezone.utc)
+
+    if mode == "scan":
+        return _dispatch_full_scan(db, now_utc=now_utc, force_ticket_open=force_ticket_open, send_push=send_push)
+    return _dispatch_set_based(
+        db, now_utc=now_utc, force_ticket_open=force_ticket_open,
+        lookback_days=lookback_days, chunk_size=chunk_size, send_push=send_push,
+    )
 
-    now_utc = (now_utc_override or datetime.utcnow()).replace(tzinfo=timezone.utc)
+
+def _dispatch_full_scan(db: Session, *, now_utc: datetime, force_ticket_open: bool, send_push: bool) -> dict:
+    """기존 전체 스캔 방식 (비교/롤백용으로 유지)"""
+    started = _time.perf_counter()
 
     # (1) 예매오픈 알림
     open_rows = db.query(UserPerformanceTicketAlarm.user_id, UserPerformanceTicketAlarm.performance_id).all()
@@ -223,7 +550,7 @@ def dispatch_scheduled_notifications(db: Session, *, now_utc_override: Optional[
         if not perf or not perf.ticket_open_date:
             continue
         due_utc = datetime.combine(perf.ticket_open_date - timedelta(days=1), time(12, 0), tzinfo=KST).astimezone(timezone.utc)
-        if now_utc < due_utc:
+        if not force_ticket_open and now_utc < due_utc:
             continue
 
         payload = {"performance_id": pid}
@@ -275,23 +602,14 @@ def dispatch_scheduled_notifications(db: Session, *, now_utc_override: Optional[
         db.commit()
 
     # (3) Expo Push 전송
-    async def _send_push(notifications: List[Notification]):
-        tasks = []
-        for n in notifications:
-            user = db.query(User).filter(User.id == n.user_id).first()
-            if user and user.alarm_enabled and user.push_token:
-                tasks.append(send_expo_push(
-                    token=user.push_token,
-                    title=n.title,
-                    body=n.body,
-                    payload={"nid": n.id}
-                ))
-        if tasks:
-            await asyncio.gather(*tasks)
-
-    asyncio.run(_send_push(to_create_open + to_create_fav))
+    push: Optional[dict] = None
+    if send_push:
+        push = _send_push(db, to_create_open + to_create_fav)
 
     return {
+        "mode": "scan",
         "created_ticket_open": len(to_create_open),
         "created_favorite_d1": len(to_create_fav),
+        "push": push,
+        "timings_ms": {"total": round((_time.perf_counter() - started) * 1000, 2)},
     }
@@ -0,0 +1,192 @@
+# app/services/performance_ingest.py
+# 공연 일괄 등록 (POST /performance/bulk, python -m app.scripts.ingest_performances)
+# - 한 배치 = 한 트랜잭션: 공연 INSERT + performance_artist INSERT + 새 공연 알림 fan-out 작업 1건이 같은 커밋
+# - 공연장(venue_id / venue_instagram), 아티스트(artist_ids / artist_names)는 배치 전체를 IN 조회로 한 번에 해석
+# - 중복: shortcode 가 같은 공연, shortcode 가 없으면 (공연장, 날짜, 시각, 제목) 이 같은 공연은 건너뜀 (기존 행 + 배치 내)
+# - INSERT 는 Core executemany (ORM 객체 없이). MySQL 은 RETURNING 이 없어서 id 는 자연 키로 한 번 재조회
+# - 실패한 항목(검증/공연장·아티스트 없음)은 errors 로 돌려주고 나머지는 등록
+# - ORM 이벤트를 안 타므로 자동완성(예정 공연 추가)/지도 타일 캐시는 커밋 후 직접 반영
+import datetime as dt
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from pydantic import ValidationError
+from sqlalchemy import insert, or_
+from sqlalchemy.orm import Session
+
+from app.models.artist import Artist
+from app.models.performance import Performance, combine_start_at
+from app.models.performance_artist import PerformanceArtist
+from app.models.venue import Venue
+from app.schemas.performance import PerformanceBulkItem
+from app.services.autocomplete import queue_autocomplete_upserts
+from app.services.bulk_import import SPECS, on_commit, upsert_rows
+from app.services.jobs import enqueue_job
+from app.services.map_tiles import invalidate_tile_cache
+from app.services.response_cache import mark_tables_changed
+from app.utils.text_utils import clean_title
+from app.utils.time_window import now_kst
+
+MAX_BATCH = 1000        # API 한 요청(= 한 트랜잭션) 최대 공연 수
+
+
+def parse_items(records: Iterable[dict]) -> Tuple[List[Tuple[int, PerformanceBulkItem]], List[dict]]:
+    """원시 dict → (index, PerformanceBulkItem). 검증 실패는 errors 로"""
+    items, errors = [], []
+    for i, record in enumerate(records):
+        try:
+            items.append((i, PerformanceBulkItem.model_validate(record)))
+        except ValidationError as e:
+            err = e.errors()[0]
+            errors.append({"index": i, "error": f"{'.'.join(str(x) for x in err['loc'])}: {err['msg']}"})
+    return items, errors
+
+
+def _account(value: Optional[str]) -> Optional[str]:
+    return value.strip().lstrip("@") if value and value.strip() else None
+
+
+def _key(venue_id: int, d: dt.date, t: dt.time, title: str) -> tuple:
+    return venue_id, d, t, title.strip()
+
+
+def _resolve_venues(db: Session, items) -> Tuple[set, Dict[str, int]]:
+    ids = {it.venue_id for _, it in items if it.venue_id}
+    accounts = {a for a in (_account(it.venue_instagram) for _, it in items) if a}
+    known = {vid for (vid,) in db.query(Venue.id).filter(Venue.id.in_(ids)).all()} if ids else set()
+    by_account = dict(
+        db.query(Venue.instagram_account, Venue.id).filter(Venue.instagram_account.in_(accounts)).all()
+    ) if accounts else {}
+    return known, by_account
+
+
+def _resolve_artists(db: Session, items, create_missing: bool) -> Tuple[set, Dict[str, int]]:
+    ids = {aid for _, it in items for aid in it.artist_ids}
+    names = {n.strip() for _, it in items for n in it.artist_names if n.strip()}
+    known = {aid for (aid,) in db.query(Artist.id).filter(Artist.id.in_(ids)).all()} if ids else set()
+    by_name = dict(db.query(Artist.name, Artist.id).filter(Artist.name.in_(names)).all()) if names else {}
+    missing = names - set(by_name)
+    if missing and create_missing:
+        # name 자연 키 upsert (app/services/bulk_import.py) → 같은 트랜잭션 안에서 id 재조회
+        upsert_rows(db, SPECS["artist"], [{"name": n} for n in sorted(missing)])
+        by_name.update(db.query(Artist.name, Artist.id).filter(Artist.name.in_(missing)).all())
+    return known, by_name
+
+
+def ingest_performances(
+    db: Session,
+    items: Sequence[Tuple[int, PerformanceBulkItem]],
+    *,
+    create_missing_artists: bool = False,
+    notify: bool = True,
+    errors: Optional[List[dict]] = None,
+    commit: bool = True,
+) -> dict:
+    """
+    (index, 항목) 배치 등록. 반환: received/created/duplicates/performanceIds/errors/notifyJobId
+    errors 에 parse_items 단계 오류를 넘기면 결과에 합쳐서 돌려줌
+    """
+    errors = list(errors or [])
+    received = len(items) + len(errors)
+    venue_ids, venue_by_account = _resolve_venues(db, items)
+    artist_ids, artist_by_name = _resolve_artists(db, items, create_missing_artists)
+
+    # 1) 항목별 공연장/아티스트 확정
+    resolved = []       # (index, row, artist_ids, dedupe key)
+    for i, it in items:
+        account = _account(it.venue_instagram)
+        venue_id = it.venue_id if it.venue_id in venue_ids else venue_by_account.get(account) if account else None
+        if venue_id is None:
+            errors.append({"index": i, "error": f"unknown venue: {it.venue_id or it.venue_instagram}"})
+            continue
+        unknown = [str(a) for a in it.artist_ids if a not in artist_ids]
+        unknown += [n for n in it.artist_names if n.strip() and n.strip() not in artist_by_name]
+        if unknown:
+            errors.append({"index": i, "error": f"unknown artist: {', '.join(unknown)}"})
+            continue
+        t = it.time or dt.time(0, 0)
+        row = {
+            "title": it.title.strip(), "venue_id": venue_id, "date": it.date, "time": t,
+            "price": str(it.price) if it.price is not None else "",
+            "ticket_open_date": it.ticket_open_date, "ticket_open_time": it.ticket_open_time,
+            "detail_url": it.detail_url, "image_url": it.image_url, "shortcode": it.shortcode or None,
+        }
+        aids = sorted(set(it.artist_ids) | {artist_by_name[n.strip()] for n in it.artist_names if n.strip()})
+        resolved.append((i, row, aids, row["shortcode"] or _key(venue_id, it.date, t, row["title"])))
+
+    # 2) 중복 제거: 기존 공연(쿼리 1회) + 배치 내
+    existing = _existing_keys(db, [r for _, r, _, _ in resolved])
+    fresh, duplicates, seen = [], 0, set()
+    for entry in resolved:
+        key = entry[3]
+        if key in existing or key in seen:
+            duplicates += 1
+            continue
+        seen.add(key)
+        fresh.append(entry)
+
+    # 3) 공연 INSERT → id 회수 → performance_artist INSERT
+    perf_ids: List[int] = []
+    fanout = []
+    if fresh:
+        now = dt.datetime.utcnow()
+        db.execute(insert(Performance.__table__), [{**row, "created_at": now, "updated_at": now} for _, row, _, _ in fresh])
+        ids_by_key = _existing_keys(db, [row for _, row, _, _ in fresh], with_ids=True)
+        links = []
+        for _, row, aids, key in fresh:
+            pid = ids_by_key[key]
+            perf_ids.append(pid)
+            links += [{"performance_id": pid, "artist_id": aid} for aid in aids]
+            if aids:
+                fanout.append({"performance_id": pid, "artist_ids": aids})
+        if links:
+            db.execute(insert(PerformanceArtist.__table__), links)
+        mark_tables_changed(db, "performance", "artist")
+        upcoming = [(ids_by_key[key], clean_title(row["title"])) for _, row, _, key in fresh
+                    if combine_start_at(row["date"], row["time"]) >= now_kst()]
+
+        def _refresh_indexes():
+            queue_autocomplete_upserts("performance", upcoming)
+            invalidate_tile_cache()
+        on_commit(db, _refresh_indexes)
+
+    # 4) 새 공연 알림 fan-out 은 배치당 작업 1건 (같은 커밋)
+    job_id = None
+    if notify and fanout:
+        job_id = enqueue_job(db, "fanout_new_performances", {"performances": fanout}, commit=False).id
+    if commit:
+        db.commit()
+
+    return {
+        "received": received,
+        "created": len(perf_ids),
+        "duplicates": duplicates,
+        "performanceIds": perf_ids,
+        "errors": sorted(errors, key=lambda e: e["index"]),
+        "notifyJobId": job_id,
+    }
+
+
+def _existing_keys(db: Session, rows: List[dict], *, with_ids: bool = False):
+    """
+    rows 와 겹치는 기존 공연의 중복 키 (shortcode 또는 (공연장, 날짜, 시각, 제목))
+    with_ids=True 면 {키: id} (같은 키가 여러 개면 가장 최근 id)
+    """
+    shortcodes = {r["shortcode"] for r in rows if r["shortcode"]}
+    plain = [r for r in rows if not r["shortcode"]]
+    conds = []
+    if shortcodes:
+        conds.append(Performance.shortcode.in_(shortcodes))
+    if plain:
+        conds.append(Performance.venue_id.in_({r["venue_id"] for r in plain})
+                     & Performance.date.in_({r["date"] for r in plain})
+                     & Performance.title.in_({r["title"] for r in plain}))
+    if not conds:
+        return {} if with_ids else set()
+    found: Dict[object, int] = {}
+    q = db.query(Performance.id, Performance.shortcode, Performance.venue_id, Performance.date,
+                 Performance.time, Performance.title).filter(or_(*conds)).order_by(Performance.id)
+    for pid, shortcode, venue_id, d, t, title in q.all():
+        if shortcode in shortcodes:
+            found[shortcode] = pid
+        found[_key(venue_id, d, t, title)] = pid
+    return found if with_ids else set(found)
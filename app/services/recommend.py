@@ -0,0 +1,152 @@
+# app/services/recommend.py
+# 홈 추천 공연: 오프라인 item-item 협업 필터링
+# - 찜 데이터로 희소 행렬 구성 (사용자×공연, 사용자×아티스트)
+# - 공연-공연 / 아티스트-아티스트 코사인 유사도 → 사용자별 예정 공연 점수 → 상위 N개를 user_recommendation 에 저장
+# - API(crud.performance.get_recommendation_performances)는 user_recommendation 인덱스 조회만, 부족하면 인기순 fallback
+# 실행: python -m app.scripts.build_recommendations   (또는 작업 큐 kind="rebuild_recommendations")
+import time as _time
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import numpy as np
+import scipy.sparse as sp
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from app.models.performance import Performance
+from app.models.performance_artist import PerformanceArtist
+from app.models.user_favorite_artist import UserFavoriteArtist
+from app.models.user_favorite_performance import UserFavoritePerformance
+from app.models.user_recommendation import UserRecommendation
+from app.utils.time_window import upcoming_filter
+
+RECOMMEND_TOP_N = 30          # 사용자당 저장 개수 (API는 이 중 예정 공연 상위 6개)
+PERF_WEIGHT = 0.6             # 공연 찜 기반 점수 비중
+ARTIST_WEIGHT = 0.4           # 아티스트 찜 기반 점수 비중
+USER_CHUNK = 2000             # 점수 행렬 계산 단위 (메모리 제한)
+WRITE_CHUNK = 5000
+
+
+def _index(values) -> Dict[int, int]:
+    return {v: i for i, v in enumerate(sorted(set(values)))}
+
+
+def _binary_matrix(pairs, rows: Dict[int, int], cols: Dict[int, int]) -> sp.csr_matrix:
+    r = [rows[a] for a, b in pairs if a in rows and b in cols]
+    c = [cols[b] for a, b in pairs if a in rows and b in cols]
+    m = sp.csr_matrix((np.ones(len(r), dtype=np.float32), (r, c)), shape=(len(rows), len(cols)))
+    m.data[:] = 1.0   # 중복 (user, item) 쌍 제거
+    return m
+
+
+def _cosine_item_similarity(x: sp.csr_matrix, target_cols: Optional[np.ndarray] = None) -> sp.csr_matrix:
+    """
+    item-item 코사인 유사도 = (XᵀX)_ij / sqrt(n_i * n_j)
+    target_cols 가 있으면 열을 그 item들로 제한 (예정 공연만 점수 대상)
+    """
+    counts = np.asarray(x.sum(axis=0)).ravel()
+    norm = np.zeros_like(counts, dtype=np.float32)
+    nz = counts > 0
+    norm[nz] = 1.0 / np.sqrt(counts[nz])
+    xt = x.T.tocsr()
+    right = x if target_cols is None else x[:, target_cols]
+    co = (xt @ right).tocsr()
+    right_norm = norm if target_cols is None else norm[target_cols]
+    return sp.diags(norm) @ co @ sp.diags(right_norm)
+
+
+def _row_normalize(m: sp.csr_matrix) -> sp.csr_matrix:
+    """사용자별 최대값 1로 스케일 (두 신호 합칠 때 척도 맞춤)"""
+    m = m.tocsr()
+    mx = m.max(axis=1).toarray().ravel()
+    mx[mx == 0] = 1.0
+    return sp.diags(1.0 / mx) @ m
+
+
+def compute_recommendations(
+    fav_perf: List[tuple],
+    fav_artist: List[tuple],
+    perf_artist: List[tuple],
+    upcoming_ids: List[int],
+    *,
+    top_n: int = RECOMMEND_TOP_N,
+) -> Dict[int, List[tuple]]:
+    """순수 계산부 (DB 없음). 반환: user_id → [(performance_id, score), ...] 점수 내림차순"""
+    if not upcoming_ids:
+        return {}
+    users = _index([u for u, _ in fav_perf] + [u for u, _ in fav_artist])
+    perfs = _index([p for _, p in fav_perf] + list(upcoming_ids) + [p for p, _ in perf_artist])
+    artists = _index([a for _, a in fav_artist] + [a for _, a in perf_artist])
+    if not users:
+        return {}
+
+    up_cols = np.array(sorted(perfs[p] for p in set(upcoming_ids)), dtype=np.int64)
+    up_ids = np.array(sorted(perfs, key=perfs.get), dtype=np.int64)[up_cols]
+
+    x_perf = _binary_matrix(fav_perf, users, perfs)           # 사용자 × 공연
+    x_art = _binary_matrix(fav_artist, users, artists)        # 사용자 × 아티스트
+    pa = _binary_matrix(perf_artist, perfs, artists)          # 공연 × 아티스트
+
+    # 공연 신호: 내가 찜한 공연들과 비슷한 예정 공연
+    sim_perf = _cosine_item_similarity(x_perf, up_cols)       # 공연 × 예정공연
+    # 아티스트 신호: 내가 찜한 아티스트(+비슷한 아티스트)가 나오는 예정 공연
+    sim_art = _cosine_item_similarity(x_art)                  # 아티스트 × 아티스트 (대각 = 1 → 직접 찜 포함)
+    art_to_up = (sim_art @ pa[up_cols].T).tocsr()             # 아티스트 × 예정공연
+
+    uid_of = np.array(sorted(users, key=users.get), dtype=np.int64)
+    out: Dict[int, List[tuple]] = {}
+    for start in range(0, len(users), USER_CHUNK):
+        rows = slice(start, min(start + USER_CHUNK, len(users)))
+        xp, xa = x_perf[rows], x_art[rows]
+        score = PERF_WEIGHT * _row_normalize(xp @ sim_perf) + ARTIST_WEIGHT * _row_normalize(xa @ art_to_up)
+        score = score.tocsr()
+        liked_up = xp[:, up_cols].tocsr()                     # 이미 찜한 공연 제외
+        score = score - score.multiply(liked_up)
+        score.eliminate_zeros()
+
+        for i in range(score.shape[0]):
+            lo, hi = score.indptr[i], score.indptr[i + 1]
+            if lo == hi:
+                continue
+            cols, vals = score.indices[lo:hi], score.data[lo:hi]
+            k = min(top_n, len(vals))
+            top = np.argpartition(-vals, k - 1)[:k]
+            top = top[np.argsort(-vals[top], kind="stable")]
+            out[int(uid_of[start + i])] = [(int(up_ids[cols[j]]), float(vals[j])) for j in top]
+    return out
+
+
+def build_recommendations(db: Session, *, top_n: int = RECOMMEND_TOP_N) -> dict:
+    """찜 데이터 읽기 → 계산 → user_recommendation 전체 교체 (한 트랜잭션)"""
+    t0 = _time.perf_counter()
+    fav_perf = db.query(UserFavoritePerformance.user_id, UserFavoritePerformance.performance_id).all()
+    fav_artist = db.query(UserFavoriteArtist.user_id, UserFavoriteArtist.artist_id).all()
+    perf_artist = db.query(PerformanceArtist.performance_id, PerformanceArtist.artist_id).all()
+    upcoming_ids = [pid for (pid,) in db.query(Performance.id).filter(upcoming_filter()).all()]
+    t_load = _time.perf_counter()
+
+    recs = compute_recommendations(fav_perf, fav_artist, perf_artist, upcoming_ids, top_n=top_n)
+    t_compute = _time.perf_counter()
+
+    now = datetime.utcnow()
+    rows = [
+        {"user_id": uid, "performance_id": pid, "score": score, "computed_at": now}
+        for uid, items in recs.items() for pid, score in items
+    ]
+    db.query(UserRecommendation).delete(synchronize_session=False)
+    for i in range(0, len(rows), WRITE_CHUNK):
+        db.execute(insert(UserRecommendation), rows[i:i + WRITE_CHUNK])
+    db.commit()
+    t_write = _time.perf_counter()
+
+    stats = {
+        "users": len(recs),
+        "rows": len(rows),
+        "upcoming": len(upcoming_ids),
+        "load_ms": round((t_load - t0) * 1000),
+        "compute_ms": round((t_compute - t_load) * 1000),
+        "write_ms": round((t_write - t_compute) * 1000),
+    }
+    print(f"[recommend] {stats}")
+    return stats
+
@@ -0,0 +1,418 @@
+# app/services/response_cache.py
+# 공개 조회 API 응답 캐시 (로그인 여부와 무관하게 응답이 같은 GET 엔드포인트용)
+# - 키: 라우트 경로 템플릿 + 실제 path + 정렬된 query (region=a&region=b 와 region=b&region=a 는 같은 키)
+# - 백엔드: memory(프로세스 LRU + TTL) / redis(RESP 프로토콜, 인스턴스 간 공유)
+#   RESPONSE_CACHE_BACKEND=memory|redis|off, RESPONSE_CACHE_URL=redis://host:port/db
+#   로컬에서는 python -m app.scripts.fake_redis_server 로 Redis 대신 띄울 수 있음
+# - 태그 무효화: 엔드포인트가 읽는 테이블 이름을 태그로 달아두고, ORM 세션 커밋 때 바뀐 테이블 태그를 자동 무효화
+#   (세션 추적이 안 되는 Core bulk UPDATE/DELETE 는 invalidate_tags() 직접 호출)
+# - single-flight: 같은 키의 동시 miss 는 첫 요청만 핸들러(DB) 실행, 나머지는 그 결과를 같이 씀
+# 사용:
+#   router = APIRouter(prefix="...", route_class=CachedRoute)
+#   @router.get("/today")
+#   @cache_response(ttl=60, tags=["performance", "venue"])
+#   def today(...): ...
+import asyncio
+import os
+import socket
+import threading
+import time as _time
+from collections import OrderedDict
+from itertools import chain
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+from urllib.parse import unquote, urlencode, urlparse
+
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+RESPONSE_CACHE_BACKEND = os.getenv("RESPONSE_CACHE_BACKEND", "memory")   # memory | redis | off
+RESPONSE_CACHE_URL = os.getenv("RESPONSE_CACHE_URL", "redis://127.0.0.1:6379/0")
+RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "2000"))
+RESPONSE_CACHE_PREFIX = os.getenv("RESPONSE_CACHE_PREFIX", "rc:")
+TAG_TTL_SECONDS = 86400          # redis 태그 집합 만료 (가장 긴 응답 TTL보다 길게)
+REDIS_TIMEOUT = 0.5
+REDIS_RETRY_SECONDS = 5.0        # 연결 실패 후 이 시간 동안은 캐시 없이 바로 DB
+
+
+class CachePolicy:
+    __slots__ = ("ttl", "tags")
+
+    def __init__(self, ttl: int, tags: Sequence[str]):
+        self.ttl, self.tags = ttl, tuple(tags)
+
+
+_known_tags: Set[str] = set()    # 어떤 엔드포인트든 달고 있는 태그 (그 외 테이블 변경은 무시)
+
+
+def cache_response(*, ttl: int, tags: Sequence[str]):
+    """엔드포인트 함수에 캐시 정책 표시 (실제 캐싱은 CachedRoute 가 처리)"""
+    def deco(fn):
+        fn.__response_cache__ = CachePolicy(ttl, tags)
+        _known_tags.update(tags)
+        return fn
+    return deco
+
+
+def cache_key(path_format: str, request: Request) -> str:
+    query = sorted((k, v) for k, v in request.query_params.multi_items() if v != "")
+    return f"{path_format}|{request.url.path}?{urlencode(query)}"
+
+
+def _pack(media_type: Optional[str], body: bytes) -> bytes:
+    return (media_type or "").encode() + b"\n" + body
+
+
+def _unpack(raw: bytes) -> Tuple[str, bytes]:
+    media_type, _, body = raw.partition(b"\n")
+    return media_type.decode(), body
+
+
+# ---------- 백엔드 ----------
+class MemoryBackend:
+    """프로세스 내 LRU. 만료는 조회 시점에 확인"""
+    blocking = False
+
+    def __init__(self, max_entries: int = RESPONSE_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._data: "OrderedDict[str, Tuple[float, bytes, Tuple[str, ...]]]" = OrderedDict()
+        self._tags: Dict[str, Set[str]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def _drop(self, key: str) -> None:
+        item = self._data.pop(key, None)
+        if item is not None:
+            for t in item[2]:
+                keys = self._tags.get(t)
+                if keys is not None:
+                    keys.discard(key)
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            if item[0] <= _time.monotonic():
+                self._drop(key)
+                return None
+            self._data.move_to_end(key)
+            return item[1]
+
+    def set(self, key: str, value: bytes, ttl: int, tags: Sequence[str]) -> None:
+        with self._lock:
+            self._drop(key)
+            self._data[key] = (_time.monotonic() + ttl, value, tuple(tags))
+            for t in tags:
+                self._tags.setdefault(t, set()).add(key)
+            while len(self._data) > self.max_entries:
+                self._drop(next(iter(self._data)))
+
+    def invalidate(self, tags: Iterable[str]) -> int:
+        with self._lock:
+            keys = set(chain.from_iterable(self._tags.pop(t, ()) for t in tags))
+            for k in keys:
+                self._drop(k)
+            return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._tags.clear()
+
+
+class RespError(Exception):
+    pass
+
+
+class RespClient:
+    """최소 RESP2 클라이언트 (redis 패키지 없이 GET/SET/SADD/SMEMBERS/DEL 정도만 사용)"""
+
+    def __init__(self, url: str, timeout: float = REDIS_TIMEOUT):
+        u = urlparse(url)
+        self.host, self.port = u.hostname or "127.0.0.1", u.port or 6379
+        self.db = int((u.path or "/0").lstrip("/") or 0)
+        self.password = unquote(u.password) if u.password else None
+        self.timeout = timeout
+        self._sock: Optional[socket.socket] = None
+        self._reader = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> None:
+        sock = socket.create_connection((self.host, self.port), timeout=self.timeout)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._sock, self._reader = sock, sock.makefile("rb")
+        if self.password:
+            self._roundtrip([("AUTH", self.password)])
+        if self.db:
+            self._roundtrip([("SELECT", self.db)])
+
+    def close(self) -> None:
+        if self._sock is not None:
+            try:
+                self._sock.close()
+            except OSError:
+                pass
+        self._sock = self._reader = None
+
+    @staticmethod
+    def _encode(args) -> bytes:
+        out = [b"*%d\r\n" % len(args)]
+        for a in args:
+            b = a if isinstance(a, bytes) else str(a).encode()
+            out.append(b"$%d\r\n%s\r\n" % (len(b), b))
+        return b"".join(out)
+
+    def _read(self):
+        line = self._reader.readline()
+        if not line:
+            raise ConnectionError("connection closed")
+        kind, rest = line[:1], line[1:-2]
+        if kind == b"+":
+            return rest.decode()
+        if kind == b"-":
+            return RespError(rest.decode())     # 파이프라인 응답을 끝까지 읽은 뒤 raise
+        if kind == b":":
+            return int(rest)
+        if kind == b"$":
+            n = int(rest)
+            if n < 0:
+                return None
+            data = self._reader.read(n + 2)
+            return data[:-2]
+        if kind == b"*":
+            n = int(rest)
+            return None if n < 0 else [self._read() for _ in range(n)]
+        raise RespError(f"unexpected reply: {line!r}")
+
+    def _roundtrip(self, commands: List[tuple]) -> list:
+        self._sock.sendall(b"".join(self._encode(c) for c in commands))
+        replies = [self._read() for _ in commands]
+        for r in replies:
+            if isinstance(r, RespError):
+                raise r
+        return replies
+
+    def pipeline(self, commands: List[tuple]) -> list:
+        """명령 여러 개를 한 번에 보내고 응답을 순서대로 받음 (연결 끊겼으면 1번 재연결)"""
+        with self._lock:
+            for attempt in (0, 1):
+                try:
+                    if self._sock is None:
+                        self._connect()
+                    return self._roundtrip(commands)
+                except (OSError, ConnectionError):
+                    self.close()
+                    if attempt:
+                        raise
+
+    def execute(self, *args):
+        return self.pipeline([args])[0]
+
+
+class RedisBackend:
+    """RESP 서버(Redis 또는 호환 서버) 공유 캐시. 장애 시 캐시 없이 동작 (fail-open)"""
+    blocking = True
+
+    def __init__(self, url: str = RESPONSE_CACHE_URL, prefix: str = RESPONSE_CACHE_PREFIX):
+        self.client = RespClient(url)
+        self.prefix = prefix
+        self._down_until = 0.0
+
+    def _tag_key(self, tag: str) -> str:
+        return f"{self.prefix}tag:{tag}"
+
+    def _safe(self, fn, default=None):
+        if _time.monotonic() < self._down_until:
+            return default
+        try:
+            return fn()
+        except (OSError, ConnectionError, RespError) as e:
+            self._down_until = _time.monotonic() + REDIS_RETRY_SECONDS
+            print(f"[response_cache] redis error: {e.__class__.__name__}: {e}")
+            return default
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self._safe(lambda: self.client.execute("GET", self.prefix + key))
+
+    def set(self, key: str, value: bytes, ttl: int, tags: Sequence[str]) -> None:
+        cmds = [("SET", self.prefix + key, value, "PX", int(ttl * 1000))]
+        for t in tags:
+            cmds.append(("SADD", self._tag_key(t), self.prefix + key))
+            cmds.append(("EXPIRE", self._tag_key(t), TAG_TTL_SECONDS))
+        self._safe(lambda: self.client.pipeline(cmds))
+
+    def invalidate(self, tags: Iterable[str]) -> int:
+        tags = list(tags)
+        if not tags:
+            return 0
+
+        def run():
+            members = self.client.pipeline([("SMEMBERS", self._tag_key(t)) for t in tags])
+            keys = set(chain.from_iterable(m or [] for m in members))
+            self.client.execute("DEL", *keys, *(self._tag_key(t) for t in tags))
+            return len(keys)
+        return self._safe(run, 0)
+
+    def clear(self) -> None:
+        self._safe(lambda: self.client.execute("FLUSHDB"))
+
+
+# ---------- 캐시 본체 ----------
+class ResponseCache:
+    def __init__(self, backend):
+        self.backend = backend
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._epoch = 0                               # 무효화 횟수 (계산 중 무효화되면 저장 안 함)
+        self.stats = {"hit": 0, "miss": 0, "coalesced": 0, "invalidated": 0}
+
+    async def _call(self, fn, *args):
+        if self.backend.blocking:
+            return await run_in_threadpool(fn, *args)
+        return fn(*args)
+
+    def invalidate(self, tags: Iterable[str]) -> int:
+        self._epoch += 1
+        n = self.backend.invalidate(tags)
+        self.stats["invalidated"] += n
+        return n
+
+    async def serve(self, key: str, policy: CachePolicy, compute: Callable) -> Response:
+        raw = await self._call(self.backend.get, key)
+        if raw is not None:
+            self.stats["hit"] += 1
+            return self._response(raw, "HIT")
+
+        fut = self._inflight.get(key)
+        if fut is not None:
+            self.stats["coalesced"] += 1
+            raw = await asyncio.shield(fut)
+            if raw is not None:
+                return self._response(raw, "COALESCED")
+            return await compute()          # 첫 요청이 캐시 불가 응답(404 등)이었으면 각자 실행
+
+        self.stats["miss"] += 1
+        fut = asyncio.get_running_loop().create_future()
+        self._inflight[key] = fut
+        epoch = self._epoch
+        raw = None
+        try:
+            response = await compute()
+            if response.status_code == 200 and not response.background and getattr(response, "body", None) is not None:
+                raw = _pack(response.media_type, bytes(response.body))
+                if epoch == self._epoch:
+                    await self._call(self.backend.set, key, raw, policy.ttl, policy.tags)
+                response.headers["X-Cache"] = "MISS"
+            return response
+        finally:
+            self._inflight.pop(key, None)
+            fut.set_result(raw)
+
+    @staticmethod
+    def _response(raw: bytes, state: str) -> Response:
+        media_type, body = _unpack(raw)
+        return Response(content=body, media_type=media_type or None, headers={"X-Cache": state})
+
+
+def _make_backend():
+    if RESPONSE_CACHE_BACKEND == "off":
+        return None
+    if RESPONSE_CACHE_BACKEND == "redis":
+        return RedisBackend()
+    return MemoryBackend()
+
+
+_cache: Optional[ResponseCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    global _cache
+    if _cache is None and RESPONSE_CACHE_BACKEND != "off":
+        with _cache_lock:
+            if _cache is None:
+                _cache = ResponseCache(_make_backend())
+    return _cache
+
+
+def set_response_cache_backend(backend) -> Optional[ResponseCache]:
+    """백엔드 교체 (벤치/로컬 테스트용, None 이면 캐시 끔)"""
+    global _cache
+    with _cache_lock:
+        _cache = ResponseCache(backend) if backend is not None else None
+    return _cache
+
+
+def invalidate_tags(tags: Iterable[str]) -> int:
+    cache = _cache
+    tags = [t for t in tags if t in _known_tags]
+    if cache is None or not tags:
+        return 0
+    return cache.invalidate(tags)
+
+
+class CachedRoute(APIRoute):
+    """@cache_response 가 붙은 엔드포인트만 캐시를 거침 (나머지는 기본 동작)"""
+
+    def get_route_handler(self) -> Callable:
+        handler = super().get_route_handler()
+        policy: Optional[CachePolicy] = getattr(self.endpoint, "__response_cache__", None)
+        if policy is None:
+            return handler
+        path_format = self.path_format
+
+        async def cached_handler(request: Request) -> Response:
+            cache = get_response_cache()
+            if cache is None or request.method != "GET":
+                return await handler(request)
+            return await cache.serve(cache_key(path_format, request), policy, lambda: handler(request))
+
+        return cached_handler
+
+
+# ---------- 쓰기 경로 → 태그 무효화 ----------
+_TAGS_INFO_KEY = "response_cache_tags"
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_changed_tables(session, flush_context):
+    changed = session.info.setdefault(_TAGS_INFO_KEY, set())
+    for obj in chain(session.new, session.dirty, session.deleted):
+        table = getattr(obj, "__tablename__", None)
+        if table in _known_tags:
+            changed.add(table)
+
+
+def mark_tables_changed(session: Session, *tables: str) -> None:
+    """Core INSERT/UPDATE(session.execute) 는 flush 를 안 거침 → 커밋 때 무효화할 테이블을 직접 표시"""
+    session.info.setdefault(_TAGS_INFO_KEY, set()).update(t for t in tables if t in _known_tags)
+
+
+# read replica 사용 시: 커밋 직후 무효화 → 다른 요청이 아직 복제 안 된 replica 에서 옛 값을 읽어 다시 캐시할 수 있음
+# → 복제 지연 창(초) 뒤에 같은 태그를 한 번 더 무효화 (0이면 안 함, app/database.py 에서 설정)
+_reinvalidate_delay = 0.0
+
+
+def set_reinvalidate_delay(seconds: float) -> None:
+    global _reinvalidate_delay
+    _reinvalidate_delay = max(0.0, seconds)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_on_commit(session):
+    changed = session.info.pop(_TAGS_INFO_KEY, None)
+    if changed:
+        invalidate_tags(changed)
+        if _reinvalidate_delay:
+            timer = threading.Timer(_reinvalidate_delay, invalidate_tags, args=(set(changed),))
+            timer.daemon = True
+            timer.start()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_on_rollback(session):
+    session.info.pop(_TAGS_INFO_KEY, None)
@@ -0,0 +1,81 @@
+# app/services/trending.py
+# 공연 trending 점수 재계산 (시간 감쇠 인기도)
+# - score = Σ 0.5 ^ (찜 경과 시간 / HALF_LIFE_HOURS)   (최근 WINDOW_DAYS 이내 찜만)
+# - 찜/찜 취소 API는 like_count 를 바로 증감하고 trending_score 엔 +1만 더함 → 이 배치가 감쇠 반영해서 덮어씀
+# - created_at 이 없는 기존 찜(마이그레이션 이전)은 시각을 모르므로 trending 에서 제외 (like_count 에는 포함)
+# 실행: python -m app.scripts.recompute_trending   (또는 작업 큐 kind="recompute_trending")
+import math
+import time as _time
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, Optional, Tuple
+
+from sqlalchemy import bindparam, update
+from sqlalchemy.orm import Session
+
+from app.models.performance import Performance
+from app.models.user_favorite_performance import UserFavoritePerformance
+
+HALF_LIFE_HOURS = 72.0        # 3일 지난 찜은 점수 절반
+WINDOW_DAYS = 30              # 이보다 오래된 찜은 0.001 미만 → 계산 생략
+WRITE_CHUNK = 1000
+
+
+def decayed_scores(
+    likes: Iterable[Tuple[int, datetime]],
+    now: datetime,
+    *,
+    half_life_hours: float = HALF_LIFE_HOURS,
+) -> Dict[int, float]:
+    """(performance_id, 찜 시각 UTC) → performance_id 별 감쇠 점수 합 (DB 없음)"""
+    decay = math.log(2) / (half_life_hours * 3600)
+    scores: Dict[int, float] = defaultdict(float)
+    for pid, liked_at in likes:
+        age = max((now - liked_at).total_seconds(), 0.0)
+        scores[pid] += math.exp(-decay * age)
+    return dict(scores)
+
+
+def recompute_trending(
+    db: Session,
+    *,
+    half_life_hours: float = HALF_LIFE_HOURS,
+    window_days: int = WINDOW_DAYS,
+    now: Optional[datetime] = None,
+) -> dict:
+    """찜 시각 읽기 → 감쇠 점수 계산 → performance.trending_score 갱신 (한 트랜잭션)"""
+    t0 = _time.perf_counter()
+    now = now or datetime.utcnow()
+    likes = (
+        db.query(UserFavoritePerformance.performance_id, UserFavoritePerformance.created_at)
+        .filter(UserFavoritePerformance.created_at >= now - timedelta(days=window_days))
+        .yield_per(WRITE_CHUNK)
+    )
+    scores = decayed_scores(likes, now, half_life_hours=half_life_hours)
+
+    # 점수가 남아 있는데 이번 계산에 없는 공연 → 0 (윈도우 밖으로 밀려남 / 찜 취소)
+    stale = [
+        pid for (pid,) in db.query(Performance.id).filter(Performance.trending_score != 0).all()
+        if pid not in scores
+    ]
+    rows = [{"pid": pid, "score": round(s, 6)} for pid, s in scores.items()]
+    rows += [{"pid": pid, "score": 0.0} for pid in stale]
+
+    stmt = (
+        update(Performance)
+        .where(Performance.id == bindparam("pid"))
+        .values(trending_score=bindparam("score"), updated_at=Performance.updated_at)
+        .execution_options(synchronize_session=False)
+    )
+    conn = db.connection()
+    for i in range(0, len(rows), WRITE_CHUNK):
+        conn.execute(stmt, rows[i:i + WRITE_CHUNK])
+    db.commit()
+
+    stats = {
+        "scored": len(scores),
+        "reset": len(stale),
+        "ms": round((_time.perf_counter() - t0) * 1000),
+    }
+    print(f"[trending] {stats}")
+    return stats
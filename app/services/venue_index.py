@@ -0,0 +1,145 @@
+# app/services/venue_index.py
+# 공연장 좌표 인메모리 공간 인덱스 (균일 격자 + NumPy haversine)
+# - 지도 열 때마다 호출되는 /nearby/venue 용: DB 풀스캔/N+1 없이 반경·kNN 검색
+# - 같은 프로세스의 Venue INSERT/UPDATE/DELETE 시 dirty 처리, 다른 인스턴스 변경은 TTL로 반영
+import threading
+import time as _time
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.models.venue import Venue
+
+EARTH_RADIUS_KM = 6371.0088
+GRID_CELL_DEG = 0.05          # 격자 한 칸 (위도 기준 약 5.5km)
+INDEX_TTL_SECONDS = 600       # 다른 인스턴스에서 바뀐 공연장 반영 주기
+KNN_MAX_RADIUS_KM = 500.0     # kNN 확장 탐색 상한
+
+
+def haversine_km(lat: float, lng: float, lats: np.ndarray, lngs: np.ndarray) -> np.ndarray:
+    """(lat, lng) → 배열 좌표들까지의 거리(km), 벡터 연산"""
+    lat1, lng1 = np.radians(lat), np.radians(lng)
+    lat2, lng2 = np.radians(lats), np.radians(lngs)
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lng2 - lng1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+
+class VenueSpatialIndex:
+    """좌표 배열 + 격자(cell → 배열 인덱스) 구성. 생성 후에는 읽기 전용"""
+
+    def __init__(self, rows: List[dict], cell_deg: float = GRID_CELL_DEG):
+        self.cell_deg = cell_deg
+        self.rows = rows
+        self.ids = np.array([r["venue_id"] for r in rows], dtype=np.int64)
+        self.lats = np.array([r["latitude"] for r in rows], dtype=np.float64)
+        self.lngs = np.array([r["longitude"] for r in rows], dtype=np.float64)
+
+        cells: Dict[Tuple[int, int], List[int]] = defaultdict(list)
+        for i, (la, ln) in enumerate(zip(self.lats, self.lngs)):
+            cells[self._cell(la, ln)].append(i)
+        self.cells = {k: np.array(v, dtype=np.int64) for k, v in cells.items()}
+
+    def __len__(self):
+        return len(self.rows)
+
+    def _cell(self, lat: float, lng: float) -> Tuple[int, int]:
+        return int(np.floor(lat / self.cell_deg)), int(np.floor(lng / self.cell_deg))
+
+    def _candidates(self, lat: float, lng: float, radius_km: float) -> np.ndarray:
+        """반경을 덮는 격자 칸들의 후보 인덱스"""
+        dlat = np.degrees(radius_km / EARTH_RADIUS_KM)
+        coslat = max(np.cos(np.radians(min(abs(lat) + dlat, 89.9))), 1e-6)
+        dlng = min(dlat / coslat, 180.0)
+        (i0, j0), (i1, j1) = self._cell(lat - dlat, lng - dlng), self._cell(lat + dlat, lng + dlng)
+
+        # 칸 수가 전체 칸보다 많으면 그냥 전부
+        if (i1 - i0 + 1) * (j1 - j0 + 1) >= len(self.cells):
+            return np.arange(len(self.rows), dtype=np.int64)
+        parts = [
+            self.cells[(i, j)]
+            for i in range(i0, i1 + 1)
+            for j in range(j0, j1 + 1)
+            if (i, j) in self.cells
+        ]
+        return np.concatenate(parts) if parts else np.empty(0, dtype=np.int64)
+
+    def within(self, lat: float, lng: float, radius_km: float,
+               allowed_ids: Optional[np.ndarray] = None) -> List[Tuple[int, float]]:
+        """반경 내 (배열 인덱스, 거리km) 목록, 가까운 순. allowed_ids 를 주면 그 venue_id 만"""
+        idx = self._candidates(lat, lng, radius_km)
+        if allowed_ids is not None and idx.size:
+            idx = idx[np.isin(self.ids[idx], allowed_ids)]
+        if idx.size == 0:
+            return []
+        dist = haversine_km(lat, lng, self.lats[idx], self.lngs[idx])
+        mask = dist <= radius_km
+        idx, dist = idx[mask], dist[mask]
+        order = np.argsort(dist, kind="stable")
+        return list(zip(idx[order].tolist(), dist[order].tolist()))
+
+    def nearest(self, lat: float, lng: float, k: int, max_radius_km: float = KNN_MAX_RADIUS_KM,
+                allowed_ids: Optional[np.ndarray] = None) -> List[Tuple[int, float]]:
+        """
+        k개 최근접 (max_radius_km 이내). 반경 r 안에 k개 이상 있으면 그 중 상위 k개가 정확한 kNN
+        → 격자 한 칸 반경부터 r을 2배씩 넓혀 탐색 (가까운 곳에 k개가 있으면 먼 칸은 거리 계산 안 함)
+        """
+        if k <= 0 or not self.rows:
+            return []
+        r = min(self.cell_deg * 111.0, max_radius_km)
+        while True:
+            hits = self.within(lat, lng, r, allowed_ids)
+            if len(hits) >= k or r >= max_radius_km:
+                return hits[:k]
+            r = min(r * 2, max_radius_km)
+
+
+_lock = threading.Lock()
+_index: Optional[VenueSpatialIndex] = None
+_built_at = 0.0
+_dirty = True
+
+
+def build_venue_index(db: Session) -> VenueSpatialIndex:
+    rows = [
+        {
+            "venue_id": v.id,
+            "name": v.name,
+            "address": v.address,
+            "image_url": v.image_url,
+            "latitude": float(v.latitude),
+            "longitude": float(v.longitude),
+        }
+        for v in db.query(
+            Venue.id, Venue.name, Venue.address, Venue.image_url, Venue.latitude, Venue.longitude
+        ).filter(Venue.latitude != None, Venue.longitude != None).all()
+    ]
+    return VenueSpatialIndex(rows)
+
+
+def get_venue_index(db: Session) -> VenueSpatialIndex:
+    """프로세스 공유 인덱스 (dirty 또는 TTL 만료 시 재구성)"""
+    global _index, _built_at, _dirty
+    if _index is not None and not _dirty and _time.monotonic() - _built_at < INDEX_TTL_SECONDS:
+        return _index
+    with _lock:
+        if _index is None or _dirty or _time.monotonic() - _built_at >= INDEX_TTL_SECONDS:
+            _dirty = False  # 빌드 중 들어온 변경은 다시 dirty로 남도록 먼저 내림
+            _index = build_venue_index(db)
+            _built_at = _time.monotonic()
+            print(f"[venue_index] rebuilt ({len(_index)} venues)")
+    return _index
+
+
+def invalidate_venue_index() -> None:
+    global _dirty
+    _dirty = True
+
+
+@event.listens_for(Venue, "after_insert")
+@event.listens_for(Venue, "after_update")
+@event.listens_for(Venue, "after_delete")
+def _on_venue_change(mapper, connection, target):
+    invalidate_venue_index()
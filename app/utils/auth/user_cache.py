@@ -0,0 +1,132 @@
+# app/utils/auth/user_cache.py
+# get_current_user 의 user 조회 캐시
+# - 키: (sub, iat)  → 같은 토큰으로 들어오는 요청은 TTL 동안 SELECT user 생략
+# - 값: User 컬럼 값 snapshot (ORM 객체를 요청 간 공유하지 않음). 요청마다 snapshot → detached User → 요청 세션에 붙임
+#   → 요청 안에서 lazy load / 수정 / commit 모두 평소처럼 동작
+# - 무효화: User UPDATE/DELETE (프로필, 설정, 로그아웃 refresh_token 삭제, 탈퇴) 시 해당 user 항목 전부 삭제
+#   다른 인스턴스의 변경은 TTL(기본 30초) 안에 반영
+# - iat 없는 예전 토큰은 캐시하지 않음 (매번 DB 조회)
+import os
+import threading
+import time as _time
+from collections import OrderedDict
+from typing import Dict, Optional, Set, Tuple
+
+from sqlalchemy import event, inspect as sa_inspect
+from sqlalchemy.orm import Session, make_transient_to_detached, object_session
+
+from app.models.user import User
+
+USER_CACHE_TTL = float(os.getenv("USER_CACHE_TTL", "30"))
+USER_CACHE_MAX_ENTRIES = int(os.getenv("USER_CACHE_MAX_ENTRIES", "10000"))
+
+CacheKey = Tuple[int, int]    # (user_id, iat)
+
+
+class UserCache:
+    def __init__(self, ttl: float = USER_CACHE_TTL, max_entries: int = USER_CACHE_MAX_ENTRIES):
+        self.ttl, self.max_entries = ttl, max_entries
+        self._data: "OrderedDict[CacheKey, Tuple[float, dict]]" = OrderedDict()
+        self._by_user: Dict[int, Set[CacheKey]] = {}
+        self._lock = threading.Lock()
+        self.stats = {"hit": 0, "miss": 0, "invalidated": 0}
+
+    def __len__(self):
+        return len(self._data)
+
+    def _drop(self, key: CacheKey) -> None:
+        if self._data.pop(key, None) is not None:
+            keys = self._by_user.get(key[0])
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._by_user[key[0]]
+
+    def get(self, key: CacheKey) -> Optional[dict]:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None or item[0] <= _time.monotonic():
+                if item is not None:
+                    self._drop(key)
+                self.stats["miss"] += 1
+                return None
+            self._data.move_to_end(key)
+            self.stats["hit"] += 1
+            return item[1]
+
+    def put(self, key: CacheKey, snapshot: dict) -> None:
+        with self._lock:
+            self._drop(key)
+            self._data[key] = (_time.monotonic() + self.ttl, snapshot)
+            self._by_user.setdefault(key[0], set()).add(key)
+            while len(self._data) > self.max_entries:
+                self._drop(next(iter(self._data)))
+
+    def invalidate_user(self, user_id: int) -> None:
+        with self._lock:
+            for key in list(self._by_user.get(user_id, ())):
+                self._drop(key)
+                self.stats["invalidated"] += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._by_user.clear()
+
+
+user_cache = UserCache()
+
+_COLUMN_KEYS = [attr.key for attr in sa_inspect(User).column_attrs]
+
+
+def snapshot_user(user: User) -> dict:
+    return {k: getattr(user, k) for k in _COLUMN_KEYS}
+
+
+def attach_user(db: Session, snapshot: dict) -> User:
+    """snapshot → 요청 세션에 붙은 persistent User (SELECT 없음)"""
+    user = User(**snapshot)
+    make_transient_to_detached(user)
+    db.add(user)
+    return user
+
+
+def load_user(db: Session, user_id: int, iat: Optional[int]) -> Optional[User]:
+    if iat is not None:
+        snapshot = user_cache.get((user_id, iat))
+        if snapshot is not None:
+            existing = db.identity_map.get(db.identity_key(User, user_id))   # 같은 요청에서 이미 읽었으면 그대로
+            return existing if existing is not None else attach_user(db, snapshot)
+
+    user = db.query(User).filter(User.id == user_id).first()
+    if user is not None and iat is not None:
+        user_cache.put((user_id, iat), snapshot_user(user))
+    return user
+
+
+def invalidate_user_cache(user_id: int) -> None:
+    user_cache.invalidate_user(user_id)
+
+
+_INFO_KEY = "user_cache_invalidate"
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _on_user_change(mapper, connection, target):
+    invalidate_user_cache(target.id)
+    # 커밋 전에 다른 요청이 옛 값을 다시 캐시할 수 있으므로 커밋 후 한 번 더
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault(_INFO_KEY, set()).add(target.id)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session):
+    for user_id in session.info.pop(_INFO_KEY, ()):
+        invalidate_user_cache(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_after_rollback(session):
+    session.info.pop(_INFO_KEY, None)
@@ -0,0 +1,224 @@
+# app/utils/db_pool.py
+# DB 커넥션 풀 설정/통계/워밍업
+# - 풀 크기, overflow, timeout, recycle, LIFO, pre-ping 방식은 Settings(DB_POOL_*) 로 조정
+# - pre-ping 방식
+#     always: checkout 마다 ping (SQLAlchemy pool_pre_ping) → 요청마다 왕복 1회 추가
+#     idle  : DB_POOL_PRE_PING_IDLE 초 이상 놀던 커넥션만 ping (기본, Cloud SQL idle 끊김 대비)
+#     off   : ping 안 함 (끊긴 커넥션은 recycle 에 맡김)
+# - 통계: checkout 대기 시간(풀이 꽉 차서 기다린 시간), timeout 횟수, 현재 checked-out/overflow → /__debug/pool
+# - 워밍업: 앱 시작 시 커넥션 N개 미리 열고 자주 쓰는 조회를 한 번씩 실행 (컴파일 캐시 채움)
+import threading
+import time as _time
+from collections import deque
+from typing import Callable, List
+
+from sqlalchemy import event, exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+PRE_PING_MODES = ("always", "idle", "off")
+WAIT_SAMPLES = 1000    # p95 계산용 최근 대기 시간 개수
+
+
+class PoolStats:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._waits = deque(maxlen=WAIT_SAMPLES)
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_total_ms = 0.0
+        self.wait_max_ms = 0.0
+        self.connects = 0
+        self.pings = 0
+        self.invalidated = 0
+
+    def record_wait(self, ms: float) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.wait_total_ms += ms
+            self.wait_max_ms = max(self.wait_max_ms, ms)
+            self._waits.append(ms)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            waits = sorted(self._waits)
+            p95 = waits[min(len(waits) - 1, int(len(waits) * 0.95))] if waits else 0.0
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "wait_avg_ms": round(self.wait_total_ms / self.checkouts, 3) if self.checkouts else 0.0,
+                "wait_p95_ms": round(p95, 3),
+                "wait_max_ms": round(self.wait_max_ms, 3),
+                "connects": self.connects,
+                "pings": self.pings,
+                "invalidated": self.invalidated,
+            }
+
+
+class _TimedPoolMixin:
+    """풀에서 커넥션을 꺼낼 때 걸린 시간 측정 (빈 커넥션 대기 + 새 커넥션 생성)"""
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.stats = PoolStats()
+
+    def _do_get(self):
+        t0 = _time.perf_counter()
+        try:
+            conn = super()._do_get()
+        except exc.TimeoutError:
+            self.stats.timeouts += 1
+            raise
+        self.stats.record_wait((_time.perf_counter() - t0) * 1000)
+        return conn
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.stats = self.stats
+        return pool
+
+
+class TimedQueuePool(_TimedPoolMixin, QueuePool):
+    pass
+
+
+class TimedAsyncQueuePool(_TimedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def pool_kwargs(settings, url: str, *, is_async: bool = False) -> dict:
+    """create_engine / create_async_engine 에 넘길 풀 옵션 (SQLite 는 드라이버 기본 풀 사용)"""
+    mode = settings.DB_POOL_PRE_PING
+    if mode not in PRE_PING_MODES:
+        raise ValueError(f"DB_POOL_PRE_PING must be one of {PRE_PING_MODES}: {mode!r}")
+    if url.startswith("sqlite"):
+        return {"pool_pre_ping": mode == "always"}
+    return {
+        "poolclass": TimedAsyncQueuePool if is_async else TimedQueuePool,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_use_lifo": settings.DB_POOL_LIFO,
+        "pool_pre_ping": mode == "always",
+    }
+
+
+def instrument_pool(sync_engine, settings) -> PoolStats:
+    """풀 이벤트 연결: 통계 + idle pre-ping. 비동기 엔진은 async_engine.sync_engine 을 넘김"""
+    pool = sync_engine.pool
+    stats = getattr(pool, "stats", None) or PoolStats()
+    pool.stats = stats
+    idle_limit = settings.DB_POOL_PRE_PING_IDLE
+    idle_ping = settings.DB_POOL_PRE_PING == "idle"
+
+    @event.listens_for(sync_engine, "connect")
+    def _on_connect(dbapi_conn, record):
+        stats.connects += 1
+        record.info["checked_in_at"] = _time.monotonic()
+
+    @event.listens_for(sync_engine, "checkin")
+    def _on_checkin(dbapi_conn, record):
+        record.info["checked_in_at"] = _time.monotonic()
+
+    @event.listens_for(sync_engine, "invalidate")
+    def _on_invalidate(dbapi_conn, record, exception):
+        stats.invalidated += 1
+
+    if idle_ping:
+        @event.listens_for(sync_engine, "checkout")
+        def _ping_if_idle(dbapi_conn, record, proxy):
+            idle = _time.monotonic() - record.info.get("checked_in_at", 0)
+            if idle < idle_limit:
+                return
+            stats.pings += 1
+            cursor = dbapi_conn.cursor()
+            try:
+                cursor.execute("SELECT 1")
+            except Exception as e:
+                # DisconnectionError → 풀이 이 커넥션을 버리고 새로 연결해서 다시 시도
+                raise exc.DisconnectionError(f"idle connection ping failed: {e}") from e
+            finally:
+                cursor.close()
+
+    return stats
+
+
+def pool_status(engine) -> dict:
+    """현재 풀 상태 + 누적 통계 (비동기 엔진은 sync_engine 기준)"""
+    engine = getattr(engine, "sync_engine", engine)
+    pool = engine.pool
+    info = {"pool": type(pool).__name__}
+    for name in ("size", "checkedin", "checkedout", "overflow"):
+        fn = getattr(pool, name, None)
+        if callable(fn):
+            info[name] = fn()
+    timeout = getattr(pool, "timeout", None)
+    if callable(timeout):
+        info["timeout"] = timeout()
+    stats = getattr(pool, "stats", None)
+    if stats is not None:
+        info.update(stats.snapshot())
+    return info
+
+
+# -------------------------------
+# 워밍업
+# -------------------------------
+def _warm_queries() -> List[Callable]:
+    """앱 열 때 제일 먼저 불리는 조회들 (홈/공연 목록). 결과는 버리고 컴파일 캐시만 채움"""
+    import app.crud.performance as performance_crud
+
+    return [
+        performance_crud.get_today_performances,
+        lambda db: performance_crud.get_recent_performances(db, 6),
+        lambda db: performance_crud.get_performances_only_supposed(db, None, "date", 1, 10, with_count=False),
+        lambda db: performance_crud.get_trending_performances(db, None, 1, 10, with_count=False),
+    ]
+
+
+def run_warm_queries(db) -> int:
+    ok = 0
+    for fn in _warm_queries():
+        try:
+            fn(db)
+            ok += 1
+        except Exception as e:
+            print(f"[db_pool] warm query failed: {e.__class__.__name__}: {e}")
+            db.rollback()
+    return ok
+
+
+def warm_up_sync(engine, session_factory, connections: int) -> dict:
+    """커넥션 N개를 동시에 열었다가 반납 (서로 다른 커넥션이 풀에 남도록) + 조회 워밍업"""
+    t0 = _time.perf_counter()
+    opened: List = []
+    try:
+        for _ in range(connections):
+            opened.append(engine.connect())
+    except Exception as e:
+        print(f"[db_pool] warm-up connect failed after {len(opened)}: {e.__class__.__name__}: {e}")
+    finally:
+        for conn in opened:
+            conn.close()
+    queries = 0
+    if opened:      # DB 연결이 안 되면 쿼리 워밍업은 생략 (기동은 계속)
+        with session_factory() as db:
+            queries = run_warm_queries(db)
+    return {"connections": len(opened), "queries": queries, "ms": round((_time.perf_counter() - t0) * 1000)}
+
+
+async def warm_up_async(async_engine, async_session_factory, connections: int) -> dict:
+    t0 = _time.perf_counter()
+    opened: List = []
+    try:
+        for _ in range(connections):
+            opened.append(await async_engine.connect())
+    except Exception as e:
+        print(f"[db_pool] async warm-up connect failed after {len(opened)}: {e.__class__.__name__}: {e}")
+    finally:
+        for conn in opened:
+            await conn.close()
+    queries = 0
+    if opened:
+        async with async_session_factory() as db:
+            queries = await db.run_sync(run_warm_queries)
+    return {"connections": len(opened), "queries": queries, "ms": round((_time.perf_counter() - t0) * 1000)}
@@ -0,0 +1,231 @@
+# app/utils/db_routing.py
+# 읽기 전용 요청 → read replica 라우팅
+# - Settings.DB_REPLICA_URLS (콤마 구분) 가 비어 있으면 아무것도 안 함 (전부 primary)
+# - 조회용 세션(RoutingSession)은 SELECT 를 replica 로, flush/INSERT/UPDATE/DELETE 는 primary 로 보냄
+#   한 번 쓰기가 일어난 세션은 그 뒤 조회도 primary (같은 트랜잭션 안에서 방금 쓴 값이 보이도록)
+# - 헬스 체크: 백그라운드 스레드가 DB_REPLICA_HEALTH_INTERVAL 마다 SELECT 1 (+ MySQL 이면 복제 지연)
+#   쿼리 중 연결 오류가 나면 바로 down 처리 → 다음 체크에서 살아나면 복귀. 살아 있는 replica 가 없으면 primary
+# - read-your-writes: 요청 중 커밋된 쓰기가 있으면 그 사용자(및 그 브라우저)를 DB_REPLICA_PIN_SECONDS 동안 primary 에 고정
+#   (사용자 id 는 이 인스턴스 메모리, 브라우저는 쿠키 → 다른 인스턴스로 가도 고정 유지)
+import contextvars
+import itertools
+import threading
+import time as _time
+from typing import Dict, List, Optional
+
+from sqlalchemy import create_engine, event, exc, text
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.dml import Delete, Insert, Update
+
+from app.utils.db_pool import instrument_pool, pool_kwargs
+
+PIN_COOKIE = "db_primary_until"
+REPLICA_INFO_KEY = "replica_bind"
+
+
+def to_async_url(url: str) -> str:
+    for sync, aio in (("mysql+pymysql://", "mysql+aiomysql://"), ("sqlite://", "sqlite+aiosqlite://")):
+        if url.startswith(sync):
+            return url.replace(sync, aio, 1)
+    return url
+
+
+class Replica:
+    def __init__(self, name: str, url: str, settings):
+        self.name = name
+        self.engine = create_engine(url, **pool_kwargs(settings, url))
+        async_url = to_async_url(url)
+        self.async_engine = create_async_engine(async_url, **pool_kwargs(settings, async_url, is_async=True))
+        instrument_pool(self.engine, settings)
+        instrument_pool(self.async_engine.sync_engine, settings)
+        self.healthy = True
+        self.lag: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self.checked_at: Optional[float] = None
+        self.picks = 0
+        for eng in (self.engine, self.async_engine.sync_engine):
+            event.listen(eng, "handle_error", self._on_error)
+
+    def _on_error(self, context):
+        # 연결 끊김/접속 실패 → 즉시 제외 (SQL 오류 같은 건 replica 문제 아님)
+        if context.is_disconnect or isinstance(context.sqlalchemy_exception, exc.OperationalError):
+            self.mark_down(f"{context.original_exception.__class__.__name__}: {context.original_exception}")
+
+    def mark_down(self, reason: str) -> None:
+        if self.healthy:
+            print(f"[db_routing] replica {self.name} down: {reason}")
+        self.healthy, self.last_error = False, reason
+
+    def check(self, max_lag: float) -> bool:
+        try:
+            with self.engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+                self.lag = _replica_lag(conn)
+            if self.lag is not None and self.lag > max_lag:
+                raise RuntimeError(f"replication lag {self.lag:.0f}s > {max_lag:.0f}s")
+        except Exception as e:
+            self.mark_down(f"{e.__class__.__name__}: {e}")
+        else:
+            if not self.healthy:
+                print(f"[db_routing] replica {self.name} back up")
+            self.healthy, self.last_error = True, None
+        self.checked_at = _time.time()
+        return self.healthy
+
+    def status(self) -> dict:
+        return {
+            "name": self.name, "healthy": self.healthy, "lag": self.lag, "picks": self.picks,
+            "last_error": self.last_error, "checked_at": self.checked_at,
+        }
+
+
+def _replica_lag(conn) -> Optional[float]:
+    """MySQL replica 의 복제 지연(초). 권한이 없거나 MySQL 이 아니면 None"""
+    if conn.dialect.name != "mysql":
+        return None
+    for stmt, col in (("SHOW REPLICA STATUS", "Seconds_Behind_Source"), ("SHOW SLAVE STATUS", "Seconds_Behind_Master")):
+        try:
+            row = conn.execute(text(stmt)).mappings().first()
+        except exc.DBAPIError:
+            continue
+        if row is None:
+            return None
+        value = row.get(col)
+        return float(value) if value is not None else None
+    return None
+
+
+class ReplicaSet:
+    def __init__(self, urls: List[str], settings):
+        self.replicas = [Replica(f"replica{i}", url, settings) for i, url in enumerate(urls)]
+        self.pin_seconds = settings.DB_REPLICA_PIN_SECONDS
+        self.health_interval = settings.DB_REPLICA_HEALTH_INTERVAL
+        self.max_lag = settings.DB_REPLICA_MAX_LAG
+        self._rr = itertools.count()
+        self._pins: Dict[int, float] = {}
+        self._lock = threading.Lock()
+        self._checker: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self.stats = {"replica": 0, "primary_pinned": 0, "primary_fallback": 0}
+
+    # ---------- 헬스 체크 ----------
+    def _ensure_checker(self) -> None:
+        if self._checker is None:
+            with self._lock:
+                if self._checker is None:
+                    self._checker = threading.Thread(target=self._check_loop, name="replica-health", daemon=True)
+                    self._checker.start()
+
+    def _check_loop(self) -> None:
+        while not self._stop.wait(self.health_interval):
+            self.check_all()
+
+    def check_all(self) -> None:
+        for r in self.replicas:
+            r.check(self.max_lag)
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    # ---------- 선택 ----------
+    def pick(self) -> Optional[Replica]:
+        """살아 있는 replica 라운드로빈. 없으면 None(→ primary)"""
+        self._ensure_checker()
+        n = len(self.replicas)
+        start = next(self._rr)
+        for i in range(n):
+            r = self.replicas[(start + i) % n]
+            if r.healthy:
+                r.picks += 1
+                self.stats["replica"] += 1
+                return r
+        self.stats["primary_fallback"] += 1
+        return None
+
+    # ---------- read-your-writes 고정 ----------
+    def pin_user(self, user_id: int) -> None:
+        with self._lock:
+            self._pins[user_id] = _time.monotonic() + self.pin_seconds
+            if len(self._pins) > 10000:
+                now = _time.monotonic()
+                self._pins = {k: v for k, v in self._pins.items() if v > now}
+
+    def is_user_pinned(self, user_id: Optional[int]) -> bool:
+        if user_id is None:
+            return False
+        until = self._pins.get(user_id)
+        return until is not None and until > _time.monotonic()
+
+    def route(self, pin_cookie: Optional[str], user_id: Optional[int]) -> Optional[Replica]:
+        """조회 요청 → 쓸 replica (None 이면 primary)"""
+        if _cookie_pinned(pin_cookie) or self.is_user_pinned(user_id):
+            self.stats["primary_pinned"] += 1
+            return None
+        return self.pick()
+
+    def status(self) -> dict:
+        return {"pin_seconds": self.pin_seconds, **self.stats, "replicas": [r.status() for r in self.replicas]}
+
+
+def _cookie_pinned(value: Optional[str]) -> bool:
+    try:
+        return value is not None and float(value) > _time.time()
+    except ValueError:
+        return False
+
+
+def build_replica_set(settings) -> Optional[ReplicaSet]:
+    urls = [u.strip() for u in (settings.DB_REPLICA_URLS or "").split(",") if u.strip()]
+    return ReplicaSet(urls, settings) if urls else None
+
+
+class RoutingSession(Session):
+    """info[REPLICA_INFO_KEY] 에 replica 엔진이 있으면 조회는 replica, 쓰기는 bind(primary)"""
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        replica = self.info.get(REPLICA_INFO_KEY)
+        if replica is not None:
+            if not self._flushing and not isinstance(clause, (Insert, Update, Delete)):
+                return replica
+            self.info[REPLICA_INFO_KEY] = None     # 쓰기 이후로는 이 세션 전부 primary
+        return super().get_bind(mapper=mapper, clause=clause, **kw)
+
+
+# ---------- 요청 중 커밋된 쓰기 추적 (read-your-writes 고정용) ----------
+# 미들웨어가 요청마다 dict 를 contextvar 에 넣고, 세션 커밋 훅이 거기에 표시
+# (동기 엔드포인트는 스레드풀에서 돌지만 같은 dict 객체를 공유하므로 표시가 보임)
+_write_marker: contextvars.ContextVar[Optional[dict]] = contextvars.ContextVar("db_write_marker", default=None)
+_WROTE_INFO_KEY = "db_routing_wrote"
+
+
+def start_write_tracking() -> dict:
+    marker = {"wrote": False}
+    _write_marker.set(marker)
+    return marker
+
+
+@event.listens_for(Session, "after_flush")
+def _mark_flush(session, flush_context):
+    session.info[_WROTE_INFO_KEY] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _mark_bulk_write(orm_execute_state):
+    # query.update()/delete(), session.execute(insert(...)/text(...)) 는 flush 를 안 거침
+    # (SELECT 가 아니면 쓰기로 봄. 표시는 커밋까지 가야 효력)
+    if not orm_execute_state.is_select:
+        orm_execute_state.session.info[_WROTE_INFO_KEY] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _mark_commit(session):
+    if session.info.pop(_WROTE_INFO_KEY, False):
+        marker = _write_marker.get()
+        if marker is not None:
+            marker["wrote"] = True
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_flush_mark(session):
+    session.info.pop(_WROTE_INFO_KEY, None)
@@ -1,13 +1,15 @@
 # app/utils/dependency.py
 from typing import Optional
 
-from fastapi import Depends, HTTPException, Cookie
+from fastapi import Depends, HTTPException, Cookie, Request
 from jose import jwt, JWTError
 from sqlalchemy.orm import Session
 
-from app.database import get_db
+from app.database import AsyncReadSessionLocal, ReadSessionLocal, get_db, replicas
 from app.models.user import User
 from app.config import settings as app_settings
+from app.utils.auth.user_cache import load_user
+from app.utils.db_routing import PIN_COOKIE, REPLICA_INFO_KEY
 
 # ===== JWT 설정 =====
 SECRET_KEY: Optional[str] = getattr(app_settings, "JWT_SECRET_KEY", None) or getattr(
@@ -25,9 +27,9 @@ if not SECRET_KEY:
 DEBUG_AUTH: bool = str(getattr(app_settings, "DEBUG_AUTH", "0")).lower() in {"1", "true", "yes"}
 
 
-def _get_user_from_token(token: str, db: Session) -> Optional[User]:
+def _decode_token(token: str) -> Optional[tuple]:
     """
-    access_token(JWT) → payload.sub → DB user 조회
+    access_token(JWT) 서명/만료 검증 → (user_id, iat)
     sub에는 반드시 'DB user.id'가 들어가야 한다.
     """
     try:
@@ -36,11 +38,22 @@ def _get_user_from_token(token: str, db: Session) -> Optional[User]:
         user_id = int(sub) if sub is not None else None
         if not user_id:
             return None
-    except (JWTError, ValueError):
+        iat = payload.get("iat")
+        return user_id, int(iat) if iat is not None else None
+    except (JWTError, ValueError, TypeError):
         # 서명 불일치/만료/형변환 실패 모두 None
         return None
 
-    return db.query(User).filter(User.id == user_id).first()
+
+def _get_user_from_token(token: str, db: Session) -> Optional[User]:
+    """
+    토큰 검증 → (sub, iat) user 캐시 → 없으면 DB user 조회
+    """
+    claims = _decode_token(token)
+    if claims is None:
+        return None
+    user_id, iat = claims
+    return load_user(db, user_id, iat)
 
 
 # ✅ 로그인 필수: 쿠키 없거나 토큰이 잘못되면 401
@@ -84,3 +97,62 @@ def get_current_user_optional(
     if not user and DEBUG_AUTH:
         print("[get_current_user_optional] token invalid or user not found")
     return user
+
+
+# ✅ 로그인 필수 + user.id 만 필요한 조회용: DB 조회 없이 토큰 검증만
+#    (탈퇴 직후 아직 만료 안 된 토큰은 통과하지만, user_id 로 거르는 조회는 빈 결과가 됨)
+def get_current_user_id(
+    access_token: Optional[str] = Cookie(default=None, alias="access_token"),
+) -> int:
+    if not access_token:
+        if DEBUG_AUTH:
+            print("[get_current_user_id] no access_token cookie")
+        raise HTTPException(status_code=401, detail="Not authenticated")
+
+    claims = _decode_token(access_token)
+    if claims is None:
+        if DEBUG_AUTH:
+            print("[get_current_user_id] token invalid")
+        raise HTTPException(status_code=401, detail="Invalid authentication")
+    return claims[0]
+
+
+# ✅ 로그인 선택 + user.id 만 필요한 조회용: 없거나 잘못된 토큰이면 None (DB 조회 없음)
+def get_current_user_id_optional(
+    access_token: Optional[str] = Cookie(default=None, alias="access_token"),
+) -> Optional[int]:
+    if not access_token:
+        return None
+    claims = _decode_token(access_token)
+    return claims[0] if claims else None
+
+
+# ===== 조회 전용 DB 세션 (read replica 라우팅) =====
+# 조회 전용 엔드포인트(지도 범위 조회 같은 POST 포함)에서만 사용
+# 이 사용자/브라우저가 최근 쓰기로 primary 에 고정돼 있지 않으면 replica 에서 조회
+# replica 가 없거나 전부 down 이면 primary. 세션 안에서 쓰기가 생기면 그 뒤로는 primary
+def _pick_replica(request: Request):
+    if replicas is None:
+        return None
+    token = request.cookies.get("access_token")
+    claims = _decode_token(token) if token else None
+    return replicas.route(request.cookies.get(PIN_COOKIE), claims[0] if claims else None)
+
+
+def get_read_db(request: Request):
+    db = ReadSessionLocal()
+    replica = _pick_replica(request)
+    if replica is not None:
+        db.info[REPLICA_INFO_KEY] = replica.engine
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+async def get_async_read_db(request: Request):
+    async with AsyncReadSessionLocal() as db:
+        replica = _pick_replica(request)
+        if replica is not None:
+            db.sync_session.info[REPLICA_INFO_KEY] = replica.async_engine.sync_engine
+        yield db
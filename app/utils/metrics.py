@@ -0,0 +1,266 @@
+# app/utils/metrics.py
+# Prometheus 텍스트 포맷 메트릭 (GET /metrics)
+# - 라이브러리 없이 counter / gauge / histogram 만 최소 구현 (프로세스 메모리, 인스턴스별)
+# - HTTP: 라우트 템플릿(/performance/{id}) 기준 라벨 → 경로 파라미터로 라벨이 늘어나지 않음
+#         매칭 안 된 요청(404 등)은 route="<unmatched>" 하나로 묶음
+# - DB 풀 / 응답 캐시 / user 캐시 / replica 는 스크레이프 시점에 각 모듈 통계를 읽어서 내보냄(collector)
+# - 푸시 전송 카운터는 app/utils/notify.py 가 증가 (작업 워커 등 다른 프로세스의 전송은 그 프로세스 몫)
+import threading
+import time as _time
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+LabelValues = Tuple[str, ...]
+
+DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _fmt_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    return "{" + ",".join(f'{n}="{_escape(v)}"' for n, v in zip(names, values)) + "}"
+
+
+def _fmt_value(v: float) -> str:
+    if v == float("inf"):
+        return "+Inf"
+    return repr(float(v)) if not float(v).is_integer() else str(int(v))
+
+
+class _Metric:
+    type = ""
+
+    def __init__(self, name: str, help_: str, labelnames: Sequence[str] = ()):
+        self.name, self.help, self.labelnames = name, help_, tuple(labelnames)
+        self._lock = threading.Lock()
+        REGISTRY.register(self)
+
+    def _key(self, labels: dict) -> LabelValues:
+        return tuple(str(labels.get(n, "")) for n in self.labelnames)
+
+    def header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.type}"]
+
+
+class Counter(_Metric):
+    type = "counter"
+
+    def __init__(self, name, help_, labelnames=()):
+        super().__init__(name, help_, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0)
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = list(self._values.items())
+        return self.header() + [f"{self.name}{_fmt_labels(self.labelnames, k)} {_fmt_value(v)}" for k, v in items]
+
+
+class Gauge(Counter):
+    type = "gauge"
+
+    def set(self, value: float, **labels) -> None:
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+    def dec(self, amount: float = 1, **labels) -> None:
+        self.inc(-amount, **labels)
+
+
+class Histogram(_Metric):
+    type = "histogram"
+
+    def __init__(self, name, help_, labelnames=(), buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS):
+        super().__init__(name, help_, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._values: Dict[LabelValues, list] = {}    # key → [bucket counts..., sum, count]
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            row = self._values.get(key)
+            if row is None:
+                row = self._values[key] = [0] * len(self.buckets) + [0.0, 0]
+            for i, b in enumerate(self.buckets):
+                if value <= b:
+                    row[i] += 1
+            row[-2] += value
+            row[-1] += 1
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = [(k, list(v)) for k, v in self._values.items()]
+        lines = self.header()
+        names = self.labelnames + ("le",)
+        for key, row in items:
+            for b, n in zip(self.buckets, row):
+                lines.append(f"{self.name}_bucket{_fmt_labels(names, key + (_fmt_value(b),))} {n}")
+            lines.append(f"{self.name}_bucket{_fmt_labels(names, key + ('+Inf',))} {row[-1]}")
+            lines.append(f"{self.name}_sum{_fmt_labels(self.labelnames, key)} {_fmt_value(row[-2])}")
+            lines.append(f"{self.name}_count{_fmt_labels(self.labelnames, key)} {row[-1]}")
+        return lines
+
+
+# collector: () → [(name, type, help, [(labels dict, value), ...]), ...]
+Collector = Callable[[], Iterable[Tuple[str, str, str, List[Tuple[dict, float]]]]]
+
+
+class Registry:
+    def __init__(self):
+        self._metrics: List[_Metric] = []
+        self._collectors: List[Collector] = []
+
+    def register(self, metric: _Metric) -> None:
+        self._metrics.append(metric)
+
+    def register_collector(self, fn: Collector) -> Collector:
+        self._collectors.append(fn)
+        return fn
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for m in self._metrics:
+            lines.extend(m.render())
+        for fn in self._collectors:
+            try:
+                families = list(fn())
+            except Exception as e:      # 통계 하나 실패해도 나머지는 내보냄
+                print(f"[metrics] collector {fn.__name__} failed: {e.__class__.__name__}: {e}")
+                continue
+            for name, type_, help_, samples in families:
+                lines += [f"# HELP {name} {help_}", f"# TYPE {name} {type_}"]
+                for labels, value in samples:
+                    if value is None:
+                        continue
+                    lines.append(f"{name}{_fmt_labels(list(labels), list(labels.values()))} {_fmt_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+# ---------- HTTP ----------
+HTTP_REQUESTS = Counter("http_requests_total", "HTTP requests", ("method", "route", "status"))
+HTTP_LATENCY = Histogram("http_request_duration_seconds", "HTTP request latency", ("method", "route"))
+HTTP_IN_FLIGHT = Gauge("http_requests_in_flight", "HTTP requests being served")
+HTTP_RESPONSE_SIZE = Histogram("http_response_size_bytes", "HTTP response body size", ("method", "route"), SIZE_BUCKETS)
+
+# ---------- Push (app/utils/notify.py) ----------
+PUSH_MESSAGES = Counter("push_messages_total", "Expo push messages by ticket status", ("status",))
+PUSH_DEVICE_NOT_REGISTERED = Counter("push_device_not_registered_total", "Expo tickets/receipts with DeviceNotRegistered")
+PUSH_HTTP_RETRIES = Counter("push_http_retries_total", "Expo API retries (429/5xx/transport)", ("endpoint",))
+PUSH_RECEIPTS = Counter("push_receipts_total", "Expo push receipts by status", ("status",))
+
+
+def route_template(scope: dict) -> str:
+    route = scope.get("route")
+    return getattr(route, "path", None) or "<unmatched>"
+
+
+class MetricsMiddleware:
+    """순수 ASGI 미들웨어: 상태 코드/응답 크기는 send 메시지에서 직접 읽음 (스트리밍 응답도 합산)"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        status, size = 500, 0
+
+        async def _send(message):
+            nonlocal status, size
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        HTTP_IN_FLIGHT.inc()
+        t0 = _time.perf_counter()
+        try:
+            await self.app(scope, receive, _send)
+        finally:
+            HTTP_IN_FLIGHT.dec()
+            method, route = scope["method"], route_template(scope)
+            HTTP_REQUESTS.inc(method=method, route=route, status=str(status))
+            HTTP_LATENCY.observe(_time.perf_counter() - t0, method=method, route=route)
+            HTTP_RESPONSE_SIZE.observe(size, method=method, route=route)
+
+
+# ---------- collectors (스크레이프 시점에 읽음) ----------
+def _pool_samples(label: str, engine) -> dict:
+    from app.utils.db_pool import pool_status
+    return {**pool_status(engine), "pool": label}
+
+
+@REGISTRY.register_collector
+def _db_pool_metrics():
+    from app.database import async_engine, engine, replicas
+
+    pools = [_pool_samples("sync", engine), _pool_samples("async", async_engine)]
+    for r in (replicas.replicas if replicas is not None else ()):
+        pools += [_pool_samples(f"{r.name}_sync", r.engine), _pool_samples(f"{r.name}_async", r.async_engine)]
+
+    def fam(name, type_, help_, key, scale=1.0):
+        return (name, type_, help_, [
+            ({"pool": p["pool"]}, p[key] * scale if p.get(key) is not None else None) for p in pools
+        ])
+
+    yield fam("db_pool_size", "gauge", "Configured pool size", "size")
+    yield fam("db_pool_checked_out", "gauge", "Connections checked out", "checkedout")
+    yield fam("db_pool_checked_in", "gauge", "Idle connections in the pool", "checkedin")
+    yield fam("db_pool_overflow", "gauge", "Overflow connections (negative: unused capacity)", "overflow")
+    yield fam("db_pool_checkouts_total", "counter", "Pool checkouts", "checkouts")
+    yield fam("db_pool_timeouts_total", "counter", "Pool checkout timeouts", "timeouts")
+    yield fam("db_pool_connects_total", "counter", "New DB connections", "connects")
+    yield fam("db_pool_checkout_wait_p95_seconds", "gauge", "Checkout wait p95 (recent)", "wait_p95_ms", 0.001)
+    yield fam("db_pool_checkout_wait_max_seconds", "gauge", "Checkout wait max", "wait_max_ms", 0.001)
+    if replicas is not None:
+        yield ("db_replica_healthy", "gauge", "Replica health (1 = in rotation)",
+               [({"replica": r.name}, 1 if r.healthy else 0) for r in replicas.replicas])
+        yield ("db_replica_lag_seconds", "gauge", "Replica replication lag",
+               [({"replica": r.name}, r.lag) for r in replicas.replicas])
+        yield ("db_replica_routed_total", "counter", "Read sessions by routing decision",
+               [({"target": k}, v) for k, v in replicas.stats.items()])
+
+
+@REGISTRY.register_collector
+def _cache_metrics():
+    from app.services.response_cache import get_response_cache
+    from app.utils.auth.user_cache import user_cache
+
+    caches: List[Tuple[str, dict]] = [("user", user_cache.stats)]
+    rc = get_response_cache()
+    if rc is not None:
+        caches.append(("response", rc.stats))
+
+    def ratio(stats: dict) -> Optional[float]:
+        hits = stats.get("hit", 0) + stats.get("coalesced", 0)
+        total = hits + stats.get("miss", 0)
+        return hits / total if total else None
+
+    yield ("cache_requests_total", "counter", "Cache lookups by result", [
+        ({"cache": name, "result": result}, stats.get(result, 0))
+        for name, stats in caches for result in ("hit", "miss", "coalesced") if result in stats
+    ])
+    yield ("cache_invalidations_total", "counter", "Cache entries invalidated",
+           [({"cache": name}, stats.get("invalidated", 0)) for name, stats in caches])
+    yield ("cache_hit_ratio", "gauge", "Cache hit ratio since start (coalesced counts as hit)",
+           [({"cache": name}, ratio(stats)) for name, stats in caches])
+
+
+def render_metrics() -> str:
+    return REGISTRY.render()
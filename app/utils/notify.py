@@ -1,15 +1,61 @@
-# app/utils/notify.py
+import os
+import asyncio
+import random
+import weakref
 import httpx
-from typing import Optional
+from typing import Optional, List, Dict, Iterable
 
-EXPO_PUSH_URL = "https://exp.host/--/api/v2/push/send"
+from app.utils.metrics import PUSH_DEVICE_NOT_REGISTERED, PUSH_HTTP_RETRIES, PUSH_MESSAGES, PUSH_RECEIPTS
+
+# 로컬 fake 서버로 바꿔 끼울 수 있도록 env로 오버라이드 (예: http://127.0.0.1:8765)
+EXPO_BASE_URL = os.getenv("EXPO_BASE_URL", "https://exp.host").rstrip("/")
+EXPO_PUSH_URL = f"{EXPO_BASE_URL}/--/api/v2/push/send"
+EXPO_RECEIPTS_URL = f"{EXPO_BASE_URL}/--/api/v2/push/getReceipts"
+EXPO_ACCESS_TOKEN = os.getenv("EXPO_ACCESS_TOKEN")  # Enhanced security 사용 시에만
+
+EXPO_BATCH_SIZE = 100           # Expo: 요청 1회당 최대 100개 메시지
+EXPO_RECEIPT_BATCH_SIZE = 1000  # Expo: getReceipts 1회당 최대 1000개 id
+EXPO_MAX_IN_FLIGHT = int(os.getenv("EXPO_MAX_IN_FLIGHT", "6"))
+EXPO_MAX_RETRIES = 3
+EXPO_BACKOFF_BASE = 0.5         # 초, 시도마다 2배
+
+DEVICE_NOT_REGISTERED = "DeviceNotRegistered"
+
+# 이벤트 루프별 공유 클라이언트 (asyncio.run()마다 루프가 새로 생기므로 루프 단위로 캐시)
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+
+
+def _headers() -> dict:
+    h = {"Accept": "application/json", "Accept-Encoding": "gzip, deflate", "Content-Type": "application/json"}
+    if EXPO_ACCESS_TOKEN:
+        h["Authorization"] = f"Bearer {EXPO_ACCESS_TOKEN}"
+    return h
 
-async def send_expo_push(token: str, title: str, body: str, payload: Optional[dict] = None):
-    """Expo 푸시 토큰으로 알림 발송"""
-    if not token:
-        return {"error": "no push token"}
 
-    message = {
+def get_push_client() -> httpx.AsyncClient:
+    """현재 이벤트 루프에 묶인 pooled AsyncClient 반환 (없으면 생성)"""
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            headers=_headers(),
+            timeout=httpx.Timeout(10.0, connect=5.0),
+            limits=httpx.Limits(max_connections=EXPO_MAX_IN_FLIGHT * 2, max_keepalive_connections=EXPO_MAX_IN_FLIGHT),
+        )
+        _clients[loop] = client
+    return client
+
+
+async def close_push_client() -> None:
+    """현재 루프의 공유 클라이언트 정리 (asyncio.run 종료 직전 호출)"""
+    loop = asyncio.get_running_loop()
+    client = _clients.pop(loop, None)
+    if client is not None and not client.is_closed:
+        await client.aclose()
+
+
+def build_expo_message(token: str, title: str, body: str, payload: Optional[dict] = None) -> dict:
+    return {
         "to": token,
         "title": title,
         "body": body,
@@ -17,6 +63,130 @@ async def send_expo_push(token: str, title: str, body: str, payload: Optional[di
         "sound": "default",
     }
 
-    async with httpx.AsyncClient() as client:
-        resp = await client.post(EXPO_PUSH_URL, json=message)
-    return resp.json()
+
+def _retry_delay(attempt: int, resp: Optional[httpx.Response]) -> float:
+    """Retry-After 헤더가 있으면 따르고, 없으면 지수 backoff + jitter"""
+    if resp is not None:
+        ra = resp.headers.get("retry-after")
+        if ra:
+            try:
+                return min(float(ra), 30.0)
+            except ValueError:
+                pass
+    return EXPO_BACKOFF_BASE * (2 ** attempt) * (0.5 + random.random())
+
+
+async def _post_with_retry(
+    client: httpx.AsyncClient, url: str, json_body, *, max_retries: int = EXPO_MAX_RETRIES
+) -> httpx.Response | None:
+    """429/5xx/네트워크 오류는 backoff 후 재시도. 끝까지 실패하면 마지막 응답(또는 None) 반환"""
+    resp: Optional[httpx.Response] = None
+    for attempt in range(max_retries + 1):
+        try:
+            resp = await client.post(url, json=json_body)
+        except httpx.TransportError as e:
+            print(f"[expo] transport error (attempt {attempt + 1}): {e}")
+            resp = None
+        else:
+            if resp.status_code != 429 and resp.status_code < 500:
+                return resp
+        if attempt < max_retries:
+            PUSH_HTTP_RETRIES.inc(endpoint="send" if url == EXPO_PUSH_URL else "receipts")
+            await asyncio.sleep(_retry_delay(attempt, resp))
+    return resp
+
+
+def _chunks(items: list, size: int) -> Iterable[list]:
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+async def send_expo_push_batch(
+    messages: List[dict],
+    *,
+    client: Optional[httpx.AsyncClient] = None,
+    max_in_flight: int = EXPO_MAX_IN_FLIGHT,
+    max_retries: int = EXPO_MAX_RETRIES,
+) -> List[dict]:
+    """
+    메시지를 100개씩 묶어 전송 (동시 요청 수 max_in_flight로 제한).
+    반환: messages와 같은 순서의 push ticket 목록
+      - {"status": "ok", "id": "<ticket id>"}
+      - {"status": "error", "message": ..., "details": {"error": "DeviceNotRegistered"}}
+    """
+    if not messages:
+        return []
+    client = client or get_push_client()
+    sem = asyncio.Semaphore(max_in_flight)
+
+    async def _send_chunk(chunk: List[dict]) -> List[dict]:
+        async with sem:
+            resp = await _post_with_retry(client, EXPO_PUSH_URL, chunk, max_retries=max_retries)
+        if resp is None or resp.status_code >= 400:
+            reason = f"http {resp.status_code}" if resp is not None else "transport error"
+            return [{"status": "error", "message": reason} for _ in chunk]
+        try:
+            tickets = resp.json().get("data") or []
+        except ValueError:
+            tickets = []
+        if len(tickets) != len(chunk):
+            return [{"status": "error", "message": "malformed response"} for _ in chunk]
+        return tickets
+
+    results = await asyncio.gather(*(_send_chunk(c) for c in _chunks(messages, EXPO_BATCH_SIZE)))
+    tickets = [t for chunk_tickets in results for t in chunk_tickets]
+    _count_push_results(tickets, PUSH_MESSAGES)
+    return tickets
+
+
+async def fetch_expo_receipts(
+    ticket_ids: List[str],
+    *,
+    client: Optional[httpx.AsyncClient] = None,
+    max_in_flight: int = EXPO_MAX_IN_FLIGHT,
+) -> Dict[str, dict]:
+    """ticket id → receipt ({"status": "ok"} / {"status": "error", "details": {...}})"""
+    if not ticket_ids:
+        return {}
+    client = client or get_push_client()
+    sem = asyncio.Semaphore(max_in_flight)
+
+    async def _fetch(chunk: List[str]) -> Dict[str, dict]:
+        async with sem:
+            resp = await _post_with_retry(client, EXPO_RECEIPTS_URL, {"ids": chunk})
+        if resp is None or resp.status_code >= 400:
+            return {}
+        try:
+            return resp.json().get("data") or {}
+        except ValueError:
+            return {}
+
+    receipts: Dict[str, dict] = {}
+    for part in await asyncio.gather(*(_fetch(c) for c in _chunks(list(ticket_ids), EXPO_RECEIPT_BATCH_SIZE))):
+        receipts.update(part)
+    _count_push_results(receipts.values(), PUSH_RECEIPTS)
+    return receipts
+
+
+def is_device_not_registered(ticket_or_receipt: dict) -> bool:
+    return (
+        ticket_or_receipt.get("status") == "error"
+        and (ticket_or_receipt.get("details") or {}).get("error") == DEVICE_NOT_REGISTERED
+    )
+
+
+def _count_push_results(results: Iterable[dict], counter) -> None:
+    """ticket/receipt 상태별 카운트 → /metrics"""
+    for r in results:
+        counter.inc(status=r.get("status") or "unknown")
+        if is_device_not_registered(r):
+            PUSH_DEVICE_NOT_REGISTERED.inc()
+
+
+async def send_expo_push(token: str, title: str, body: str, payload: Optional[dict] = None):
+    """Expo 푸시 토큰으로 알림 발송 (단건, 공유 클라이언트 사용)"""
+    if not token:
+        return {"error": "no push token"}
+
+    tickets = await send_expo_push_batch([build_expo_message(token, title, body, payload)])
+    return {"data": tickets[0] if tickets else None}
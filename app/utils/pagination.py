@@ -1,8 +1,150 @@
-from typing import List
-
-def paginate(items: List, page: int, size: int):
-    start = (page - 1) * size
-    end = start + size
-    paginated = items[start:end]
-    total_pages = (len(items) + size - 1) // size
-    return paginated, total_pages
+# app/utils/pagination.py
+# 목록 API 공용 페이지네이션
+# - page 모드   : 기존 page/totalPages 유지 (count=false면 COUNT 생략)
+# - cursor 모드 : 마지막 정렬 키를 opaque cursor로 인코딩 → OFFSET/COUNT 없이 다음 페이지
+import base64
+import json
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import Any, Callable, List, NamedTuple, Optional, Sequence, Tuple
+
+from fastapi import HTTPException
+from sqlalchemy import and_, or_
+
+# (컬럼, 내림차순 여부) 목록. 마지막은 반드시 유일 키(id)여야 순서가 결정적이다
+# (keyset 컬럼은 NOT NULL 이어야 함)
+Order = Sequence[Tuple[Any, bool]]
+
+
+class Page(NamedTuple):
+    items: list
+    page: Optional[int]          # cursor 모드면 None
+    total: Optional[int]         # COUNT 생략 시 None
+    next_cursor: Optional[str]
+    has_next: bool
+
+
+def total_pages(total: Optional[int], size: int) -> Optional[int]:
+    return None if total is None else (total + size - 1) // size
+
+
+# ---------- cursor 인코딩 ----------
+def _enc_value(v):
+    if isinstance(v, datetime):
+        return {"dt": v.isoformat()}
+    if isinstance(v, date):
+        return {"d": v.isoformat()}
+    if isinstance(v, time):
+        return {"t": v.isoformat()}
+    if isinstance(v, Decimal):
+        return {"n": str(v)}
+    return v
+
+def _dec_value(v):
+    if isinstance(v, dict):
+        if "dt" in v:
+            return datetime.fromisoformat(v["dt"])
+        if "d" in v:
+            return date.fromisoformat(v["d"])
+        if "t" in v:
+            return time.fromisoformat(v["t"])
+        if "n" in v:
+            return Decimal(v["n"])
+    return v
+
+def encode_cursor(sort_key: str, *, keys: Optional[Sequence] = None, offset: Optional[int] = None) -> str:
+    data = {"s": sort_key}
+    if keys is not None:
+        data["k"] = [_enc_value(v) for v in keys]
+    else:
+        data["o"] = offset
+    raw = json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+def decode_cursor(cursor: str, sort_key: str) -> dict:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        data = json.loads(raw)
+        if data.get("s") != sort_key:
+            raise ValueError("sort mismatch")
+        if "k" in data:
+            data["k"] = [_dec_value(v) for v in data["k"]]
+        elif not isinstance(data.get("o"), int) or data["o"] < 0:
+            raise ValueError("bad offset")
+        return data
+    except (ValueError, TypeError, json.JSONDecodeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+# ---------- keyset 조건 ----------
+def keyset_after(order: Order, values: Sequence):
+    """
+    (c1, c2, ..., id) 가 values 보다 '뒤'인 행 조건 (정렬 방향 혼합 지원)
+      c1 > v1 OR (c1 = v1 AND c2 > v2) OR ...
+    """
+    if len(values) != len(order):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    clauses = []
+    for i, (col, desc) in enumerate(order):
+        eqs = [order[j][0] == values[j] for j in range(i)]
+        cmp = col < values[i] if desc else col > values[i]
+        clauses.append(and_(*eqs, cmp))
+    return or_(*clauses)
+
+
+def _row_keys(row, order: Order) -> tuple:
+    # 기본: ORM 엔티티 또는 (엔티티, ...) 튜플의 첫 요소에서 컬럼 속성명으로 값 추출
+    obj = row[0] if isinstance(row, tuple) or hasattr(row, "_fields") else row
+    return tuple(getattr(obj, col.key) for col, _ in order)
+
+
+def paginate_query(
+    query,
+    *,
+    order: Order,
+    size: int,
+    page: int = 1,
+    cursor: Optional[str] = None,
+    with_count: bool = True,
+    sort_key: str = "default",
+    keyset: bool = True,
+    count_query=None,
+    key: Optional[Callable[[Any], Sequence]] = None,
+) -> Page:
+    """
+    query에 정렬/페이지 조건을 적용해서 Page 반환.
+    - keyset=False (집계 정렬 등 keyset 불가) → cursor에 offset을 담는다
+    - count_query: COUNT 전용 쿼리 (joinedload 없는 가벼운 쿼리를 넘기면 좋음)
+    """
+    ordered = query.order_by(*[(c.desc() if d else c.asc()) for c, d in order])
+    offset = 0
+    total = None
+
+    if cursor:
+        data = decode_cursor(cursor, sort_key)
+        if "k" in data:
+            if not keyset:
+                raise HTTPException(status_code=400, detail="Invalid cursor")
+            ordered = ordered.filter(keyset_after(order, data["k"]))
+        else:
+            offset = data["o"]
+        page_no = None
+    else:
+        page_no = page
+        offset = (page - 1) * size
+        if with_count:
+            total = (count_query if count_query is not None else query.order_by(None)).count()
+
+    q = ordered.offset(offset) if offset else ordered
+    rows: List = q.limit(size + 1).all()
+    has_next = len(rows) > size
+    items = rows[:size]
+
+    next_cursor = None
+    if has_next and items:
+        if keyset:
+            next_cursor = encode_cursor(sort_key, keys=(key or (lambda r: _row_keys(r, order)))(items[-1]))
+        else:
+            next_cursor = encode_cursor(sort_key, offset=offset + size)
+
+    return Page(items=items, page=page_no, total=total, next_cursor=next_cursor, has_next=has_next)
@@ -0,0 +1,173 @@
+# app/utils/query_stats.py
+# 요청별 SQL 계측: 쿼리 수, DB 시간, 반복된 쿼리 모양(N+1), lazy load
+# - main.py 미들웨어가 요청마다 track_queries() → 응답 헤더 Server-Timing + 구조화 로그(JSON 한 줄)
+# - 엔진 이벤트는 Engine 클래스 전체에 걸려 있어 동기/비동기/replica 엔진 모두 집계
+#   (동기 엔드포인트는 스레드풀에서 돌지만 contextvar 가 같은 RequestQueries 객체를 가리킴)
+# - 엄격 모드(SQL_STRICT=1, 테스트/벤치용): 쿼리 예산 초과 또는 relationship lazy load 가 나오면 바로 예외 → 500
+#   엔드포인트별 예산은 @query_budget(n), 없으면 SQL_QUERY_BUDGET
+# 환경 변수
+#   SQL_STRICT=0|1, SQL_QUERY_BUDGET=30, SQL_N_PLUS_ONE_THRESHOLD=5, SQL_LOG=problems|all|off
+import json
+import os
+import re
+import time as _time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+SQL_STRICT = os.getenv("SQL_STRICT", "0").lower() in {"1", "true", "yes"}
+SQL_QUERY_BUDGET = int(os.getenv("SQL_QUERY_BUDGET", "30"))
+SQL_N_PLUS_ONE_THRESHOLD = int(os.getenv("SQL_N_PLUS_ONE_THRESHOLD", "5"))
+SQL_LOG = os.getenv("SQL_LOG", "problems")     # problems: 예산 초과/N+1/lazy load 있을 때만, all: 모든 요청, off
+
+_IN_LIST = re.compile(r"\((?:\s*(?:\?|%s|%\(\w+\)s|:\w+)\s*,)+\s*(?:\?|%s|%\(\w+\)s|:\w+)\s*\)")
+_SPACES = re.compile(r"\s+")
+
+
+class QueryBudgetExceeded(RuntimeError):
+    pass
+
+
+class LazyLoadError(RuntimeError):
+    pass
+
+
+def query_budget(n: int):
+    """엔드포인트별 쿼리 예산 (엄격 모드에서 초과 시 실패, 평소엔 로그만)"""
+    def deco(fn):
+        fn.__query_budget__ = n
+        return fn
+    return deco
+
+
+def statement_shape(statement: str) -> str:
+    """파라미터 개수만 다른 IN (...) 을 하나로 묶고 공백 정리 → 같은 모양 쿼리 판별용"""
+    return _SPACES.sub(" ", _IN_LIST.sub("(?)", statement)).strip()[:300]
+
+
+class RequestQueries:
+    def __init__(self, scope: Optional[dict] = None, strict: bool = SQL_STRICT):
+        self.scope = scope
+        self.strict = strict
+        self.count = 0
+        self.db_ms = 0.0
+        self.shapes: Counter = Counter()
+        self.lazy_loads: List[str] = []
+        self.violations: List[str] = []
+
+    @property
+    def budget(self) -> int:
+        endpoint = (self.scope or {}).get("endpoint")
+        return getattr(endpoint, "__query_budget__", SQL_QUERY_BUDGET)
+
+    def before_query(self, statement: str) -> None:
+        self.count += 1
+        self.shapes[statement_shape(statement)] += 1
+        if self.count == self.budget + 1:
+            msg = f"query budget exceeded: > {self.budget}"
+            self.violations.append(msg)
+            if self.strict:
+                raise QueryBudgetExceeded(msg)
+
+    def lazy_load(self, what: str) -> None:
+        msg = f"lazy load: {what}"
+        if what not in self.lazy_loads:
+            self.violations.append(msg)
+        self.lazy_loads.append(what)
+        if self.strict:
+            raise LazyLoadError(f"{msg} (eager load 필요: joinedload/selectinload/contains_eager)")
+
+    def n_plus_one(self) -> List[dict]:
+        return [
+            {"count": n, "sql": shape}
+            for shape, n in self.shapes.most_common()
+            if n >= SQL_N_PLUS_ONE_THRESHOLD
+        ]
+
+    def server_timing(self, total_ms: float) -> str:
+        return (
+            f'db;dur={self.db_ms:.1f};desc="{self.count} queries", '
+            f"app;dur={max(total_ms - self.db_ms, 0.0):.1f}, total;dur={total_ms:.1f}"
+        )
+
+    def record(self, method: str, route: str, status: int, total_ms: float) -> dict:
+        return {
+            "severity": "WARNING" if self.violations or self.n_plus_one() else "INFO",
+            "message": f"sql {method} {route} {self.count}q {self.db_ms:.1f}ms",
+            "method": method,
+            "route": route,
+            "status": status,
+            "queries": self.count,
+            "budget": self.budget,
+            "db_ms": round(self.db_ms, 1),
+            "total_ms": round(total_ms, 1),
+            "n_plus_one": self.n_plus_one(),
+            "lazy_loads": dict(Counter(self.lazy_loads)),
+            "violations": self.violations,
+        }
+
+    def log(self, method: str, route: str, status: int, total_ms: float) -> None:
+        if SQL_LOG == "off":
+            return
+        rec = self.record(method, route, status, total_ms)
+        if SQL_LOG == "all" or rec["severity"] != "INFO":
+            print(json.dumps(rec, ensure_ascii=False, default=str))
+
+
+_current: ContextVar[Optional[RequestQueries]] = ContextVar("request_queries", default=None)
+
+
+def current_queries() -> Optional[RequestQueries]:
+    return _current.get()
+
+
+@contextmanager
+def track_queries(scope: Optional[dict] = None, strict: Optional[bool] = None):
+    """with 블록 안(같은 context)의 쿼리 집계. 요청 밖(스크립트/벤치)에서도 사용 가능"""
+    stats = RequestQueries(scope, SQL_STRICT if strict is None else strict)
+    token = _current.set(stats)
+    try:
+        yield stats
+    finally:
+        _current.reset(token)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current.get()
+    if stats is None:
+        return
+    stats.before_query(statement)
+    conn.info.setdefault("query_stats_start", []).append(_time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current.get()
+    starts = conn.info.get("query_stats_start")
+    if stats is None or not starts:
+        return
+    stats.db_ms += (_time.perf_counter() - starts.pop()) * 1000
+
+
+@event.listens_for(Engine, "handle_error")
+def _discard_start(context):
+    conn = context.connection
+    if conn is not None and conn.info.get("query_stats_start"):
+        conn.info["query_stats_start"].pop()
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _detect_lazy_load(orm_execute_state):
+    stats = _current.get()
+    if stats is None or not orm_execute_state.is_select or orm_execute_state.lazy_loaded_from is None:
+        return
+    path = orm_execute_state.loader_strategy_path
+    prop = getattr(path, "prop", None)
+    what = f"{prop.parent.class_.__name__}.{prop.key}" if prop is not None else str(path)
+    stats.lazy_load(what)
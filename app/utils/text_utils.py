@@ -12,3 +12,30 @@ def clean_title(title: str) -> str:
     if re.fullmatch(r'(.)\1+', normalized):
         return normalized[:2]
     return normalized
+
+
+# ---------- 한글 초성 ----------
+HANGUL_BASE, HANGUL_END = 0xAC00, 0xD7A3
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_CHOSEONG_SET = set(CHOSEONG)
+
+
+def is_choseong(ch: str) -> bool:
+    return ch in _CHOSEONG_SET
+
+
+def choseong_of(ch: str) -> str:
+    """완성형 음절이면 초성, 아니면 그대로 ('인' → 'ㅇ', 'a' → 'a')"""
+    code = ord(ch)
+    if HANGUL_BASE <= code <= HANGUL_END:
+        return CHOSEONG[(code - HANGUL_BASE) // 588]
+    return ch
+
+
+def to_choseong(text: str) -> str:
+    return "".join(choseong_of(c) for c in text)
+
+
+def normalize_search_key(text: str) -> str:
+    """자동완성/검색 키: 소문자 + 공백 제거"""
+    return "".join((text or "").lower().split())
@@ -0,0 +1,57 @@
+# app/utils/time_window.py
+# 공연 시작 시각(Performance.start_at) 기준 공통 조회 조건
+# - start_at은 KST 벽시계(naive) 값 → 비교 기준 시각도 항상 KST naive로 맞춘다
+# - 전부 start_at 단일 컬럼 범위 조건이라 ix_performance_start_at / ix_performance_venue_start_at 를 탄다
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Optional, Tuple
+
+from app.models.performance import Performance
+
+KST = timezone(timedelta(hours=9))
+
+
+def now_kst() -> datetime:
+    """현재 KST 시각 (naive, 초 단위)"""
+    return datetime.now(KST).replace(tzinfo=None, microsecond=0)
+
+
+def to_kst_naive(dt: Optional[datetime]) -> datetime:
+    """aware → KST naive, naive는 KST로 간주, None이면 현재 시각"""
+    if dt is None:
+        return now_kst()
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(KST).replace(tzinfo=None)
+    return dt
+
+
+def day_bounds(d: date) -> Tuple[datetime, datetime]:
+    """[d 00:00, d+1 00:00)"""
+    start = datetime.combine(d, time(0, 0))
+    return start, start + timedelta(days=1)
+
+
+def upcoming_filter(now: Optional[datetime] = None):
+    """아직 시작 전인 공연 (오늘 남은 공연 포함)"""
+    return Performance.start_at >= to_kst_naive(now)
+
+
+def past_filter(now: Optional[datetime] = None):
+    """이미 시작한 공연"""
+    return Performance.start_at < to_kst_naive(now)
+
+
+def date_range_filter(start: date, end: date):
+    """start ~ end 날짜(양끝 포함) 공연. filter(*date_range_filter(...)) 로 사용"""
+    return Performance.start_at >= day_bounds(start)[0], Performance.start_at < day_bounds(end)[1]
+
+
+def day_filter(d: Optional[date] = None):
+    """해당 날짜 공연 전체 (기본: KST 오늘)"""
+    d = d or now_kst().date()
+    return date_range_filter(d, d)
+
+
+def today_remaining_filter(now: Optional[datetime] = None):
+    """오늘 공연 중 아직 시작 전인 것 (now ≤ start_at < 내일 00:00)"""
+    now = to_kst_naive(now)
+    return Performance.start_at >= now, Performance.start_at < day_bounds(now.date())[1]
@@ -0,0 +1,31 @@
+# app/worker.py
+# 작업 큐 워커
+# 실행: python -m app.worker            (계속 polling)
+#       python -m app.worker --once     (쌓인 작업만 처리하고 종료, cron/Cloud Run Job 용)
+
+import argparse
+
+from app.database import SessionLocal
+from app.services.jobs import run_worker
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--once", action="store_true", help="큐가 비면 종료")
+    ap.add_argument("--batch", type=int, default=10, help="한 번에 claim할 작업 수")
+    ap.add_argument("--interval", type=float, default=1.0, help="큐가 비었을 때 polling 간격(초)")
+    ap.add_argument("--kind", action="append", help="처리할 kind (여러 번 지정 가능, 기본: 전체)")
+    args = ap.parse_args()
+
+    stats = run_worker(
+        SessionLocal,
+        batch_size=args.batch,
+        poll_interval=args.interval,
+        once=args.once,
+        kinds=args.kind,
+    )
+    print(f"[worker] finished: {stats}")
+
+
+if __name__ == "__main__":
+    main()